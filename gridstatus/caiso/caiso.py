@@ -1,8 +1,16 @@
-import copy
+import contextlib
+import gzip
+import hashlib
 import io
-import re
+import itertools
+import json
+import multiprocessing
+import os
+import threading
 import time
 import warnings
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import Literal
 from xml.etree import ElementTree
 from zipfile import ZipFile
@@ -25,11 +33,15 @@ from gridstatus.base import (
 from gridstatus.caiso import caiso_utils, daily_energy_storage
 from gridstatus.caiso.caiso_constants import (
     CURRENT_BASE,
+    CURTAILMENT_TABLES_CACHE_VERSION,
+    DEFAULT_OASIS_MAX_WORKERS,
     HISTORY_BASE,
     OASIS_DATASET_CONFIG,
+    OASIS_GMT_FORMAT,
+    OASIS_PARSE_MAX_WORKERS,
     get_dataframe_config_for_renewables_report,
 )
-from gridstatus.decorators import support_date_range
+from gridstatus.decorators import date_range_maker, support_date_range
 from gridstatus.gs_logging import logger
 from gridstatus.lmp_config import lmp_config
 
@@ -39,6 +51,21 @@ from gridstatus.lmp_config import lmp_config
 PRICE_CORRECTION_NO_RECORDS_REASON = "No records found for report."
 
 
+_oasis_rate_limiter = None
+_oasis_rate_limiter_lock = threading.Lock()
+
+
+def _get_oasis_rate_limiter() -> "utils.RateLimiter":
+    """OASIS limits requests per client, so every CAISO instance and thread
+    shares one rate budget"""
+    global _oasis_rate_limiter
+    with _oasis_rate_limiter_lock:
+        # created lazily because gridstatus.utils imports this module
+        if _oasis_rate_limiter is None:
+            _oasis_rate_limiter = utils.RateLimiter(min_interval_seconds=0)
+        return _oasis_rate_limiter
+
+
 def _determine_lmp_frequency(args: dict) -> str:
     """if querying all must use 1d frequency"""
     locations = args.get("locations", "")
@@ -68,10 +95,155 @@ def _collapse_group_to_array(
     return df
 
 
+# OASIS LMP_TYPE values and the columns they become
+LMP_TYPE_COLUMNS = {
+    "LMP": "LMP",
+    "MCE": "Energy",
+    "MCC": "Congestion",
+    "MCL": "Loss",
+    "MGHG": "GHG",
+}
+
+
+def _pivot_lmp_types(df: pd.DataFrame, price_col: str) -> pd.DataFrame:
+    """Reshapes OASIS LMP rows, one per interval, node and LMP_TYPE, into one row
+    per interval and node with a column per LMP type.
+
+    Equivalent to pivot_table(aggfunc="first") on (Time, Interval Start,
+    Interval End, NODE), but LMP_TYPE only has a handful of known values, so
+    each price is written straight into its cell of a 2D array instead of
+    being aggregated group by group.
+    """
+    lmp_types = list(LMP_TYPE_COLUMNS)
+    type_codes, unique_types = pd.factorize(df["LMP_TYPE"])
+    type_codes = np.array(
+        [lmp_types.index(t) if t in lmp_types else -1 for t in unique_types] + [-1],
+    ).take(type_codes)
+
+    prices = df[price_col].to_numpy(dtype=float)
+    keep = np.flatnonzero((type_codes >= 0) & ~np.isnan(prices))
+    type_codes = type_codes[keep]
+    prices = prices[keep]
+
+    start_codes, starts = pd.factorize(df["Interval Start"], sort=True)
+    node_codes, nodes = pd.factorize(df["NODE"], sort=True)
+    # sorted like pivot_table: by interval, then node
+    keys = start_codes[keep].astype(np.int64) * len(nodes) + node_codes[keep]
+
+    key_space = len(starts) * len(nodes)
+    if key_space <= len(df):
+        # OASIS returns every node for every interval, so the (interval, node)
+        # pairs are dense and can be numbered without sorting
+        present = np.zeros(key_space, dtype=bool)
+        present[keys] = True
+        row_numbers = np.cumsum(present) - 1
+        row_codes = row_numbers[keys]
+        keys = np.flatnonzero(present)
+    else:
+        keys, row_codes = np.unique(keys, return_inverse=True)
+
+    cells = row_codes * len(lmp_types) + type_codes
+    values = np.full((len(keys), len(lmp_types)), np.nan)
+    if np.bincount(cells, minlength=values.size).max(initial=0) > 1:
+        # the first price of each cell is kept when OASIS repeats a row
+        cells, first_prices = np.unique(cells, return_index=True)
+        prices = prices[first_prices]
+    values.flat[cells] = prices
+
+    key_rows = np.empty(len(keys), dtype=np.int64)
+    key_rows[row_codes] = keep
+
+    interval_start = starts.take(keys // len(nodes))
+    result = pd.DataFrame(
+        {
+            "Time": interval_start,
+            "Interval Start": interval_start,
+            "Interval End": df["Interval End"].array.take(key_rows),
+            "Location": nodes.take(keys % len(nodes)),
+        },
+    )
+    for i, column in enumerate(LMP_TYPE_COLUMNS.values()):
+        result[column] = values[:, i]
+
+    return result
+
+
+def _lmp_location_types(
+    locations: pd.Series,
+    trading_hub_locations: list[str],
+) -> np.ndarray:
+    """Location Type string of each LMP location, computed once per unique
+    location"""
+    codes, unique_locations = pd.factorize(locations, use_na_sentinel=False)
+    unique_locations = pd.Series(unique_locations, dtype=object)
+
+    unique_types = np.select(
+        [
+            unique_locations.str.startswith("DLAP_", na=False),
+            unique_locations.isin(trading_hub_locations),
+            unique_locations.str.endswith("-APND", na=False),
+        ],
+        ["DLAP", "Trading Hub", "AP Node"],
+        default="Node",
+    ).astype(object)
+
+    return unique_types.take(codes)
+
+
+def _extract_pdf_tables(
+    pdf_bytes: bytes,
+    chunk: int = 0,
+    n_chunks: int = 1,
+) -> list[list[list[str | None]]]:
+    """Tables of the chunk-th of n_chunks contiguous runs of pages of a PDF (all
+    pages by default), in page order.
+
+    Module-level so that it can run in worker processes. Each finds the pages of
+    its chunk itself, so the PDF is only opened where it is extracted."""
+    tables = []
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf_doc:
+        n_pages = len(pdf_doc.pages)
+        first_page = chunk * n_pages // n_chunks
+        end_page = (chunk + 1) * n_pages // n_chunks
+        for page in pdf_doc.pages[first_page:end_page]:
+            tables.extend(page.extract_tables())
+    return tables
+
+
+def _is_valid_curtailment_tables_cache(cache) -> bool:
+    if not isinstance(cache, dict) or cache.get("version") != (
+        CURTAILMENT_TABLES_CACHE_VERSION
+    ):
+        return False
+
+    tables = cache.get("tables")
+    return isinstance(tables, list) and all(
+        isinstance(table, list)
+        and all(
+            isinstance(row, list)
+            and all(cell is None or isinstance(cell, str) for cell in row)
+            for row in table
+        )
+        for table in tables
+    )
+
+
 def _determine_oasis_frequency(args: dict) -> str:
-    dataset_config = copy.deepcopy(OASIS_DATASET_CONFIG[args["dataset"]])
+    return _oasis_max_query_frequency(args["dataset"])
+
+
+def _parse_oasis_gmt(values: pd.Series) -> pd.Series:
+    # OASIS writes GMT times like 2024-01-01T08:00:00-00:00. Parsing with the
+    # format is much faster than inferring it, and other formats still parse
+    try:
+        return pd.to_datetime(values, format=OASIS_GMT_FORMAT, utc=True)
+    except (TypeError, ValueError):
+        return pd.to_datetime(values, utc=True)
+
+
+def _oasis_max_query_frequency(dataset: str) -> str:
     # get meta if it exists. and then max_query_frequency if it exists
-    meta = dataset_config.get("meta", {})
+    meta = OASIS_DATASET_CONFIG[dataset].get("meta", {})
     max_query_frequency = meta.get("max_query_frequency", None)
     if max_query_frequency is not None:
         return max_query_frequency
@@ -79,6 +251,51 @@ def _determine_oasis_frequency(args: dict) -> str:
     return "31D"
 
 
+def _oasis_query_config(dataset: str, params: dict | None = None) -> dict:
+    """Returns the flat OASIS query of a dataset with params applied on top of the
+    dataset's defaults.
+
+    Raises:
+        ValueError: if a parameter or parameter value is not supported for dataset
+    """
+    dataset_config = OASIS_DATASET_CONFIG[dataset]
+    logger.debug(f"Dataset config: {dataset_config}")
+
+    if params is None:
+        params = {}
+
+    for p in params:
+        if p not in dataset_config["params"]:
+            raise ValueError(
+                f"Parameter {p} not supported for dataset {dataset}",
+            )
+
+        # if it's a list, make sure param value is in list
+        if (
+            isinstance(dataset_config["params"][p], list)
+            and params[p] not in dataset_config["params"][p]
+        ):
+            raise ValueError(
+                f"Parameter {p} not supported for dataset {dataset}",
+            )
+
+    # if any dataset_config values are list,
+    # take first as default
+    dataset_params = {
+        k: params[k] if k in params else v[0] if isinstance(v, list) else v
+        for k, v in dataset_config["params"].items()
+    }
+
+    # combine kv from query and params
+    config_flat = {
+        **dataset_config["query"],
+        **dataset_params,
+    }
+
+    # filter out null values
+    return {k: v for k, v in config_flat.items() if v is not None}
+
+
 def _get_historical(
     file: str,
     date: str | pd.Timestamp,
@@ -96,37 +313,18 @@ def _get_historical(
     Returns:
         pd.DataFrame: A pandas dataframe of the data
     """
-    # NOTE: The cache buster is necessary because CAISO will serve cached data from cloudfront on the same url if the url has not changed.
-    cache_buster = int(pd.Timestamp.now(tz=CAISO.default_timezone).timestamp())
-    if utils.is_today(date, CAISO.default_timezone):
-        url: str = f"{CURRENT_BASE}/{file}.csv?_={cache_buster}"
-        latest = True
-    else:
-        date_str: str = date.strftime("%Y%m%d")
-        url: str = f"{HISTORY_BASE}/{date_str}/{file}.csv?_={cache_buster}"
-        latest = False
+    url, latest = _historical_url(file, date)
     logger.info(f"Fetching URL: {url}")
     df = pd.read_csv(url)
 
-    # sometimes there are extra rows at the end, so this lets us ignore them
-    df = df.dropna(subset=["Time"])
-
-    # drop every column after Time where values
-    # are all null. this happens during spring DST
-    # change and caiso keeps the non-existent hour
-    # but has nulls for all other columns
-    df = df.dropna(subset=df.columns[1:], how="all")
+    df = _drop_empty_historical_rows(df)
 
     # for the latest data, we want to check if the data is actually from the previous day and update the date accordingly
     if latest:
-        latest_file_time = caiso_utils.check_latest_value_time(df, column)
-        current_caiso_time = pd.Timestamp.now(tz=CAISO.default_timezone)
-
-        if latest_file_time > current_caiso_time:
-            date = date - pd.Timedelta(days=1)
+        date = _current_file_date(df, column, date)
 
-    df["Time"] = df["Time"].apply(
-        caiso_utils.make_timestamp,
+    df["Time"] = caiso_utils.make_timestamps(
+        df["Time"],
         today=date,
         timezone=CAISO.default_timezone,
     )
@@ -136,6 +334,53 @@ def _get_historical(
     if df.iloc[-1]["Time"].hour == 0:
         df = df.iloc[:-1]
 
+    return _insert_historical_intervals(df)
+
+
+def _historical_url(file: str, date: pd.Timestamp) -> tuple[str, bool]:
+    """Returns the URL of a day's CURRENT_BASE or HISTORY_BASE file, and whether it
+    is the current day's file"""
+    # NOTE: The cache buster is necessary because CAISO will serve cached data from cloudfront on the same url if the url has not changed.
+    cache_buster = int(pd.Timestamp.now(tz=CAISO.default_timezone).timestamp())
+    if utils.is_today(date, CAISO.default_timezone):
+        return f"{CURRENT_BASE}/{file}.csv?_={cache_buster}", True
+
+    date_str: str = date.strftime("%Y%m%d")
+    return f"{HISTORY_BASE}/{date_str}/{file}.csv?_={cache_buster}", False
+
+
+def _hash_lines(lines: list[str]) -> str:
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+def _drop_empty_historical_rows(df: pd.DataFrame) -> pd.DataFrame:
+    # sometimes there are extra rows at the end, so this lets us ignore them
+    df = df.dropna(subset=["Time"])
+
+    # drop every column after Time where values
+    # are all null. this happens during spring DST
+    # change and caiso keeps the non-existent hour
+    # but has nulls for all other columns
+    return df.dropna(subset=df.columns[1:], how="all")
+
+
+def _current_file_date(
+    df: pd.DataFrame,
+    column: str,
+    date: pd.Timestamp,
+) -> pd.Timestamp:
+    """The day of the current day's file, which is the previous day when CAISO
+    has not started publishing today's data yet"""
+    latest_file_time = caiso_utils.check_latest_value_time(df, column)
+    current_caiso_time = pd.Timestamp.now(tz=CAISO.default_timezone)
+
+    if latest_file_time > current_caiso_time:
+        date = date - pd.Timedelta(days=1)
+
+    return date
+
+
+def _insert_historical_intervals(df: pd.DataFrame) -> pd.DataFrame:
     # insert interval start/end columns
     df.insert(1, "Interval Start", df["Time"])
 
@@ -185,6 +430,49 @@ class CAISO(ISOBase):
         "TH_ZP26_GEN-APND",
     ]
 
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_OASIS_MAX_WORKERS,
+        curtailment_cache_dir: str | None = None,
+        curtailment_pdf_workers: int = 1,
+        validate_locations: bool = True,
+    ) -> None:
+        """
+        Arguments:
+            max_workers (int, optional): number of OASIS queries of a date range
+                to fetch at the same time. The starts of OASIS requests are
+                still spaced by the sleep argument of each method.
+            curtailment_cache_dir (str, optional): directory where the tables
+                extracted from legacy curtailment PDFs are cached, by PDF content.
+                For days already in the cache, get_curtailment_legacy only asks
+                CAISO whether the PDF changed, and extracts it again only if its
+                content did.
+            curtailment_pdf_workers (int, optional): number of processes the
+                pages of a legacy curtailment PDF are extracted with. The
+                processes are spawned once per get_curtailment_legacy call, are
+                shared by the PDFs of all its dates, and are shut down when it
+                returns. Defaults to 1, which extracts in this process.
+            validate_locations (bool, optional): if True, LMP methods check the
+                locations they are given against the pnode map before querying
+                OASIS, and raise for unknown locations. The pnode map is
+                downloaded at most once a day. Defaults to True.
+        """
+        super().__init__()
+        self.max_workers = max_workers
+        self.curtailment_cache_dir = curtailment_cache_dir
+        self.curtailment_pdf_workers = max(1, curtailment_pdf_workers)
+
+        self.validate_locations = validate_locations
+        # (day, pnode map, location lookup) of the last pnode map downloaded
+        self._pnodes: tuple[pd.Timestamp, pd.DataFrame, pd.DataFrame] | None = None
+        self._pnodes_lock = threading.Lock()
+
+        # every storage dataset of a day comes from the same report, so reports
+        # are downloaded once and shared by the get_storage_* methods
+        self._storage_reports = daily_energy_storage.DailyEnergyStorageReportCache(
+            tz=self.default_timezone,
+        )
+
     def _current_day(self):
         # get current date from stats api
         return self.get_status(date="latest").time.date()
@@ -251,7 +539,10 @@ class CAISO(ISOBase):
 
             print("\n")
 
-    @support_date_range(frequency=_determine_oasis_frequency)
+    @support_date_range(
+        frequency=_determine_oasis_frequency,
+        max_workers=lambda args_dict: args_dict["self"].max_workers,
+    )
     def get_oasis_dataset(
         self,
         dataset: str,
@@ -261,6 +552,7 @@ class CAISO(ISOBase):
         raw_data: bool = True,
         sleep: int = 5,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """Return data from OASIS for a given dataset
 
@@ -273,9 +565,11 @@ class CAISO(ISOBase):
             params (dict): dictionary of parameters to pass to dataset.
                 See CAISO.list_oasis_datasets for supported parameters
             raw_data (bool, optional): return raw data from OASIS. Defaults to True.
-            sleep (int, optional): number of seconds to sleep between
-                requests. Defaults to 5.
+            sleep (int, optional): minimum number of seconds between the starts
+                of OASIS requests. Defaults to 5.
             verbose (bool, optional): print out url being fetched. Defaults to False.
+            columns (list, optional): only read these columns of the OASIS files.
+                Columns a file does not have are ignored. Defaults to all columns.
 
         Raises:
             ValueError: if parameter is not supported for dataset
@@ -285,44 +579,7 @@ class CAISO(ISOBase):
             pd.DataFrame: A DataFrame of data from OASIS
         """
 
-        # deepcopy to avoid modifying original
-        dataset_config = copy.deepcopy(OASIS_DATASET_CONFIG[dataset])
-        logger.debug(f"Dataset config: {dataset_config}")
-
-        if params is None:
-            params = {}
-
-        for p in params:
-            if p not in dataset_config["params"]:
-                raise ValueError(
-                    f"Parameter {p} not supported for dataset {dataset}",
-                )
-
-            # if it's a list, make sure param value is in list
-            if (
-                isinstance(dataset_config["params"][p], list)
-                and params[p] not in dataset_config["params"][p]
-            ):
-                raise ValueError(
-                    f"Parameter {p} not supported for dataset {dataset}",
-                )
-
-            dataset_config["params"][p] = params[p]
-
-        # if any dataset_config values are list,
-        # take first as default
-        for k, v in dataset_config["params"].items():
-            if isinstance(v, list):
-                dataset_config["params"][k] = v[0]
-
-        # combine kv from query and params
-        config_flat = {
-            **dataset_config["query"],
-            **dataset_config["params"],
-        }
-
-        # filter out null values
-        config_flat = {k: v for k, v in config_flat.items() if v is not None}
+        config_flat = _oasis_query_config(dataset, params)
 
         df = self._get_oasis(
             config=config_flat,
@@ -331,6 +588,7 @@ class CAISO(ISOBase):
             raw_data=raw_data,
             verbose=verbose,
             sleep=sleep,
+            columns=columns,
         )
 
         if df is None:
@@ -342,6 +600,110 @@ class CAISO(ISOBase):
 
         return df
 
+    def get_oasis_datasets(
+        self,
+        queries: list[tuple[str, dict | None]],
+        date: str | pd.Timestamp,
+        end: str | pd.Timestamp | None = None,
+        raw_data: bool = True,
+        sleep: int = 5,
+        verbose: bool = False,
+    ) -> dict[str, pd.DataFrame]:
+        """Return data from OASIS for several datasets over the same dates
+
+        Every request of every dataset is planned up front, splitting the dates by
+        each dataset's max query frequency, and the requests are fetched
+        max_workers at a time. Like get_oasis_dataset, the starts of all OASIS
+        requests are spaced by sleep, so the total time is bounded by the rate
+        limit rather than by one wait per dataset.
+
+        Args:
+            queries (list[tuple[str, dict | None]]): (dataset, params) pairs. See
+                CAISO.list_oasis_datasets for supported datasets and parameters.
+                Each dataset can be requested once.
+            date (str, pd.Timestamp): date to return data
+            end (str, pd.Timestamp, optional): last date of range to return data.
+                If None, returns only date. Defaults to None.
+            raw_data (bool, optional): return raw data from OASIS. Defaults to True.
+            sleep (int, optional): minimum number of seconds between the starts
+                of OASIS requests. Defaults to 5.
+            verbose (bool, optional): print out url being fetched. Defaults to False.
+
+        Raises:
+            ValueError: if a dataset is requested more than once
+            ValueError: if parameter is not supported for dataset
+            ValueError: if parameter value is not supported for dataset
+
+        Returns:
+            dict[str, pd.DataFrame]: a DataFrame of data from OASIS per dataset
+        """
+        datasets = [dataset for dataset, _ in queries]
+        duplicates = sorted({d for d in datasets if datasets.count(d) > 1})
+        if duplicates:
+            raise ValueError(f"Datasets requested more than once: {duplicates}")
+
+        configs = {
+            dataset: _oasis_query_config(dataset, params) for dataset, params in queries
+        }
+
+        date = utils._handle_date(date, self.default_timezone)
+        end = (
+            utils._handle_date(end, self.default_timezone)
+            if end
+            else date + pd.DateOffset(1)
+        )
+
+        plan = []
+        for dataset in configs:
+            dates = date_range_maker(
+                date,
+                end,
+                freq=_oasis_max_query_frequency(dataset),
+            )
+            dates = [date] + dates + [end]
+            plan.extend(
+                (dataset, window_start, window_end)
+                for window_start, window_end in itertools.pairwise(dates)
+            )
+
+        logger.info(f"Fetching {len(plan)} OASIS requests for {len(configs)} datasets")
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = [
+                executor.submit(
+                    self._get_oasis,
+                    config=configs[dataset],
+                    start=window_start,
+                    end=window_end,
+                    raw_data=raw_data,
+                    verbose=verbose,
+                    sleep=sleep,
+                )
+                for dataset, window_start, window_end in plan
+            ]
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    # don't start requests that haven't started yet
+                    for pending in futures:
+                        pending.cancel()
+                    raise future.exception()
+
+        frames: dict[str, list[pd.DataFrame]] = {dataset: [] for dataset in configs}
+        for (dataset, _, _), future in zip(plan, futures):
+            df = future.result()
+            if df is not None:
+                frames[dataset].append(df)
+
+        results = {}
+        for dataset, dfs in frames.items():
+            if not dfs:
+                logger.warning(f"No data for {dataset} from {date} to {end}")
+                results[dataset] = pd.DataFrame()
+            else:
+                results[dataset] = pd.concat(dfs).reset_index(drop=True)
+
+        return results
+
     def _get_oasis(
         self,
         config: dict,
@@ -351,9 +713,11 @@ class CAISO(ISOBase):
         verbose: bool = False,
         sleep: int = 5,
         max_retries: int = 3,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame | None:
         start, end = _caiso_handle_start_end(start, end)
-        config = copy.deepcopy(config)
+        # configs are flat, so a shallow copy keeps the caller's unchanged
+        config = dict(config)
         config["startdatetime"] = start
         config["enddatetime"] = end
 
@@ -365,8 +729,14 @@ class CAISO(ISOBase):
 
         logger.info(f"Fetching URL: {url}")
 
+        rate_limiter = _get_oasis_rate_limiter()
+        backoff = sleep
+
         retry_num = 0
         while retry_num < max_retries:
+            # concurrent queries wait their turn instead of sleeping after each
+            # request, so downloads overlap while staying within the budget
+            rate_limiter.wait(sleep)
             r = requests.get(url, verify=True)
 
             if r.status_code == 200:
@@ -377,8 +747,12 @@ class CAISO(ISOBase):
                 f"Failed to get data from CAISO. Error: {r.status_code}. Retrying...{retry_num} / {max_retries}",
             )
 
-            time.sleep(sleep)
-            sleep *= retry_num
+            if r.status_code == 429:
+                # every thread backs off, not only the one that was limited
+                rate_limiter.penalize(backoff)
+            else:
+                time.sleep(backoff)
+            backoff *= 2
 
         if r.status_code == 429:
             logger.warning(f"CAISO rate limit exceeded. Tried {retry_num} times.")
@@ -390,29 +764,38 @@ class CAISO(ISOBase):
             or ".xml.zip;" in r.headers["Content-Disposition"]
             or b".xml" in r.content
         ):
-            # avoid rate limiting
-            time.sleep(sleep)
             return None
 
         z = ZipFile(io.BytesIO(r.content))
-
-        # parse and concat all files
-        dfs = []
-        logger.debug(f"Found {len(z.namelist())} files: {z.namelist()}")
-        for f in z.namelist():
-            logger.debug(f"Parsing file: {f}")
-            df = pd.read_csv(z.open(f))
-            dfs.append(df)
+        members = z.namelist()
+        logger.debug(f"Found {len(members)} files: {members}")
+
+        usecols = None
+        if columns is not None:
+            wanted_columns = set(columns)
+            usecols = wanted_columns.__contains__
+
+        def read_member(member: str) -> pd.DataFrame:
+            logger.debug(f"Parsing file: {member}")
+            with z.open(member) as f:
+                return pd.read_csv(f, usecols=usecols)
+
+        # parse and concat all files. the csv parser releases the GIL, so the
+        # files of large responses are parsed at the same time
+        if len(members) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(members), OASIS_PARSE_MAX_WORKERS),
+            ) as executor:
+                dfs = list(executor.map(read_member, members))
+        else:
+            dfs = [read_member(member) for member in members]
 
         df = pd.concat(dfs)
 
         # if col ends in _GMT, then try to parse as UTC
         for col in df.columns:
             if col.endswith("_GMT"):
-                df[col] = pd.to_datetime(
-                    df[col],
-                    utc=True,
-                )
+                df[col] = _parse_oasis_gmt(df[col])
 
         # handle different column names
         # across different datasets
@@ -433,7 +816,10 @@ class CAISO(ISOBase):
         for col in start_cols:
             if col in df.columns:
                 start_col = col
-                df = df.sort_values(by=start_col)
+                # files are usually already in time order, so only sort when
+                # they aren't. a stable sort keeps the file order of ties
+                if not df[start_col].is_monotonic_increasing:
+                    df = df.sort_values(by=start_col, kind="stable")
                 break
         for col in end_cols:
             if col in df.columns:
@@ -459,9 +845,6 @@ class CAISO(ISOBase):
 
             df.insert(0, "Time", df["Interval Start"])
 
-        # avoid rate limiting
-        time.sleep(sleep)
-
         return df
 
     @support_date_range(frequency="DAY_START")
@@ -498,7 +881,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         df = _get_historical("fuelsource", date, column="Solar", verbose=verbose)
+        return self._format_fuel_mix(df)
 
+    def _format_fuel_mix(self, df: pd.DataFrame) -> pd.DataFrame:
         # rename some inconsistent columns names to standardize across dates
         df = df.rename(
             columns={
@@ -537,12 +922,42 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         df = _get_historical("demand", date, column="Current demand", verbose=verbose)
+        return self._format_load(df)
 
+    def _format_load(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df[["Time", "Interval Start", "Interval End", "Current demand"]]
         df = df.rename(columns={"Current demand": "Load"})
         df = df.dropna(subset=["Load"])
         return df
 
+    def track_today(
+        self,
+        dataset: Literal["fuel_mix", "load", "storage"],
+        verbose: bool = False,
+    ) -> "CAISOTodayTracker":
+        """Return a tracker of the current day's 5 minute fuel mix, load, or
+        storage that only parses the rows published since its last refresh.
+
+        Example::
+
+            tracker = CAISO().track_today("fuel_mix")
+            new_rows = tracker.refresh()  # every row so far
+            new_rows = tracker.refresh()  # only the rows published since
+            df = tracker.data  # the whole day
+        """
+        datasets = {
+            "fuel_mix": ("fuelsource", "Solar", self._format_fuel_mix),
+            "load": ("demand", "Current demand", self._format_load),
+            "storage": ("storage", "Total batteries", self._format_storage),
+        }
+        if dataset not in datasets:
+            raise ValueError(
+                f"Unknown dataset {dataset}. Must be one of {list(datasets)}",
+            )
+
+        file, column, formatter = datasets[dataset]
+        return CAISOTodayTracker(file, column, formatter, verbose=verbose)
+
     @support_date_range(frequency="DAY_START")
     def get_seven_day_resource_adequacy_outlook(
         self,
@@ -697,7 +1112,7 @@ class CAISO(ISOBase):
             date (str | pd.Timestamp): day to return
             end (str | pd.Timestamp, optional): end of date range to return.
                 If None, returns only date. Defaults to None.
-            sleep (int): seconds to sleep before returning to avoid rate limit. Defaults to 4.
+            sleep (int): minimum seconds between OASIS requests to avoid rate limit. Defaults to 4.
             verbose (bool): print verbose output. Defaults to False.
 
         Returns:
@@ -748,7 +1163,7 @@ class CAISO(ISOBase):
             date (str | pd.Timestamp): day to return
             end (str | pd.Timestamp, optional): end of date range to return.
                 If None, returns only date. Defaults to None.
-            sleep (int): seconds to sleep before returning to avoid rate limit. Defaults to 4.
+            sleep (int): minimum seconds between OASIS requests to avoid rate limit. Defaults to 4.
             verbose (bool): print verbose output. Defaults to False.
 
         Returns:
@@ -798,7 +1213,7 @@ class CAISO(ISOBase):
             date (str | pd.Timestamp): day to return
             end (str | pd.Timestamp, optional): end of date range to return data.
                 If None, returns only date. Defaults to None.
-            sleep (int): seconds to sleep before returning to avoid rate limit. Defaults to 4.
+            sleep (int): minimum seconds between OASIS requests to avoid rate limit. Defaults to 4.
             verbose (bool): print verbose output. Defaults to False.
 
         Returns:
@@ -846,7 +1261,7 @@ class CAISO(ISOBase):
             date (str | pd.Timestamp): day to return
             end (str | pd.Timestamp, optional): end of date range to return data.
                 If None, returns only date. Defaults to None.
-            sleep (int): seconds to sleep before returning to avoid rate limit. Defaults to 4.
+            sleep (int): minimum seconds between OASIS requests to avoid rate limit. Defaults to 4.
             verbose (bool): print verbose output. Defaults to False.
 
         Returns:
@@ -895,7 +1310,7 @@ class CAISO(ISOBase):
             date (str | pd.Timestamp): day to return
             end (str | pd.Timestamp, optional): end of date range to return data.
                 If None, returns only date. Defaults to None.
-            sleep (int): seconds to sleep before returning to avoid rate limit. Defaults to 4.
+            sleep (int): minimum seconds between OASIS requests to avoid rate limit. Defaults to 4.
             verbose (bool): print verbose output. Defaults to False.
 
         Returns:
@@ -972,7 +1387,7 @@ class CAISO(ISOBase):
             date (str | pd.Timestamp): day to return
             end (str | pd.Timestamp, optional): end of date range to return.
                 If None, returns only date. Defaults to None.
-            sleep (int): seconds to sleep before returning to avoid rate limit. Defaults to 4.
+            sleep (int): minimum seconds between OASIS requests to avoid rate limit. Defaults to 4.
             verbose (bool): print verbose output. Defaults to False.
 
         Returns:
@@ -1414,8 +1829,8 @@ class CAISO(ISOBase):
         logger.info(f"Fetching URL: {url}")
 
         # NOTE: OASIS rate-limits ~1 request per 5s; pace daily chunks to stay under it.
-        # Matches the _get_oasis retry-on-429 pattern
-        time.sleep(5)
+        # Shares the _get_oasis rate budget
+        _get_oasis_rate_limiter().wait(5)
         r = requests.get(url, verify=True)
         r.raise_for_status()
 
@@ -1451,22 +1866,110 @@ class CAISO(ISOBase):
         return rows
 
     def get_pnodes(self, verbose: bool = False) -> pd.DataFrame:
+        """Return the map of pricing nodes (PNodes) to aggregate pricing nodes.
+
+        The map is downloaded once a day and reused until the day changes.
+        """
+        pnodes, _ = self._get_pnode_map(verbose=verbose)
+        return pnodes.copy()
+
+    def get_pnode_lookup(self, verbose: bool = False) -> pd.DataFrame:
+        """Return every PNode and aggregate PNode in the pnode map, indexed by
+        Location, with the Location Type the LMP methods give it.
+
+        Like get_pnodes, the lookup is built once a day.
+        """
+        _, lookup = self._get_pnode_map(verbose=verbose)
+        return lookup.copy()
+
+    def _get_pnode_map(
+        self,
+        verbose: bool = False,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
         start = utils._handle_date("today")
 
-        df = self.get_oasis_dataset(
-            dataset="pnode_map",
-            start=start,
-            end=start + pd.Timedelta(days=1),
-            verbose=verbose,
-        )
+        with self._pnodes_lock:
+            if self._pnodes is not None and self._pnodes[0] == start:
+                return self._pnodes[1], self._pnodes[2]
 
-        df = df.rename(
-            columns={
-                "APNODE_ID": "Aggregate PNode ID",
-                "PNODE_ID": "PNode ID",
-            },
-        )
-        return df
+            pnodes = self.get_oasis_dataset(
+                dataset="pnode_map",
+                start=start,
+                end=start + pd.Timedelta(days=1),
+                verbose=verbose,
+            )
+
+            pnodes = pnodes.rename(
+                columns={
+                    "APNODE_ID": "Aggregate PNode ID",
+                    "PNODE_ID": "PNode ID",
+                },
+            )
+
+            locations = pd.Index(
+                pd.concat(
+                    [
+                        pnodes.get("PNode ID", pd.Series(dtype=object)),
+                        pnodes.get("Aggregate PNode ID", pd.Series(dtype=object)),
+                    ],
+                    ignore_index=True,
+                )
+                .dropna()
+                .unique(),
+                name="Location",
+            )
+            lookup = pd.DataFrame(
+                {
+                    "Location Type": _lmp_location_types(
+                        pd.Series(locations, dtype=object),
+                        self.trading_hub_locations,
+                    ),
+                },
+                index=locations,
+            )
+
+            # an empty map means OASIS had no data, so try again next time
+            if not lookup.empty:
+                self._pnodes = (start, pnodes, lookup)
+            return pnodes, lookup
+
+    def _check_locations(self, locations: list[str], verbose: bool = False) -> None:
+        _, lookup = self._get_pnode_map(verbose=verbose)
+        if lookup.empty:
+            logger.warning("Could not get the pnode map, so locations are not checked")
+            return
+
+        unknown = [location for location in locations if location not in lookup.index]
+        if unknown:
+            raise ValueError(
+                f"Unknown CAISO locations: {unknown}. "
+                "See CAISO.get_pnodes() for valid locations",
+            )
+
+    def _get_location_types(
+        self,
+        locations: pd.Series,
+        verbose: bool = False,
+    ) -> np.ndarray:
+        """Location Type of each LMP location from the pnode lookup. Locations
+        missing from the pnode map are typed by their names instead."""
+        lookup = self.get_pnode_lookup(verbose=verbose)
+
+        codes, unique_locations = pd.factorize(locations, use_na_sentinel=False)
+        unique_types = (
+            pd.Series(unique_locations, dtype=object)
+            .map(lookup["Location Type"])
+            .to_numpy(dtype=object)
+        )
+
+        missing = pd.isna(unique_types)
+        if missing.any():
+            unique_types[missing] = _lmp_location_types(
+                pd.Series(unique_locations[missing], dtype=object),
+                self.trading_hub_locations,
+            )
+
+        return unique_types.take(codes)
 
     @lmp_config(
         supports={
@@ -1475,7 +1978,10 @@ class CAISO(ISOBase):
             Markets.REAL_TIME_5_MIN: ["latest", "today", "historical"],
         },
     )
-    @support_date_range(frequency=_determine_lmp_frequency)
+    @support_date_range(
+        frequency=_determine_lmp_frequency,
+        max_workers=lambda args_dict: args_dict["self"].max_workers,
+    )
     def _get_lmp(
         self,
         date: str | pd.Timestamp,
@@ -1499,8 +2005,9 @@ class CAISO(ISOBase):
                 Use "ALL" to get all nodes. For a list of locations,
                 call ``CAISO.get_pnodes()``
 
-            sleep (int): number of seconds to sleep before returning to
-                avoid hitting rate limit in regular usage. Defaults to 5 seconds.
+            sleep (int): minimum number of seconds between the starts of OASIS
+                requests, to avoid hitting the rate limit. Queries of a date range
+                are fetched concurrently within this budget. Defaults to 5 seconds.
 
         Returns:
             pandas.DataFrame: A DataFrame of pricing data
@@ -1529,6 +2036,10 @@ class CAISO(ISOBase):
             raise RuntimeError("LMP Market is not supported")
 
         if isinstance(locations, list):
+            # an unknown location would only be reported after a full OASIS query
+            if self.validate_locations and locations != self.trading_hub_locations:
+                self._check_locations(locations, verbose=verbose)
+
             nodes_str = ",".join(locations)
             params = {
                 "node": nodes_str,
@@ -1561,6 +2072,13 @@ class CAISO(ISOBase):
             sleep=sleep,
             raw_data=False,
             verbose=verbose,
+            columns=[
+                "INTERVALSTARTTIME_GMT",
+                "INTERVALENDTIME_GMT",
+                "NODE",
+                "LMP_TYPE",
+                PRICE_COL,
+            ],
         )
 
         if df.empty:
@@ -1568,44 +2086,10 @@ class CAISO(ISOBase):
                 f"No data found for start date: {date} and end date: {end}",
             )
 
-        df = df.pivot_table(
-            index=["Time", "Interval Start", "Interval End", "NODE"],
-            columns="LMP_TYPE",
-            values=PRICE_COL,
-            aggfunc="first",
-        )
-
-        df = df.reset_index().rename(
-            columns={
-                "NODE": "Location",
-                "LMP": "LMP",
-                "MCE": "Energy",
-                "MCC": "Congestion",
-                "MCL": "Loss",
-                "MGHG": "GHG",
-            },
-        )
+        df = _pivot_lmp_types(df, PRICE_COL)
 
         df["Market"] = market.value
-        df["Location Type"] = "Node"
-
-        # if -APND in location then "APND" Location Type
-
-        df.loc[
-            df["Location"].str.endswith("-APND"),
-            "Location Type",
-        ] = "AP Node"
-
-        df.loc[
-            df["Location"].isin(self.trading_hub_locations),
-            "Location Type",
-        ] = "Trading Hub"
-
-        # if starts with "DLAP_" then "DLAP" Location Type
-        df.loc[
-            df["Location"].str.startswith("DLAP_"),
-            "Location Type",
-        ] = "DLAP"
+        df["Location Type"] = self._get_location_types(df["Location"], verbose)
 
         df = df[
             [
@@ -1866,7 +2350,9 @@ class CAISO(ISOBase):
             return self._latest_from_today(self.get_storage)
 
         df = _get_historical("storage", date, column="Total batteries", verbose=verbose)
+        return self._format_storage(df)
 
+    def _format_storage(self, df: pd.DataFrame) -> pd.DataFrame:
         rename = {
             "Total batteries": "Supply",
             "Stand-alone batteries": "Stand-alone Batteries",
@@ -2131,10 +2617,10 @@ class CAISO(ISOBase):
 
         return queue
 
-    @support_date_range(frequency="DAY_START")
     def get_curtailment_legacy(
         self,
         date: str | pd.Timestamp,
+        end: str | pd.Timestamp | None = None,
         verbose: bool = False,
     ) -> pd.DataFrame:
         """Return curtailment data for a given date.
@@ -2145,11 +2631,30 @@ class CAISO(ISOBase):
 
         Args:
             date: Date to return data.
+            end: End of a date range to return data for, exclusive.
             verbose: Print out url being fetched. Defaults to False.
 
         Returns:
             A DataFrame of curtailment data.
         """
+        # One pool for every PDF of the date range, so worker processes are
+        # spawned once per call rather than once per day
+        with self._curtailment_pdf_pool() as pdf_pool:
+            return self._get_curtailment_legacy(
+                date,
+                end=end,
+                verbose=verbose,
+                pdf_pool=pdf_pool,
+            )
+
+    @support_date_range(frequency="DAY_START")
+    def _get_curtailment_legacy(
+        self,
+        date: str | pd.Timestamp,
+        end: str | pd.Timestamp | None = None,
+        verbose: bool = False,
+        pdf_pool: ProcessPoolExecutor | None = None,
+    ) -> pd.DataFrame:
         date = date.normalize()
 
         if date > pd.Timestamp("2025-05-31", tz=self.default_timezone):
@@ -2172,34 +2677,22 @@ class CAISO(ISOBase):
             date_str = "02dec_2020"
 
         url = f"{base_url}{date_str}.pdf"
-        logger.info(f"Fetching URL: {url}")
-
-        r = requests.get(url)
-        if r.status_code == 404:
-            raise ValueError(f"Could not find curtailment PDF for {date}")
-
-        pdf = io.BytesIO(r.content)
-        if pdf is None:
-            raise ValueError(f"Could not find curtailment PDF for {date}")
 
         tables = []
         header = None
-        with pdfplumber.open(pdf) as pdf_doc:
-            for page in pdf_doc.pages:
-                extracted_tables = page.extract_tables()
-                for table in extracted_tables:
-                    if not table:
-                        continue
-
-                    # First page - get header and data
-                    if any("FUEL TYPE" in str(col) for col in table[0]):
-                        header = table[0]
-                        df = pd.DataFrame(table[1:], columns=header)
-                        tables.append(df)
-                    # Subsequent pages - use saved header
-                    elif header is not None:
-                        df = pd.DataFrame(table, columns=header)
-                        tables.append(df)
+        for table in self._get_curtailment_pdf_tables(url, date, pdf_pool):
+            if not table:
+                continue
+
+            # First page - get header and data
+            if any("FUEL TYPE" in str(col) for col in table[0]):
+                header = table[0]
+                df = pd.DataFrame(table[1:], columns=header)
+                tables.append(df)
+            # Subsequent pages - use saved header
+            elif header is not None:
+                df = pd.DataFrame(table, columns=header)
+                tables.append(df)
 
         if len(tables) == 0:
             raise ValueError("No tables found")
@@ -2254,6 +2747,165 @@ class CAISO(ISOBase):
         df = df.replace("", np.nan)
         return df
 
+    def _get_curtailment_pdf_tables(
+        self,
+        url: str,
+        date: pd.Timestamp,
+        pdf_pool: ProcessPoolExecutor | None = None,
+    ) -> list[list[list[str | None]]]:
+        """Returns the tables of every page of a curtailment PDF, in page order.
+
+        With a curtailment_cache_dir, tables are cached as JSON by the SHA-256 of
+        the PDF. The hash is remembered by URL with the ETag and Last-Modified
+        CAISO sent, so a PDF seen before is requested conditionally. If CAISO
+        answers that it has not changed, or sends the same content again, it is
+        not extracted again. A PDF republished at the same URL is extracted and
+        cached anew.
+        """
+        if self.curtailment_cache_dir is None:
+            return self._extract_curtailment_pdf_tables(
+                self._download_curtailment_pdf(url, date).content,
+                pdf_pool,
+            )
+
+        urls_dir = os.path.join(self.curtailment_cache_dir, "urls")
+        tables_dir = os.path.join(
+            self.curtailment_cache_dir,
+            f"tables_v{CURTAILMENT_TABLES_CACHE_VERSION}",
+        )
+        url_path = os.path.join(
+            urls_dir,
+            f"{hashlib.sha256(url.encode()).hexdigest()}.json",
+        )
+
+        cached = None
+        try:
+            with open(url_path) as f:
+                entry = json.load(f)
+            tables = self._read_curtailment_tables_cache(
+                os.path.join(tables_dir, f"{entry['content_hash']}.json.gz"),
+            )
+            if tables is not None:
+                cached = entry, tables
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        headers = {}
+        if cached is not None:
+            entry, _ = cached
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        r = self._download_curtailment_pdf(url, date, headers=headers)
+
+        if cached is not None and r.status_code == 304:
+            logger.info(f"Using cached curtailment tables for {url}")
+            return cached[1]
+
+        content_hash = hashlib.sha256(r.content).hexdigest()
+        tables_path = os.path.join(tables_dir, f"{content_hash}.json.gz")
+
+        if cached is not None and cached[0]["content_hash"] == content_hash:
+            logger.info(f"Curtailment PDF unchanged, using cached tables for {url}")
+            tables = cached[1]
+        else:
+            tables = self._read_curtailment_tables_cache(tables_path)
+            if tables is None:
+                tables = self._extract_curtailment_pdf_tables(r.content, pdf_pool)
+                os.makedirs(tables_dir, exist_ok=True)
+                tmp_path = f"{tables_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with gzip.open(tmp_path, "wt", encoding="utf-8") as cache_file:
+                    json.dump(
+                        {
+                            "version": CURTAILMENT_TABLES_CACHE_VERSION,
+                            "tables": tables,
+                        },
+                        cache_file,
+                    )
+                os.replace(tmp_path, tables_path)
+
+        os.makedirs(urls_dir, exist_ok=True)
+        tmp_path = f"{url_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "content_hash": content_hash,
+                    "etag": r.headers.get("ETag"),
+                    "last_modified": r.headers.get("Last-Modified"),
+                },
+                f,
+            )
+        os.replace(tmp_path, url_path)
+
+        return tables
+
+    def _read_curtailment_tables_cache(
+        self,
+        tables_path: str,
+    ) -> list[list[list[str | None]]] | None:
+        """Returns the cached tables of a curtailment PDF, or None if the cache is
+        missing, unreadable or written by another version of the cache layout"""
+        try:
+            with gzip.open(tables_path, "rt", encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if not _is_valid_curtailment_tables_cache(cache):
+            return None
+
+        return cache["tables"]
+
+    def _download_curtailment_pdf(
+        self,
+        url: str,
+        date: pd.Timestamp,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        logger.info(f"Fetching URL: {url}")
+
+        r = requests.get(url, headers=headers or {})
+        if r.status_code == 404:
+            raise ValueError(f"Could not find curtailment PDF for {date}")
+
+        return r
+
+    def _curtailment_pdf_pool(
+        self,
+    ) -> contextlib.AbstractContextManager[ProcessPoolExecutor | None]:
+        if self.curtailment_pdf_workers == 1:
+            return contextlib.nullcontext()
+
+        # Spawned rather than forked, since this process may be running OASIS
+        # thread pools
+        return ProcessPoolExecutor(
+            max_workers=self.curtailment_pdf_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _extract_curtailment_pdf_tables(
+        self,
+        pdf_bytes: bytes,
+        pdf_pool: ProcessPoolExecutor | None = None,
+    ) -> list[list[list[str | None]]]:
+        if pdf_pool is None:
+            return _extract_pdf_tables(pdf_bytes)
+
+        # Each worker extracts one contiguous run of pages, so tables stay in
+        # page order
+        n_chunks = self.curtailment_pdf_workers
+        tables = []
+        for chunk_tables in pdf_pool.map(
+            _extract_pdf_tables,
+            itertools.repeat(pdf_bytes, n_chunks),
+            range(n_chunks),
+            itertools.repeat(n_chunks, n_chunks),
+        ):
+            tables.extend(chunk_tables)
+        return tables
+
     def _pivot_aggregated_generation_outages(
         self,
         df: pd.DataFrame,
@@ -3658,28 +4310,7 @@ class CAISO(ISOBase):
 
         html_content = response.content.decode("utf-8")
 
-        def extract_array(content: str, var_name: str) -> list:
-            # Extracts a JavaScript array from the HTML content. Some of the arrays]
-            # are wrapped in JSON.parse().
-            pattern = rf'{var_name}\s*=\s*(?:JSON\.parse\(\["?)?\[([^\]]*)\]\)?'
-            match = re.search(pattern, content, re.DOTALL)
-            if not match:
-                return []
-
-            array_str = match.group(1)
-            values = []
-            for item in array_str.split(","):
-                item = item.strip()
-                if item in ('"NA"', "NA"):
-                    values.append(np.nan)
-                elif item.startswith('"') and item.endswith('"'):
-                    values.append(item[1:-1])
-                else:
-                    try:
-                        values.append(float(item))
-                    except ValueError:
-                        values.append(item)
-            return values
+        chart_arrays = caiso_utils.extract_js_arrays(html_content)
 
         base_date = date.normalize()
 
@@ -3708,7 +4339,7 @@ class CAISO(ISOBase):
             }
 
             for col_name, var_name in column_mapping.items():
-                values = extract_array(html_content, var_name)
+                values = chart_arrays.get(var_name, np.array([], dtype=float))
                 if len(values) > target_length:
                     values = values[-target_length:]
                 elif len(values) < target_length:
@@ -3729,12 +4360,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """Energy and ancillary services awards for storage in the FMM (15-minute)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "awards_fmm",
         )
-        return daily_energy_storage.build_storage_awards_fmm(html, rs)
 
     @support_date_range(frequency="DAY_START")
     def get_storage_awards_ifm(
@@ -3744,12 +4372,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """Energy and AS awards for storage in the IFM (energy at 5-minute, AS hourly)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "awards_ifm",
         )
-        return daily_energy_storage.build_storage_awards_ifm(html, rs)
 
     @support_date_range(frequency="DAY_START")
     def get_storage_awards_rtd(
@@ -3759,12 +4384,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """Energy awards for storage in RTD (5-minute)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "awards_rtd",
         )
-        return daily_energy_storage.build_storage_awards_rtd(html, rs)
 
     @support_date_range(frequency="DAY_START")
     def get_storage_energy_awards_ruc(
@@ -3774,12 +4396,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """RUC energy awards to storage (5-minute)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "energy_awards_ruc",
         )
-        return daily_energy_storage.build_storage_energy_awards_ruc(html, rs)
 
     @support_date_range(frequency="DAY_START")
     def get_storage_energy_bids_fmm(
@@ -3789,12 +4408,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """FMM energy bid-in capacity by price bin (15-minute)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "energy_bids_fmm",
         )
-        return daily_energy_storage.build_storage_energy_bids_fmm(html, rs)
 
     @support_date_range(frequency="DAY_START")
     def get_storage_energy_bids_ifm(
@@ -3804,12 +4420,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """IFM energy bid-in capacity by price bin (hourly)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "energy_bids_ifm",
         )
-        return daily_energy_storage.build_storage_energy_bids_ifm(html, rs)
 
     @support_date_range(frequency="DAY_START")
     def get_storage_soc_fmm(
@@ -3819,12 +4432,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """State of charge for storage in the FMM (15-minute, standalone resources)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "soc_fmm",
         )
-        return daily_energy_storage.build_storage_soc_fmm(html, rs)
 
     @support_date_range(frequency="DAY_START")
     def get_storage_soc_hourly(
@@ -3834,12 +4444,9 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """Hourly IFM and RUC state of charge (see ``build_storage_soc_hourly``)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "soc_hourly",
         )
-        return daily_energy_storage.build_storage_soc_hourly(html, rs)
 
     @support_date_range(frequency="DAY_START")
     def get_storage_soc_rtd(
@@ -3849,12 +4456,35 @@ class CAISO(ISOBase):
         verbose: bool = False,
     ) -> pd.DataFrame:
         """State of charge for storage in RTD (5-minute, standalone resources)."""
-        html, rs = daily_energy_storage.load_daily_energy_storage_report(
-            date=date,
-            tz=self.default_timezone,
-            verbose=verbose,
+        return self._storage_reports.get(date, verbose=verbose).dataset(
+            "soc_rtd",
         )
-        return daily_energy_storage.build_storage_soc_rtd(html, rs)
+
+    @support_date_range(frequency="DAY_START")
+    def get_storage_datasets(
+        self,
+        date: str | pd.Timestamp,
+        end: str | pd.Timestamp | None = None,
+        datasets: list[str] | None = None,
+        verbose: bool = False,
+    ) -> dict[str, pd.DataFrame]:
+        """Every storage dataset of the Daily Energy Storage reports, downloading
+        each day's report once.
+
+        Arguments:
+            date (str or pandas.Timestamp): first report day
+            end (str or pandas.Timestamp, optional): end of the range of report days
+            datasets (list[str], optional): the datasets to return. Defaults to
+                all of them: "awards_fmm", "awards_ifm", "awards_rtd",
+                "energy_awards_ruc", "energy_bids_fmm", "energy_bids_ifm",
+                "soc_fmm", "soc_hourly" and "soc_rtd". Each is the same as the
+                get_storage_<dataset> method.
+            verbose (bool, optional): print verbose output. Defaults to False.
+
+        Returns:
+            dict[str, pandas.DataFrame]: the data of each dataset
+        """
+        return self._storage_reports.get(date, verbose=verbose).datasets(datasets)
 
     def get_system_load_and_resource_schedules_day_ahead(
         self,
@@ -3966,3 +4596,134 @@ class CAISO(ISOBase):
         df = df.reset_index().rename(columns={"TAC_ZONE_NAME": "TAC Name"})
 
         return df.sort_values(["Interval Start", "TAC Name"])
+
+
+class CAISOTodayTracker:
+    """The current day's rows of a CAISO Today's Outlook file, kept up to date
+    incrementally.
+
+    Every refresh downloads the current day's file, but only parses the lines
+    after the last line already parsed, so the work per refresh is proportional
+    to the rows published since the previous one. A row is published once it has
+    a value in the tracked column; the rows after the last such row, like the
+    forecast-only rows of the demand file, are left for a later refresh.
+
+    The download is conditional on the ETag and Last-Modified of the previous
+    one, so a file that has not changed since is not downloaded again.
+
+    When the file no longer starts with the lines already parsed, CAISO has
+    started a new day's file or rewritten earlier rows, and the tracker starts
+    over. This compares a hash of every parsed line, so a rewrite that keeps the
+    last parsed line, or the first row's timestamp, is still noticed. As with
+    CAISO.get_fuel_mix("today"), a file that still holds the previous day's
+    data around midnight is dated the previous day.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        column: str,
+        formatter: Callable[[pd.DataFrame], pd.DataFrame],
+        verbose: bool = False,
+    ) -> None:
+        self.file = file
+        self.column = column
+        self.formatter = formatter
+        self.verbose = verbose
+        # the day of the tracked file, set by the first refresh
+        self.day: pd.Timestamp | None = None
+        self._header: str | None = None
+        # number of data lines of the file parsed so far, and a hash of them
+        self._lines_parsed = 0
+        self._parsed_hash: str | None = None
+        # validators of the last download, sent with the next request
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._frames: list[pd.DataFrame] = []
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Every row of the day so far"""
+        if not self._frames:
+            return pd.DataFrame()
+        if len(self._frames) > 1:
+            self._frames = [pd.concat(self._frames, ignore_index=True)]
+        return self._frames[0].copy()
+
+    def refresh(self) -> pd.DataFrame:
+        """Download the current file and return the rows published since the
+        last refresh. After the file rolls over to a new day, every row of the
+        new day is returned.
+        """
+        today = pd.Timestamp.now(tz=CAISO.default_timezone).normalize()
+        url, _ = _historical_url(self.file, today)
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        logger.info(f"Fetching URL: {url}")
+        r = requests.get(url, headers=headers)
+        if r.status_code == 304:
+            return self.data.iloc[0:0]
+        r.raise_for_status()
+
+        header, *lines = r.text.splitlines()
+
+        if not (
+            header == self._header
+            and len(lines) >= self._lines_parsed
+            and _hash_lines(lines[: self._lines_parsed]) == self._parsed_hash
+        ):
+            self._reset()
+
+        new_lines = lines[self._lines_parsed :]
+        # blank lines are kept as empty rows so that row i is line i
+        df = pd.read_csv(
+            io.StringIO("\n".join([header, *new_lines])),
+            skip_blank_lines=False,
+        )
+
+        last_published = df[self.column].last_valid_index()
+        if last_published is None:
+            self._set_validators(r)
+            return self.data.iloc[0:0]
+
+        df = _drop_empty_historical_rows(df.iloc[: last_published + 1])
+
+        if self.day is None:
+            self.day = _current_file_date(df, self.column, today)
+
+        df["Time"] = caiso_utils.make_timestamps(
+            df["Time"],
+            today=self.day,
+            timezone=CAISO.default_timezone,
+        )
+
+        # a midnight row after the first line of the file is the next day's
+        # midnight, which the historical methods drop too
+        is_next_midnight = (df["Time"] == self.day) & (
+            df.index + self._lines_parsed > 0
+        )
+        df = _insert_historical_intervals(df[~is_next_midnight].copy())
+        df = self.formatter(df).reset_index(drop=True)
+
+        self._header = header
+        self._lines_parsed += last_published + 1
+        self._parsed_hash = _hash_lines(lines[: self._lines_parsed])
+        self._frames.append(df)
+        self._set_validators(r)
+
+        return df.copy()
+
+    def _set_validators(self, r: requests.Response) -> None:
+        # only set once the file is parsed, so a failed refresh downloads it again
+        self._etag = r.headers.get("ETag")
+        self._last_modified = r.headers.get("Last-Modified")
+
+    def _reset(self) -> None:
+        self.day = None
+        self._header = None
+        self._lines_parsed = 0
+        self._parsed_hash = None
+        self._frames = []
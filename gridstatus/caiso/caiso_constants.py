@@ -7,6 +7,21 @@ DAY_AHEAD_MARKET_MARKET_RUN_ID = "DAM"
 REAL_TIME_DISPATCH_MARKET_RUN_ID = "RTD"
 REAL_TIME_DISPATCH_15_MIN_MARKET_RUN_ID = "RTPD"
 
+# Number of OASIS queries of a date range fetched at the same time. Request
+# starts are still spaced by the sleep argument of the OASIS methods
+DEFAULT_OASIS_MAX_WORKERS = 4
+
+# Format of the _GMT time columns of OASIS files
+OASIS_GMT_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+# Number of files of one OASIS response parsed at the same time
+OASIS_PARSE_MAX_WORKERS = 4
+
+# Bump when the way tables are extracted from curtailment PDFs, or the layout of
+# their on-disk cache, changes, so tables cached by an older version are
+# extracted again
+CURTAILMENT_TABLES_CACHE_VERSION = 2
+
 OASIS_DATASET_CONFIG = {
     "transmission_interface_usage": {
         "query": {
@@ -1,5 +1,16 @@
+import functools
+import re
+
+import numpy as np
 import pandas as pd
 
+# A flat JavaScript array literal assigned to a variable in a CAISO HTML chart
+# report, e.g. ``var tot_energy_rtd = [1334, 1098, 42];``. Some reports wrap the
+# array in JSON.parse, e.g. ``solar = JSON.parse(["[1, 2, "NA"]"])``.
+_JS_ARRAY_ASSIGNMENT = re.compile(
+    r"\b([A-Za-z_$][\w$]*)\s*=\s*(?:JSON\.parse\(\s*\[?\s*\"?)?\[([^\[\]]*)\]",
+)
+
 
 # NOTE: Currently the gridstatus.CAISO.default_timezone is in the caiso.py file, which imports caiso_utils.py and thus
 # it can't be set to the value without causing a circular import, which is why they are hardcoded here.
@@ -16,6 +27,80 @@ def make_timestamp(time_str: str, today: pd.Timestamp, timezone: str = "US/Pacif
     return ts
 
 
+def make_timestamps(
+    time_strs: pd.Series,
+    today: pd.Timestamp,
+    timezone: str = "US/Pacific",
+) -> pd.Series:
+    """Vectorized make_timestamp for a column of HH:MM clock times on one day.
+
+    A report day has at most a few hundred distinct clock times, so each is
+    parsed and localized once and the results are spread back over the rows.
+    Like make_timestamp, times in the repeated hour when DST ends are taken to
+    be daylight time, and times in the skipped hour when DST starts raise.
+    """
+    codes, unique_times = pd.factorize(time_strs)
+    hours_minutes = (
+        pd.Series(unique_times, dtype=object).str.split(":", expand=True).astype(int)
+    )
+    day = pd.Timestamp(year=today.year, month=today.month, day=today.day)
+
+    unique_timestamps = pd.DatetimeIndex(
+        day
+        + pd.to_timedelta(hours_minutes[0], unit="h")
+        + pd.to_timedelta(hours_minutes[1], unit="min"),
+    ).tz_localize(timezone, ambiguous=np.ones(len(unique_times), dtype=bool))
+
+    return pd.Series(
+        unique_timestamps.take(codes),
+        index=time_strs.index,
+        name=time_strs.name,
+    )
+
+
+def parse_js_number_array(array_text: str) -> np.ndarray:
+    """Parses the elements of a JavaScript array literal (without the brackets)
+    into floats. Strings are unquoted, and anything that is not a finite number,
+    such as "NA", null or an empty element, becomes NaN."""
+    tokens = array_text.split(",")
+    if not tokens[-1].strip():
+        # An empty array or a trailing comma
+        tokens.pop()
+    if not tokens:
+        return np.array([], dtype=float)
+
+    try:
+        values = np.array(tokens, dtype=float)
+    except ValueError:
+        values = pd.to_numeric(
+            pd.Series(tokens, dtype=object).str.strip().str.strip("\"'"),
+            errors="coerce",
+        ).to_numpy(dtype=float, na_value=np.nan)
+
+    values[~np.isfinite(values)] = np.nan
+    return values
+
+
+@functools.lru_cache(maxsize=8)
+def extract_js_arrays(html: str) -> dict[str, np.ndarray]:
+    """Extracts every numeric JavaScript array assigned to a variable in a CAISO
+    HTML chart report, in one pass over the document.
+
+    Returns a dict of variable name to float array. When a variable is assigned
+    more than once, the first assignment is used. The arrays are shared between
+    callers parsing the same document, so they are read-only.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    for match in _JS_ARRAY_ASSIGNMENT.finditer(html):
+        var_name = match.group(1)
+        if var_name in arrays:
+            continue
+        values = parse_js_number_array(match.group(2))
+        values.flags.writeable = False
+        arrays[var_name] = values
+    return arrays
+
+
 def check_latest_value_time(df: pd.DataFrame, column: str):
     """Check if the latest value time is from the previous day and update the date accordingly
 
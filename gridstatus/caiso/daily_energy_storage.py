@@ -8,14 +8,15 @@ from the report operating day start in Pacific time; see ``_interval_index``.
 
 from __future__ import annotations
 
-import ast
-import math
-from typing import Any
+import threading
+from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 import requests
 
 from gridstatus import utils
+from gridstatus.caiso import caiso_utils
 from gridstatus.gs_logging import logger
 
 
@@ -36,37 +37,67 @@ def load_daily_energy_storage_report(
     return html, report_start
 
 
+def _candidate_urls(day: pd.Timestamp) -> list[tuple[str, str]]:
+    """(slug pattern, url) of every URL a report has been published under, in
+    the order they are tried. The pattern CAISO used changed over time."""
+    month = day.strftime("%b").lower()
+    slugs = {
+        "standard": day.strftime("%b-%d-%Y").lower(),
+        "no_zero_day": f"{month}-{day.day}-{day.year}",
+        "legacy": day.strftime("%b-%d%Y").lower(),
+        "legacy_day_no_pad": f"{month}-{day.day}{day.year}",
+    }
+    compact_slugs = {
+        "compact_day_padded": f"dailyenergystoragereport{month}{day.strftime('%d')}-{day.year}",
+        "compact": f"dailyenergystoragereport{month}{day.day}-{day.year}",
+    }
+
+    candidates = []
+    for pattern, slug in slugs.items():
+        base = f"https://www.caiso.com/documents/daily-energy-storage-report-{slug}"
+        candidates.append((pattern, f"{base}.html"))
+        candidates.append((f"{pattern}_corrected", f"{base}-corrected.html"))
+    for pattern, slug in compact_slugs.items():
+        base = f"https://www.caiso.com/documents/{slug}"
+        candidates.append((pattern, f"{base}.html"))
+        candidates.append((f"{pattern}_corrected", f"{base}-corrected.html"))
+
+    return candidates
+
+
 def _fetch_daily_energy_storage_html(
     date: str | pd.Timestamp,
     tz: str,
     verbose: bool = False,
 ) -> str:
+    html, _ = _fetch_daily_energy_storage_page(date, tz, verbose)
+    return html
+
+
+def _fetch_daily_energy_storage_page(
+    date: str | pd.Timestamp,
+    tz: str,
+    verbose: bool = False,
+    preferred_pattern: str | None = None,
+) -> tuple[str, str]:
+    """Returns the report HTML and the slug pattern of the URL it was found at.
+
+    The URLs of preferred_pattern, e.g. the pattern that resolved for a nearby
+    date, are tried first, so a range of dates usually takes one request per
+    date. Corrected reports are part of the pattern they correct.
+    """
     day = _report_day_start(date, tz)
-    slug_standard = day.strftime("%b-%d-%Y").lower()
-    slug_no_zero_day = f"{day.strftime('%b').lower()}-{day.day}-{day.year}"
-    slug_legacy = day.strftime("%b-%d%Y").lower()
-    slug_legacy_day_no_pad = f"{day.strftime('%b').lower()}-{day.day}{day.year}"
-    slug_compact_day_padded = f"dailyenergystoragereport{day.strftime('%b').lower()}{day.strftime('%d')}-{day.year}"
-    slug_compact = (
-        f"dailyenergystoragereport{day.strftime('%b').lower()}{day.day}-{day.year}"
-    )
-    candidate_urls = [
-        f"https://www.caiso.com/documents/daily-energy-storage-report-{slug_standard}.html",
-        f"https://www.caiso.com/documents/daily-energy-storage-report-{slug_standard}-corrected.html",
-        f"https://www.caiso.com/documents/daily-energy-storage-report-{slug_no_zero_day}.html",
-        f"https://www.caiso.com/documents/daily-energy-storage-report-{slug_no_zero_day}-corrected.html",
-        f"https://www.caiso.com/documents/daily-energy-storage-report-{slug_legacy}.html",
-        f"https://www.caiso.com/documents/daily-energy-storage-report-{slug_legacy}-corrected.html",
-        f"https://www.caiso.com/documents/daily-energy-storage-report-{slug_legacy_day_no_pad}.html",
-        f"https://www.caiso.com/documents/daily-energy-storage-report-{slug_legacy_day_no_pad}-corrected.html",
-        f"https://www.caiso.com/documents/{slug_compact_day_padded}.html",
-        f"https://www.caiso.com/documents/{slug_compact_day_padded}-corrected.html",
-        f"https://www.caiso.com/documents/{slug_compact}.html",
-        f"https://www.caiso.com/documents/{slug_compact}-corrected.html",
-    ]
+    candidates = _candidate_urls(day)
+    if preferred_pattern is not None:
+        candidates.sort(
+            key=lambda candidate: (
+                candidate[0].removesuffix("_corrected") != preferred_pattern
+            ),
+        )
+
     response = None
     seen_urls: set[str] = set()
-    for url in candidate_urls:
+    for pattern, url in candidates:
         if url in seen_urls:
             continue
         seen_urls.add(url)
@@ -75,7 +106,7 @@ def _fetch_daily_energy_storage_html(
         response = requests.get(url, timeout=60)
         if response.status_code == 200:
             body: bytes = response.content
-            return body.decode("utf-8")
+            return body.decode("utf-8"), pattern.removesuffix("_corrected")
     if response is None or response.status_code != 200:
         from gridstatus.base import NoDataFoundException
 
@@ -87,84 +118,93 @@ def _fetch_daily_energy_storage_html(
     raise RuntimeError("unreachable")
 
 
-def _extract_js_array_literal(html: str, var_name: str) -> str | None:
-    # Find a top-level ``[ ... ]`` assigned to ``var_name``. Example (illustrative):
-    #   var tot_energy_rtd = [1334, 1098, 42];
-    # We take the substring ``[1334, 1098, 42]`` by bracket depth counting.
-    needle_plain = f"{var_name} = ["
-    needle_with_var = f"var {var_name} = ["
-    match_index = html.find(needle_plain)
-    matched_needle = needle_plain
-    if match_index == -1:
-        match_index = html.find(needle_with_var)
-        matched_needle = needle_with_var
-    if match_index == -1:
-        return None
-    array_open_index = match_index + len(matched_needle) - 1
-    if array_open_index < 0 or html[array_open_index] != "[":
-        return None
-    bracket_depth = 0
-    substring_start = array_open_index
-    scan_index = array_open_index
-    html_length = len(html)
-    while scan_index < html_length:
-        current_char = html[scan_index]
-        if current_char == "[":
-            bracket_depth += 1
-        elif current_char == "]":
-            bracket_depth -= 1
-            if bracket_depth == 0:
-                return html[substring_start : scan_index + 1]
-        scan_index += 1
-    return None
-
-
-def _coerce_chart_element(v: Any) -> float:
-    if isinstance(v, bool):
-        return float(v)
-    if isinstance(v, int):
-        return float(v)
-    if isinstance(v, float):
-        if math.isnan(v) or math.isinf(v):
-            return float("nan")
-        return v
-    if isinstance(v, str):
-        t = v.strip()
-        if not t or t.upper() in {"NA", "N/A", "NAN", "NULL", "NONE", "-", "—"}:
-            return float("nan")
-        try:
-            return float(t)
-        except ValueError:
-            return float("nan")
-    if v is None:
-        return float("nan")
-    try:
-        x = float(v)
-        if math.isnan(x) or math.isinf(x):
-            return float("nan")
-        return x
-    except (TypeError, ValueError):
-        return float("nan")
-
-
-def _finite_mean(chunk: list[float]) -> float:
-    finite = [x for x in chunk if not math.isnan(x)]
-    if not finite:
-        return float("nan")
-    return sum(finite) / len(finite)
-
-
-def _parse_js_array(html: str, var_name: str) -> list[float]:
-    array_text = _extract_js_array_literal(html, var_name)
-    if array_text is None:
-        return []
-    try:
-        parsed_value = ast.literal_eval(array_text)
-    except (SyntaxError, ValueError):
-        return []
-    if isinstance(parsed_value, list):
-        return [_coerce_chart_element(x) for x in parsed_value]
-    return []
+class DailyEnergyStorageReport:
+    """One day's Daily Energy Storage report, downloaded once.
+
+    Every storage dataset is parsed from the same HTML, and each is parsed at
+    most once. Use dataset(name) for one dataset or datasets() for all of them.
+    """
+
+    def __init__(self, html: str, report_start: pd.Timestamp) -> None:
+        self.html = html
+        self.report_start = report_start
+        self._frames: dict[str, pd.DataFrame] = {}
+
+    def dataset(self, name: str) -> pd.DataFrame:
+        if name not in STORAGE_DATASET_BUILDERS:
+            raise ValueError(
+                f"Unknown storage dataset {name}. "
+                f"Must be one of {list(STORAGE_DATASET_BUILDERS)}",
+            )
+        if name not in self._frames:
+            self._frames[name] = STORAGE_DATASET_BUILDERS[name](
+                self.html,
+                self.report_start,
+            )
+        return self._frames[name].copy()
+
+    def datasets(self, names: list[str] | None = None) -> dict[str, pd.DataFrame]:
+        return {
+            name: self.dataset(name)
+            for name in (names if names is not None else STORAGE_DATASET_BUILDERS)
+        }
+
+
+class DailyEnergyStorageReportCache:
+    """Recently used Daily Energy Storage reports, by report day.
+
+    Remembers the URL slug pattern of the last report found, so the next date,
+    which was most likely published under the same pattern, is fetched with
+    one request instead of probing every candidate URL.
+    """
+
+    def __init__(self, tz: str, max_reports: int = 31) -> None:
+        self.tz = tz
+        self.max_reports = max_reports
+        self._reports: OrderedDict[pd.Timestamp, DailyEnergyStorageReport] = (
+            OrderedDict()
+        )
+        self._pattern: str | None = None
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        date: str | pd.Timestamp,
+        verbose: bool = False,
+    ) -> DailyEnergyStorageReport:
+        report_start = _report_day_start(date, self.tz)
+
+        with self._lock:
+            report = self._reports.get(report_start)
+            if report is not None:
+                self._reports.move_to_end(report_start)
+                return report
+            pattern = self._pattern
+
+        html, pattern = _fetch_daily_energy_storage_page(
+            report_start,
+            self.tz,
+            verbose,
+            preferred_pattern=pattern,
+        )
+        report = DailyEnergyStorageReport(html, report_start)
+
+        with self._lock:
+            self._pattern = pattern
+            self._reports[report_start] = report
+            while len(self._reports) > self.max_reports:
+                self._reports.popitem(last=False)
+
+        return report
+
+
+def _parse_js_array(html: str, var_name: str) -> np.ndarray:
+    # Every array in the document is extracted in one pass the first time any
+    # of them is asked for, and reused for the rest of the report's variables
+    values = caiso_utils.extract_js_arrays(html).get(var_name)
+    if values is None:
+        return np.array([], dtype=float)
+    return values
 
 
 def _interval_index(
@@ -189,8 +229,8 @@ def _interval_index(
 
 def _long_energy_awards(
     report_start: pd.Timestamp,
-    values_standalone: list[Any],
-    values_hybrid: list[Any],
+    values_standalone: np.ndarray,
+    values_hybrid: np.ndarray,
     minutes: int,
     product: str | None = "Energy",
 ) -> pd.DataFrame:
@@ -410,24 +450,25 @@ def _bid_stack_to_df(
     return pd.concat(rows, ignore_index=True)
 
 
-def _downsample_5min_to_15min(values: list[float]) -> list[float]:
-    if len(values) % 3 != 0 or len(values) == 0:
-        return list(values)
-    out: list[float] = []
-    for i in range(0, len(values), 3):
-        chunk = values[i : i + 3]
-        out.append(_finite_mean(chunk))
-    return out
+def _downsample_mean(values: np.ndarray, factor: int) -> np.ndarray:
+    # Mean of each run of factor values, ignoring NaN. Arrays whose length is
+    # not a multiple of factor are returned unchanged.
+    values = np.asarray(values, dtype=float)
+    if len(values) % factor != 0 or len(values) == 0:
+        return values.copy()
+    chunks = values.reshape(-1, factor)
+    counts = np.count_nonzero(~np.isnan(chunks), axis=1)
+    sums = np.nansum(chunks, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
 
 
-def _downsample_5min_to_60min(values: list[float]) -> list[float]:
-    if len(values) % 12 != 0 or len(values) == 0:
-        return list(values)
-    out: list[float] = []
-    for i in range(0, len(values), 12):
-        chunk = values[i : i + 12]
-        out.append(_finite_mean(chunk))
-    return out
+def _downsample_5min_to_15min(values: np.ndarray) -> np.ndarray:
+    return _downsample_mean(values, 3)
+
+
+def _downsample_5min_to_60min(values: np.ndarray) -> np.ndarray:
+    return _downsample_mean(values, 12)
 
 
 def build_storage_awards_fmm(
@@ -572,8 +613,8 @@ def build_storage_soc_hourly(
                 "Schedule",
             ],
         )
-    ifm_vals = [ifm_soc_series[i * 12] for i in range(n_hours)]
-    ruc_vals = [ruc_soc_series[i * 12] for i in range(n_hours)]
+    ifm_vals = ifm_soc_series[: n_hours * 12 : 12]
+    ruc_vals = ruc_soc_series[: n_hours * 12 : 12]
     starts, ends = _interval_index(report_start, n_hours, 60)
     df_ifm = pd.DataFrame(
         {
@@ -732,3 +773,17 @@ def build_storage_energy_bids_ifm(
     return pd.concat(parts, ignore_index=True).sort_values(
         ["Interval Start", "Bid Range", "Operation", "Type"],
     )
+
+
+# Storage datasets of a report and the functions that build them
+STORAGE_DATASET_BUILDERS = {
+    "awards_fmm": build_storage_awards_fmm,
+    "awards_ifm": build_storage_awards_ifm,
+    "awards_rtd": build_storage_awards_rtd,
+    "energy_awards_ruc": build_storage_energy_awards_ruc,
+    "energy_bids_fmm": build_storage_energy_bids_fmm,
+    "energy_bids_ifm": build_storage_energy_bids_ifm,
+    "soc_fmm": build_storage_soc_fmm,
+    "soc_hourly": build_storage_soc_hourly,
+    "soc_rtd": build_storage_soc_rtd,
+}
@@ -1,13 +1,13 @@
 import functools
 import pprint
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, ParamSpec, TypeVar, cast
 
 import pandas as pd
 import tqdm
 
 from gridstatus import utils
-from gridstatus.base import Markets
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -66,6 +66,9 @@ class support_date_range:
             "YEAR_START" (split by year), or None (no splitting, pass date range as-is).
         update_dates: Optional callback to customize date range splitting logic.
         return_raw: If True, return list of results instead of concatenating.
+        max_workers: Optional number of chunks to fetch at the same time, or a
+            callable that returns it from the call's arguments. Results are
+            combined in date order either way. Defaults to one chunk at a time.
 
     The decorated functions also accept these keyword arguments:
 
@@ -97,10 +100,12 @@ class support_date_range:
             | None
         ) = None,
         return_raw: bool = False,
+        max_workers: int | Callable[[dict[str, Any]], int] | None = None,
     ) -> None:
         self.frequency = frequency
         self.update_dates = update_dates
         self.return_raw = return_raw
+        self.max_workers = max_workers
 
     def __call__(self, f: Callable[P, T]) -> Callable[P, T]:
         # Use a loosely-typed reference for internal dynamic argument manipulation
@@ -231,55 +236,80 @@ class support_date_range:
             if self.update_dates is not None:
                 dates = self.update_dates(dates, args_dict)
 
-            start_date = dates[0]
-
             # remove end date and add back later if needed
             del args_dict["end"]
 
-            all_df = []
-
-            # every None removes two possible queries
-            total = len(dates) - dates.count(None) * 2 - 1
+            # pair up consecutive dates into (start, end) queries
+            ranges = []
+            start_date = dates[0]
+            for end_date in dates[1:]:
+                # if we come across None, it means we should reset
+                if end_date is None:
+                    start_date = None
+                    continue
+
+                # if start_date is None, we just reset and end is actually the start
+                if start_date is None:
+                    start_date = end_date
+                    continue
+
+                ranges.append((start_date, end_date))
+                start_date = end_date
+
+            def get_range(start_date: pd.Timestamp, end_date: pd.Timestamp) -> Any:
+                range_args = args_dict.copy()
+                range_args["date"] = start_date
+
+                # no need for end if we are querying for just 1 day
+                if frequency != "1D" and not isinstance(frequency, DayBeginOffset):
+                    range_args["end"] = end_date
+
+                try:
+                    return inner_f(**range_args)
+                except Exception as e:
+                    if error == "raise":
+                        raise
+                    elif error == "ignore":
+                        errors.append(range_args)
+                        print(f"Error: {e}")
+                        print(f"Args: {range_args}\n")
+                        return None
+                    else:
+                        raise ValueError(
+                            f"Invalid value for error: {error}",
+                        )
+
+            max_workers = self.max_workers
+            if callable(max_workers):
+                max_workers = max_workers(args_dict)
+
+            total = len(ranges)
 
             with tqdm.tqdm(disable=total <= 1, total=total) as pbar:
-                for end_date in dates[1:]:
-                    # if we come across None, it means we should reset
-                    if end_date is None:
-                        start_date = None
-                        continue
-
-                    # if start_date is None, we just reset and end is actually the start
-                    if start_date is None:
-                        start_date = end_date
-                        continue
-
-                    args_dict["date"] = start_date
-
-                    # no need for end if we are querying for just 1 day
-                    if frequency != "1D" and not isinstance(frequency, DayBeginOffset):
-                        args_dict["end"] = end_date
-
-                    try:
-                        df = inner_f(**args_dict)
-                    except Exception as e:
-                        if error == "raise":
-                            raise
-                        elif error == "ignore":
-                            df = None
-                            errors += [args_dict.copy()]
-                            print(f"Error: {e}")
-                            print(f"Args: {args_dict}\n")
-                        else:
-                            raise ValueError(
-                                f"Invalid value for error: {error}",
-                            )
-
-                    pbar.update(1)
-
-                    if df is not None:
-                        all_df.append(df)
-
-                    start_date = end_date
+                if max_workers is None or max_workers <= 1 or total <= 1:
+                    results = []
+                    for start_date, end_date in ranges:
+                        results.append(get_range(start_date, end_date))
+                        pbar.update(1)
+                else:
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        futures = [
+                            executor.submit(get_range, start_date, end_date)
+                            for start_date, end_date in ranges
+                        ]
+                        for future in as_completed(futures):
+                            try:
+                                future.result()
+                            except Exception:
+                                # don't start chunks that haven't started yet
+                                for pending in futures:
+                                    pending.cancel()
+                                raise
+                            pbar.update(1)
+
+                    results = [future.result() for future in futures]
+
+            all_df = [df for df in results if df is not None]
 
             if errors:
                 print("Errors that occurred while getting data:")
@@ -306,111 +336,6 @@ class support_date_range:
         return cast(Callable[P, T], wrapped_f)
 
 
-def _get_pjm_archive_date(market: str | Markets) -> pd.Timestamp:
-    import gridstatus
-
-    market = Markets(market)
-    tz = gridstatus.PJM.default_timezone  # type: ignore[has-type]
-    if market == Markets.REAL_TIME_5_MIN:
-        archive_date = pd.Timestamp.now(
-            tz=tz,
-        ) - pd.Timedelta(days=186)
-    elif market == Markets.REAL_TIME_HOURLY or market == Markets.DAY_AHEAD_HOURLY:
-        archive_date = pd.Timestamp.now(
-            tz=tz,
-        ) - pd.Timedelta(days=731)
-
-    return archive_date.replace(hour=0, minute=0, second=0, microsecond=0)
-
-
-# todo convert to custom PJMDateOffset class
-def pjm_update_dates(
-    dates: list[pd.Timestamp | None],
-    args_dict: dict[str, Any],
-) -> list[pd.Timestamp | None]:
-    """PJM has a weird API. This method updates the date range list to account
-    for the following restrictions:
-
-     - date ranges cannot span year boundaries
-     - date ranges cannot span archive / standard boundaries
-     - date range is inclusive of start and end dates
-    """
-
-    archive_date = _get_pjm_archive_date(args_dict["market"])
-
-    new_dates: list[pd.Timestamp | None] = []
-
-    for i, date in enumerate(dates):
-        # stop if last date
-        if i + 1 == len(dates):
-            # add last date if new range has started
-            if new_dates[-1] is not None:
-                new_dates.append(date)
-
-            break
-
-        new_dates.append(date)
-
-        # restriction 1: year boundary
-        next_date = dates[i + 1]
-        if date is not None and next_date is not None:
-            for year in range(date.year, next_date.year):
-                current_year_end = pd.Timestamp(
-                    year=year,
-                    month=12,
-                    day=31,
-                    hour=23,
-                    minute=59,
-                    tz=args_dict["self"].default_timezone,
-                )
-                new_dates.append(current_year_end)
-                next_year_start = pd.Timestamp(
-                    year=year + 1,
-                    month=1,
-                    day=1,
-                    hour=0,
-                    minute=0,
-                    tz=args_dict["self"].default_timezone,
-                )
-
-                new_dates.append(None)  # signal to skip to next date
-
-                # dont need another range if the range ends at the start of the next year
-                if next_year_start != next_date:
-                    new_dates.append(next_year_start)
-
-    # remove trailing None
-    if new_dates[-1] is None:
-        new_dates = new_dates[:-1]
-
-    # restriction 2: archive / standard boundary
-    for i, date in enumerate(new_dates[:-1]):
-        next_date = new_dates[i + 1]
-        # check if archive date is between date and next_date
-        if None not in [date, next_date] and date < archive_date < next_date:
-            day_before_archive = archive_date - pd.Timedelta(days=1)
-            add_before = pd.Timestamp(
-                year=day_before_archive.year,
-                month=day_before_archive.month,
-                day=day_before_archive.day,
-                hour=23,
-                minute=59,
-                tz=args_dict["self"].default_timezone,
-            )
-
-            new_dates = (
-                new_dates[: i + 1]
-                + [
-                    add_before,
-                    None,
-                    archive_date,
-                ]
-                + new_dates[i + 1 :]
-            )
-
-    return new_dates
-
-
 # custom offset that I dont believe exists in pandas
 class DayBeginOffset:
     def __ladd__(self, other: pd.Timestamp) -> pd.Timestamp:
@@ -1,4 +1,9 @@
+import functools
+import hashlib
+import json
+import os
 import types
+from collections.abc import Callable, Mapping
 from datetime import date, datetime
 
 META_ENDPOINTS = {
@@ -38,8 +43,8 @@ datetime_formats.TIMESTAMP = "yyyy-MM-ddTH24:mm:ss"
 
 
 """
-_endpoints_map is lazily evaluated upon first usage
-its structure is as follows:
+endpoints maps are lazily evaluated upon first usage
+their structure is as follows:
 {
     endpoint_string: {
         "summary": a summary description
@@ -52,8 +57,23 @@ its structure is as follows:
         }
     }
 }
+
+They are built from an endpoints index, which has the same structure but maps
+each parameter_name directly to its value_type. The index is small and plain JSON,
+so it is cached on disk keyed by the hash of the API spec file it was built from.
+Parsers are looked up from the value_type when a parameter is used.
+
+Both are memoized for the process and shared by every caller, so they are returned
+as read-only mappings.
 """
-_endpoints_map: dict = None
+ENDPOINTS_INDEX_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "gridstatus",
+    "ercot_api",
+)
+
+# Bump when the layout of the on-disk endpoints index changes
+ENDPOINTS_INDEX_VERSION = 1
 
 
 def _timestamp_parser(timestamp: str | datetime) -> str:
@@ -82,6 +102,29 @@ def _bool_parser(boolvalue: str | bool) -> str:
         return boolvalue.lower()
 
 
+def _string_parser(value: str) -> str:
+    return value
+
+
+def _integer_parser(value: str | int) -> int:
+    return int(value)
+
+
+def _float_parser(value: str | float) -> float:
+    return float(value)
+
+
+VALUE_TYPE_PARSERS: dict[str, Callable] = {
+    "string": _string_parser,
+    "timestamp": _timestamp_parser,
+    "date": _date_parser,
+    "minute+second mm:ss": _minute_second_parser,
+    "boolean": _bool_parser,
+    "integer": _integer_parser,
+    "float": _float_parser,
+}
+
+
 def parse_all_endpoints(apijson: dict) -> dict:
     return {
         endpoint_string: _parse_endpoint_contents(contents)
@@ -112,24 +155,139 @@ def _parse_schema(schema: dict) -> tuple[str, callable]:
     """
     t = schema["type"]
     if t == "string":
-        if f := schema.get("format"):
-            if f == datetime_formats.TIMESTAMP:
-                return ("timestamp", _timestamp_parser)
-            elif f == datetime_formats.DATE:
-                return ("date", _date_parser)
-            elif f == datetime_formats.MINUTE_SECOND:
-                return ("minute+second mm:ss", _minute_second_parser)
-            else:
-                return ("string", lambda x: x)
+        f = schema.get("format")
+        if f == datetime_formats.TIMESTAMP:
+            value_type = "timestamp"
+        elif f == datetime_formats.DATE:
+            value_type = "date"
+        elif f == datetime_formats.MINUTE_SECOND:
+            value_type = "minute+second mm:ss"
         else:
-            return ("string", lambda x: x)
+            value_type = "string"
     elif t == "boolean":
-        return ("boolean", _bool_parser)
+        value_type = "boolean"
     elif t == "integer":
-        return ("integer", lambda i: int(i))
+        value_type = "integer"
     elif t == "number":
-        return ("float", lambda f: float(f))
+        value_type = "float"
     else:
         raise TypeError(
             f"unexpected schema type {schema['type']} and format {schema['format']}",
         )
+    return (value_type, VALUE_TYPE_PARSERS[value_type])
+
+
+def _read_only(value):
+    """Wraps nested dicts in read-only mappings"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({k: _read_only(v) for k, v in value.items()})
+    return value
+
+
+def _is_valid_endpoints_index(index) -> bool:
+    return isinstance(index, dict) and all(
+        isinstance(contents, dict)
+        and isinstance(contents.get("summary"), str)
+        and isinstance(contents.get("parameters"), dict)
+        and all(
+            value_type in VALUE_TYPE_PARSERS
+            for value_type in contents["parameters"].values()
+        )
+        for contents in index.values()
+    )
+
+
+def _read_endpoints_index_cache(cache_path: str, spec_digest: str) -> dict | None:
+    """Returns the index stored at cache_path, or None if it is missing or was not
+    written for this version of the index and spec"""
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(cache, dict)
+        or cache.get("version") != ENDPOINTS_INDEX_VERSION
+        or cache.get("spec_sha256") != spec_digest
+        or not _is_valid_endpoints_index(cache.get("endpoints"))
+    ):
+        return None
+
+    return cache["endpoints"]
+
+
+@functools.cache
+def get_endpoints_index(spec_path: str) -> Mapping:
+    """Returns the endpoints index for an API spec file.
+
+    The index is memoized for the process and written as JSON to
+    ENDPOINTS_INDEX_CACHE_DIR under the hash of the spec file, so the spec is only
+    parsed once per version. A cache file is only used if it records the same index
+    version and spec hash.
+    """
+    with open(spec_path, "rb") as spec_file:
+        spec_bytes = spec_file.read()
+
+    spec_name = os.path.splitext(os.path.basename(spec_path))[0]
+    digest = hashlib.sha256(spec_bytes).hexdigest()
+    cache_path = os.path.join(
+        ENDPOINTS_INDEX_CACHE_DIR,
+        f"{spec_name}-{digest[:16]}.json",
+    )
+
+    index = _read_endpoints_index_cache(cache_path, digest)
+    if index is not None:
+        return _read_only(index)
+
+    index = {
+        endpoint_string: {
+            "summary": contents["summary"],
+            "parameters": {
+                name: details["value_type"]
+                for name, details in contents["parameters"].items()
+            },
+        }
+        for endpoint_string, contents in parse_all_endpoints(
+            apijson=json.loads(spec_bytes),
+        ).items()
+    }
+
+    # The cache is only an optimization, so an unwritable cache dir is not an error
+    try:
+        os.makedirs(ENDPOINTS_INDEX_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(
+                {
+                    "version": ENDPOINTS_INDEX_VERSION,
+                    "spec_sha256": digest,
+                    "endpoints": index,
+                },
+                cache_file,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return _read_only(index)
+
+
+@functools.cache
+def get_endpoints_map(spec_path: str) -> Mapping:
+    """Returns the endpoints map for an API spec file, built from its index"""
+    return _read_only(
+        {
+            endpoint_string: {
+                "summary": contents["summary"],
+                "parameters": {
+                    name: {
+                        "value_type": value_type,
+                        "parser_method": VALUE_TYPE_PARSERS[value_type],
+                    }
+                    for name, value_type in contents["parameters"].items()
+                },
+            }
+            for endpoint_string, contents in get_endpoints_index(spec_path).items()
+        },
+    )
@@ -0,0 +1,512 @@
+import contextlib
+import gzip
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+import pandas as pd
+
+from gridstatus.base import NoDataFoundException
+from gridstatus.ercot_api.ercot_api import (
+    ARCHIVE_LISTING_CACHE_SETTLE_TIME,
+    ARCHIVE_LISTING_COLUMNS,
+    APITypeEnum,
+    ErcotAPI,
+)
+from gridstatus.gs_logging import logger
+
+# Columns of the mirror manifest. filename is the name ERCOT gave the document in the
+# bulk download, which downstream parsing uses to detect DST (xhr) files
+MIRROR_MANIFEST_COLUMNS = [*ARCHIVE_LISTING_COLUMNS, "filename"]
+
+# How long a writer waits for another writer of the same product to finish
+MIRROR_LOCK_TIMEOUT_SECONDS = 600
+
+# A lock that has not been touched for this long belongs to a writer that died
+MIRROR_STALE_LOCK_SECONDS = 3600
+
+# Pruned documents are removed from the manifest right away but their files are only
+# deleted by a prune at least this long after, so readers still working from an
+# older manifest can finish reading them
+MIRROR_PRUNE_GRACE_SECONDS = 3600
+
+# Bump when the layout of the manifest or the pending deletions changes. A file of
+# another version is not read, so the product is mirrored again from scratch
+MIRROR_MANIFEST_VERSION = 1
+
+
+def _is_string_table(table, columns: list[str]) -> bool:
+    """Whether table is a dict of equally long lists of strings, one per column"""
+    return (
+        isinstance(table, dict)
+        and sorted(table) == sorted(columns)
+        and all(isinstance(table[column], list) for column in columns)
+        and len({len(table[column]) for column in columns}) <= 1
+        and all(isinstance(value, str) for column in columns for value in table[column])
+    )
+
+
+def _is_valid_manifest(manifest) -> bool:
+    if not (
+        isinstance(manifest, dict)
+        and manifest.get("version") == MIRROR_MANIFEST_VERSION
+        and _is_string_table(manifest.get("archives"), MIRROR_MANIFEST_COLUMNS)
+        and manifest.get("api") in list(APITypeEnum)
+    ):
+        return False
+
+    covered_start = manifest.get("covered_start")
+    covered_end = manifest.get("covered_end")
+    if covered_start is None or covered_end is None:
+        return covered_start is None and covered_end is None
+
+    try:
+        return pd.Timestamp(covered_start) <= pd.Timestamp(covered_end)
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_valid_pending_deletions(pending) -> bool:
+    return (
+        isinstance(pending, dict)
+        and pending.get("version") == MIRROR_MANIFEST_VERSION
+        and isinstance(pending.get("docId"), list)
+        and isinstance(pending.get("prunedAt"), list)
+        and len(pending["docId"]) == len(pending["prunedAt"])
+        and all(isinstance(doc_id, str) for doc_id in pending["docId"])
+        and all(
+            isinstance(pruned_at, int | float) and not isinstance(pruned_at, bool)
+            for pruned_at in pending["prunedAt"]
+        )
+    )
+
+
+class ErcotArchiveMirror:
+    """Local mirror of ERCOT API archives.
+
+    Each product (emil_id) is stored in its own directory under directory as the
+    raw zip files ERCOT publishes, plus a manifest of (docId, postDatetime, href,
+    filename) and the post datetime window the mirror covers. sync downloads the
+    archives posted since the last synced postDatetime. Documents are only parsed
+    when queried.
+
+    Pass the mirror to ErcotAPI with archive_mirror= so that historical queries
+    whose post datetime window the mirror covers are read from disk instead of
+    downloaded:
+
+        mirror = ErcotArchiveMirror("/data/ercot")
+        ercot_api = ErcotAPI(archive_mirror=mirror)
+        mirror.sync(ercot_api, LMP_BY_BUS_ENDPOINT, start="2024-01-01")
+
+    Any number of processes can read from the mirror while it is being synced or
+    pruned: documents and the manifest are swapped in atomically, writers for the
+    same product are serialized with a lock file, and pruned files are only deleted
+    MIRROR_PRUNE_GRACE_SECONDS after they leave the manifest.
+
+    A product is mirrored from one API, public by default. The API is recorded in the
+    manifest, and the mirror only serves queries made to the same API.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def sync(
+        self,
+        ercot_api: ErcotAPI,
+        endpoint: str,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        verbose: bool = False,
+        api: APITypeEnum = APITypeEnum.PUBLIC_API,
+    ) -> int:
+        """Downloads the archives of the endpoint's product that are not mirrored yet.
+
+        Arguments:
+            ercot_api: the client used to list and download the archives
+            endpoint: an ERCOT API endpoint or emil_id, e.g. "/np6-787-cd/lmp_electrical_bus"
+            start: the post datetime to start mirroring from. Required the first time
+                a product is synced. Afterwards, syncing continues from the last
+                synced postDatetime, and an earlier start backfills the mirror.
+            end: the post datetime to mirror up to. Defaults to now.
+            verbose: if True, will print out status messages
+            api: the API the product is listed and downloaded from. Must be the
+                same for every sync of a product.
+
+        Returns:
+            int: the number of documents added to the mirror
+        """
+        emil_id = self._emil_id(endpoint)
+
+        with self._writer_lock(emil_id) as touch_lock:
+            manifest, covered_start, covered_end, mirrored_api = self._read_manifest(
+                emil_id,
+            )
+
+            if covered_start is None and start is None:
+                raise ValueError(
+                    f"start is required for the first sync of {emil_id}",
+                )
+            if mirrored_api is not None and mirrored_api != api:
+                raise ValueError(
+                    f"{emil_id} is mirrored from the {mirrored_api} API, not {api}",
+                )
+
+            start, end = ercot_api._post_datetime_window(
+                start if start is not None else covered_start,
+                end,
+            )
+
+            windows = []
+            if covered_start is None:
+                windows.append((start, end))
+            else:
+                if start < covered_start:
+                    windows.append((start, covered_start))
+                if end > covered_end:
+                    windows.append((covered_end, end))
+
+            listing = pd.concat(
+                [
+                    ercot_api._list_archives(
+                        emil_id,
+                        window_start,
+                        window_end,
+                        verbose,
+                        api=api,
+                    )
+                    for window_start, window_end in windows
+                ]
+                or [pd.DataFrame(columns=ARCHIVE_LISTING_COLUMNS)],
+                ignore_index=True,
+            )
+            listing = listing[~listing["docId"].isin(manifest["docId"])]
+            listing = listing.drop_duplicates(subset="docId")
+
+            logger.info(f"Mirroring {len(listing)} new archives for {emil_id}")
+
+            docs_dir = self._docs_dir(emil_id)
+            os.makedirs(docs_dir, exist_ok=True)
+
+            offset = 0
+            for documents in ercot_api._iter_bulk_download_documents(
+                doc_ids=listing["docId"].tolist(),
+                emil_id=emil_id,
+                api=api,
+            ):
+                batch = listing.iloc[offset : offset + len(documents)].copy()
+                batch["filename"] = [filename for _, filename in documents]
+
+                for (bytes_data, _), doc_id in zip(documents, batch["docId"]):
+                    self._write_atomically(
+                        os.path.join(docs_dir, f"{doc_id}.zip"),
+                        bytes_data.getvalue(),
+                    )
+
+                # Record progress after every batch so an interrupted sync does not
+                # download the same documents again
+                manifest = pd.concat([manifest, batch], ignore_index=True)
+                self._write_manifest(
+                    emil_id,
+                    manifest,
+                    covered_start,
+                    covered_end,
+                    api,
+                )
+                touch_lock()
+                offset += len(documents)
+
+            settled_end = min(
+                end,
+                ercot_api._local_now().tz_localize(None)
+                - ARCHIVE_LISTING_CACHE_SETTLE_TIME,
+            )
+            new_covered_start = (
+                start if covered_start is None else min(start, covered_start)
+            )
+            new_covered_end = (
+                settled_end if covered_end is None else max(settled_end, covered_end)
+            )
+            if new_covered_end > new_covered_start:
+                self._write_manifest(
+                    emil_id,
+                    manifest,
+                    new_covered_start,
+                    new_covered_end,
+                    api,
+                )
+
+        return len(listing)
+
+    def prune(self, endpoint: str, max_age: str | pd.Timedelta) -> int:
+        """Removes mirrored documents posted more than max_age ago from the mirror.
+
+        The documents leave the manifest right away. Their files are deleted by the
+        first prune at least MIRROR_PRUNE_GRACE_SECONDS later, so readers that loaded
+        the manifest before this prune can still read them.
+
+        Returns:
+            int: the number of documents removed
+        """
+        emil_id = self._emil_id(endpoint)
+
+        with self._writer_lock(emil_id):
+            manifest, covered_start, covered_end, api = self._read_manifest(emil_id)
+            if covered_start is None:
+                return 0
+
+            cutoff = pd.Timestamp.now(tz=ErcotAPI.default_timezone).tz_localize(
+                None,
+            ) - pd.Timedelta(max_age)
+            expired = self._post_datetimes(manifest) < cutoff
+
+            now = time.time()
+            pending = self._read_pending_deletions(emil_id)
+            # A document synced again since it was pruned is back in the manifest, so
+            # it is either kept or pruned again with a new grace period
+            pending = pending[~pending["docId"].isin(manifest["docId"])]
+            due = pending["prunedAt"] <= now - MIRROR_PRUNE_GRACE_SECONDS
+            due_doc_ids = pending.loc[due, "docId"].tolist()
+            pending = pd.concat(
+                [
+                    pending[~due],
+                    pd.DataFrame(
+                        {
+                            "docId": manifest.loc[expired, "docId"],
+                            "prunedAt": now,
+                        },
+                    ),
+                ],
+                ignore_index=True,
+            )
+
+            # The manifest is updated before anything is deleted so new readers
+            # never see documents that are about to disappear
+            self._write_manifest(
+                emil_id,
+                manifest[~expired],
+                max(covered_start, cutoff),
+                max(covered_end, cutoff),
+                api,
+            )
+            self._write_pending_deletions(emil_id, pending)
+
+            for doc_id in due_doc_ids:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(os.path.join(self._docs_dir(emil_id), f"{doc_id}.zip"))
+
+        return int(expired.sum())
+
+    def covers(
+        self,
+        emil_id: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        api: APITypeEnum = APITypeEnum.PUBLIC_API,
+    ) -> bool:
+        """Whether the mirror holds every archive of the product posted from start to
+        end (naive ERCOT local times), as listed by the given API"""
+        _, covered_start, covered_end, mirrored_api = self._read_manifest(emil_id)
+
+        return (
+            mirrored_api == api
+            and covered_start is not None
+            and covered_start <= start
+            and end <= covered_end
+        )
+
+    def iter_documents(
+        self,
+        emil_id: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        batch_size: int,
+    ) -> Iterator[list[tuple[pd.io.common.BytesIO, str, str, str]]]:
+        """Yields batches of (bytes, filename, postDatetime, href) of the mirrored
+        documents posted from start to end, in the same form as
+        ErcotAPI._iter_historical_documents"""
+        manifest, _, _, _ = self._read_manifest(emil_id)
+        post_datetimes = self._post_datetimes(manifest)
+        manifest = manifest[(post_datetimes >= start) & (post_datetimes <= end)]
+
+        if manifest.empty:
+            raise NoDataFoundException(
+                f"No mirrored archives found for {emil_id} with time range "
+                f"{start} to {end}",
+            )
+
+        docs_dir = self._docs_dir(emil_id)
+        for i in range(0, len(manifest), batch_size):
+            batch = []
+            for doc in manifest.iloc[i : i + batch_size].itertuples(index=False):
+                with open(os.path.join(docs_dir, f"{doc.docId}.zip"), "rb") as f:
+                    bytes_data = pd.io.common.BytesIO(f.read())
+                batch.append((bytes_data, doc.filename, doc.postDatetime, doc.href))
+            yield batch
+
+    def _emil_id(self, endpoint: str) -> str:
+        return endpoint.strip("/").split("/")[0]
+
+    def _emil_dir(self, emil_id: str) -> str:
+        return os.path.join(self.directory, emil_id)
+
+    def _docs_dir(self, emil_id: str) -> str:
+        return os.path.join(self._emil_dir(emil_id), "docs")
+
+    def _manifest_path(self, emil_id: str) -> str:
+        return os.path.join(self._emil_dir(emil_id), "manifest.json.gz")
+
+    def _pending_deletions_path(self, emil_id: str) -> str:
+        return os.path.join(self._emil_dir(emil_id), "pending_deletions.json.gz")
+
+    def _post_datetimes(self, manifest: pd.DataFrame) -> pd.Series:
+        return pd.to_datetime(manifest["postDatetime"], format="ISO8601")
+
+    def _read_manifest(
+        self,
+        emil_id: str,
+    ) -> tuple[
+        pd.DataFrame,
+        pd.Timestamp | None,
+        pd.Timestamp | None,
+        APITypeEnum | None,
+    ]:
+        """Returns the mirrored documents, the covered post datetime window and the
+        API of the product. A product without a valid manifest has no documents and
+        covers nothing."""
+        manifest = self._read_json(self._manifest_path(emil_id), _is_valid_manifest)
+        if manifest is None:
+            return pd.DataFrame(columns=MIRROR_MANIFEST_COLUMNS), None, None, None
+
+        covered_start = manifest["covered_start"]
+        covered_end = manifest["covered_end"]
+        return (
+            pd.DataFrame(manifest["archives"], columns=MIRROR_MANIFEST_COLUMNS),
+            None if covered_start is None else pd.Timestamp(covered_start),
+            None if covered_end is None else pd.Timestamp(covered_end),
+            APITypeEnum(manifest["api"]),
+        )
+
+    def _write_manifest(
+        self,
+        emil_id: str,
+        manifest: pd.DataFrame,
+        covered_start: pd.Timestamp | None,
+        covered_end: pd.Timestamp | None,
+        api: APITypeEnum,
+    ) -> None:
+        self._write_json(
+            self._manifest_path(emil_id),
+            {
+                "version": MIRROR_MANIFEST_VERSION,
+                "archives": manifest[MIRROR_MANIFEST_COLUMNS].to_dict("list"),
+                "covered_start": None
+                if covered_start is None
+                else covered_start.isoformat(),
+                "covered_end": None if covered_end is None else covered_end.isoformat(),
+                "api": str(api),
+            },
+        )
+
+    def _read_pending_deletions(self, emil_id: str) -> pd.DataFrame:
+        """Returns the (docId, prunedAt) of the pruned documents whose files have not
+        been deleted yet. prunedAt is a unix time in seconds."""
+        pending = self._read_json(
+            self._pending_deletions_path(emil_id),
+            _is_valid_pending_deletions,
+        )
+        return pd.DataFrame(
+            {
+                "docId": pd.Series(
+                    [] if pending is None else pending["docId"],
+                    dtype=object,
+                ),
+                "prunedAt": pd.Series(
+                    [] if pending is None else pending["prunedAt"],
+                    dtype=float,
+                ),
+            },
+        )
+
+    def _write_pending_deletions(self, emil_id: str, pending: pd.DataFrame) -> None:
+        self._write_json(
+            self._pending_deletions_path(emil_id),
+            {
+                "version": MIRROR_MANIFEST_VERSION,
+                "docId": pending["docId"].tolist(),
+                "prunedAt": pending["prunedAt"].astype(float).tolist(),
+            },
+        )
+
+    def _read_json(self, path: str, is_valid: Callable[[object], bool]) -> dict | None:
+        """Returns the gzipped JSON stored at path, or None if it is missing or does
+        not pass is_valid"""
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring unreadable mirror file {path}")
+            return None
+
+        if not is_valid(content):
+            logger.warning(f"Ignoring mirror file {path} of another version or layout")
+            return None
+
+        return content
+
+    def _write_json(self, path: str, content: dict) -> None:
+        tmp_path = self._tmp_path(path)
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(content, f)
+        os.replace(tmp_path, path)
+
+    def _write_atomically(self, path: str, content: bytes) -> None:
+        tmp_path = self._tmp_path(path)
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def _tmp_path(self, path: str) -> str:
+        return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    @contextlib.contextmanager
+    def _writer_lock(self, emil_id: str) -> Iterator[Callable[[], None]]:
+        """Serializes writers of one product across processes with a lock file.
+
+        Yields a function that refreshes the lock so long syncs are not mistaken
+        for a writer that died."""
+        os.makedirs(self._emil_dir(emil_id), exist_ok=True)
+        lock_path = os.path.join(self._emil_dir(emil_id), ".lock")
+        deadline = time.monotonic() + MIRROR_LOCK_TIMEOUT_SECONDS
+
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    lock_age = time.time() - os.path.getmtime(lock_path)
+                except FileNotFoundError:
+                    continue
+
+                if lock_age > MIRROR_STALE_LOCK_SECONDS:
+                    logger.warning(f"Removing stale mirror lock {lock_path}")
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(lock_path)
+                    continue
+
+                if time.monotonic() > deadline:
+                    raise TimeoutError(
+                        f"Timed out waiting for another writer to release {lock_path}",
+                    )
+
+                time.sleep(1)
+
+        try:
+            yield lambda: os.utime(lock_path)
+        finally:
+            os.close(fd)
+            os.remove(lock_path)
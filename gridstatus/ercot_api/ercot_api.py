@@ -1,9 +1,15 @@
 import argparse
+import functools
+import gzip
 import json
 import os
 import random
+import threading
 import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import StrEnum
+from typing import TYPE_CHECKING, TypeVar
 from zipfile import ZipFile
 
 import pandas as pd
@@ -20,7 +26,12 @@ from gridstatus.ercot import (
     Ercot,
 )
 from gridstatus.ercot_60d_utils import CurveOutputFormat
-from gridstatus.ercot_api.api_parser import _timestamp_parser, parse_all_endpoints
+from gridstatus.ercot_api.api_parser import (
+    VALUE_TYPE_PARSERS,
+    _timestamp_parser,
+    get_endpoints_index,
+    get_endpoints_map,
+)
 from gridstatus.ercot_constants import (
     LOAD_FORECAST_BY_MODEL_COLUMNS,
     SOLAR_ACTUAL_AND_FORECAST_BY_GEOGRAPHICAL_REGION_COLUMNS,
@@ -30,12 +41,87 @@ from gridstatus.ercot_constants import (
 )
 from gridstatus.gs_logging import logger
 
+if TYPE_CHECKING:
+    from gridstatus.ercot_api.archive_mirror import ErcotArchiveMirror
+
 # API to hit with subscription key to get token
 TOKEN_URL = "https://ercotb2c.b2clogin.com/ercotb2c.onmicrosoft.com/B2C_1_PUBAPI-ROPC-FLOW/oauth2/v2.0/token"
 
 PUBLIC_BASE_URL = "https://api.ercot.com/api/public-reports"
 ESR_BASE_URL = "https://api.ercot.com/api/public-data"
 
+T = TypeVar("T")
+
+
+def _merge_windows(
+    windows: list[tuple[pd.Timestamp, pd.Timestamp]],
+) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    """Sorts (start, end) windows and merges the ones that overlap or touch. Windows
+    separated by a gap stay separate."""
+    merged = []
+    for window_start, window_end in sorted(windows):
+        if merged and window_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], window_end))
+        else:
+            merged.append((window_start, window_end))
+
+    return merged
+
+
+def _uncovered_windows(
+    windows: list[tuple[pd.Timestamp, pd.Timestamp]],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    """Returns the parts of start to end that no window in windows covers."""
+    uncovered = []
+    cursor = start
+    for window_start, window_end in _merge_windows(windows):
+        if window_end <= cursor:
+            continue
+        if window_start >= end:
+            break
+        if window_start > cursor:
+            uncovered.append((cursor, window_start))
+        cursor = window_end
+    if cursor < end:
+        uncovered.append((cursor, end))
+
+    return uncovered
+
+
+def _is_valid_archive_listing_cache(cache) -> bool:
+    if not isinstance(cache, dict) or cache.get("version") != (
+        ARCHIVE_LISTING_CACHE_VERSION
+    ):
+        return False
+
+    archives = cache.get("archives")
+    windows = cache.get("covered_windows")
+    if not (
+        isinstance(archives, dict)
+        and sorted(archives) == sorted(ARCHIVE_LISTING_COLUMNS)
+        and isinstance(windows, list)
+    ):
+        return False
+
+    columns = [archives[column] for column in ARCHIVE_LISTING_COLUMNS]
+    if not all(
+        isinstance(values, list)
+        and len(values) == len(columns[0])
+        and all(isinstance(value, str) for value in values)
+        for values in columns
+    ):
+        return False
+
+    try:
+        return all(
+            pd.Timestamp(window_start) <= pd.Timestamp(window_end)
+            for window_start, window_end in windows
+        )
+    except (TypeError, ValueError):
+        return False
+
 
 class APITypeEnum(StrEnum):
     PUBLIC_API = "public"
@@ -45,6 +131,13 @@ class APITypeEnum(StrEnum):
 # How long a token lasts for before needing to be refreshed
 TOKEN_EXPIRATION_SECONDS = 3600
 
+# Tokens are refreshed this long before they expire so that requests in flight never
+# carry an expired token
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# From the docs
+CLIENT_ID = "fec253ea-0d06-4272-a5e6-b478baeecd70"
+
 # Timeout for API requests in seconds (connect, read)
 CONNECT_TIMEOUT_SECONDS = 10
 READ_TIMEOUT_SECONDS = 15
@@ -53,6 +146,18 @@ REQUEST_TIMEOUT = (CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS)
 # Number of historical links to fetch at once. The max is 1_000
 DEFAULT_HISTORICAL_SIZE = 1_000
 
+# Columns of the archive listing table, which is also the layout of the on-disk
+# listing cache
+ARCHIVE_LISTING_COLUMNS = ["docId", "postDatetime", "href"]
+
+# Bump when the layout of the on-disk listing cache changes, so that older caches
+# are listed again instead of being misread
+ARCHIVE_LISTING_CACHE_VERSION = 1
+
+# Archives posted within this long before a listing request are not marked as
+# covered by the listing cache, in case ERCOT is still posting them
+ARCHIVE_LISTING_CACHE_SETTLE_TIME = pd.Timedelta(hours=1)
+
 # Number of results to fetch per page. It's not clear what the max is (1_000_000 works)
 DEFAULT_PAGE_SIZE = 100_000
 
@@ -147,6 +252,14 @@ SETTLEMENT_POINT_PRICE_REAL_TIME_15_MIN = "/np6-905-cd/spp_node_zone_hub"
 # Day ahead settlement point prices
 # https://data.ercot.com/data-product-archive/NP4-190-CD
 SPP_DAY_AHEAD_HOURLY = "/np4-190-cd/dam_stlmnt_pnt_prices"
+# Columns of the SPP_DAY_AHEAD_HOURLY archive CSVs
+SPP_DAY_AHEAD_HOURLY_ARCHIVE_COLUMNS = [
+    "DeliveryDate",
+    "HourEnding",
+    "SettlementPoint",
+    "SettlementPointPrice",
+    "DSTFlag",
+]
 
 
 # For the disclosure files, any of the files that are in the zipfile will return
@@ -179,6 +292,128 @@ DAM_ASDC_AGGREGATED_ENDPOINT = f"/{DAM_ASDC_AGGREGATED_EMIL_ID}"
 ESR_ENDPOINT = "/rptesr-m/4_sec_esr_charging_mw"
 
 
+class ErcotTokenManager:
+    """Obtains and refreshes the id token used to authenticate with the ERCOT API.
+
+    Tokens are refreshed TOKEN_REFRESH_MARGIN_SECONDS before they expire, and
+    refreshes are serialized with a lock so that concurrent requests trigger at most
+    one call to the token endpoint. Pass the same instance to several ErcotAPI
+    instances with the token_manager argument to share one token between them.
+
+    If cache_file is given, the token is also written to that file (readable only by
+    the current user) and other processes using the same file and username reuse it
+    until it is due for a refresh.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        cache_file: str | None = None,
+        token_url: str = TOKEN_URL,
+        client_id: str = CLIENT_ID,
+    ):
+        self.username = username
+        self.password = password
+        self.cache_file = cache_file
+        self.token_url = token_url
+        self.client_id = client_id
+        self.token = None
+        self.token_expiry = None
+        self._lock = threading.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self.token is not None
+            and time.time() < self.token_expiry - TOKEN_REFRESH_MARGIN_SECONDS
+        )
+
+    def get_token(self) -> str:
+        """Returns a token that is not close to expiring, refreshing it if needed"""
+        if not self._is_fresh():
+            with self._lock:
+                # Another thread may have refreshed while we waited for the lock
+                if not self._is_fresh() and not self._load_cached_token():
+                    self.refresh()
+
+        return self.token
+
+    def refresh(self) -> None:
+        """Requests a new token from the token endpoint"""
+        payload = {
+            "grant_type": "password",
+            "username": self.username,
+            "password": self.password,
+            "response_type": "id_token",
+            "scope": f"openid {self.client_id} offline_access",
+            "client_id": self.client_id,
+        }
+
+        response = requests.post(
+            self.token_url,
+            data=payload,
+            timeout=REQUEST_TIMEOUT,
+        )
+        response_data = response.json()
+
+        if "id_token" not in response_data:
+            raise Exception("Failed to obtain token")
+
+        self.token = response_data["id_token"]
+        self.token_expiry = time.time() + int(
+            response_data.get("expires_in", TOKEN_EXPIRATION_SECONDS),
+        )
+        self._write_cached_token()
+
+    def _load_cached_token(self) -> bool:
+        """Loads the token from cache_file if it belongs to this username and is
+        fresh. Returns whether it was loaded."""
+        if self.cache_file is None:
+            return False
+
+        try:
+            with open(self.cache_file) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if cached.get("username") != self.username:
+            return False
+
+        self.token = cached.get("token")
+        self.token_expiry = cached.get("token_expiry")
+
+        if self.token is None or self.token_expiry is None or not self._is_fresh():
+            self.token = None
+            self.token_expiry = None
+            return False
+
+        return True
+
+    def _write_cached_token(self) -> None:
+        if self.cache_file is None:
+            return
+
+        cache_dir = os.path.dirname(self.cache_file)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        # Write to a temporary file and swap it in so other processes never read a
+        # partially written token
+        tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "username": self.username,
+                    "token": self.token,
+                    "token_expiry": self.token_expiry,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.cache_file)
+
+
 class ErcotAPI:
     """
     Class to authenticate with and make requests to the ERCOT Data API (api.ercot.com)
@@ -202,6 +437,11 @@ class ErcotAPI:
         sleep_seconds: float = 0.2,
         max_retries: int = 3,
         batch_size: int = 1000,
+        max_workers: int = 4,
+        archive_listing_cache_dir: str | None = None,
+        token_manager: ErcotTokenManager | None = None,
+        token_cache_file: str | None = None,
+        archive_mirror: "ErcotArchiveMirror | None" = None,
     ):
         self.username = username or os.getenv("ERCOT_API_USERNAME")
         self.password = password or os.getenv("ERCOT_API_PASSWORD")
@@ -223,19 +463,43 @@ class ErcotAPI:
                 "Username, password, and subscription key must be provided or set as environment variables",
             )
 
-        self.client_id = "fec253ea-0d06-4272-a5e6-b478baeecd70"  # From the docs
-        self.public_endpoints_map = self._get_public_endpoints_map()
-        self.esr_endpoints_map = self._get_esr_endpoints_map()
+        self.client_id = CLIENT_ID
         self.token_url = TOKEN_URL
-        self.token = None
-        self.token_expiry = None
-        self.ercot = Ercot()
+        # The token manager can be shared between instances so they reuse one token
+        self.token_manager = token_manager or ErcotTokenManager(
+            username=self.username,
+            password=self.password,
+            cache_file=token_cache_file,
+            token_url=self.token_url,
+            client_id=self.client_id,
+        )
 
         self.sleep_seconds = sleep_seconds
         self.initial_delay = min(max(0.1, sleep_seconds), 60.0)
         self.max_retries = min(max(0, max_retries), 10)
         # maximum batch size support by ERCOT API is 1000
         self.batch_size = min(max(1, batch_size), 1_000)
+        # Requests issued concurrently (e.g. pages of hit_ercot_api) share one rate
+        # budget of one request start every sleep_seconds
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = utils.RateLimiter(min_interval_seconds=sleep_seconds)
+        # When set, archive listings are cached on disk per emil_id so repeated
+        # historical queries only list archives posted since the last query
+        self.archive_listing_cache_dir = archive_listing_cache_dir
+        # Historical queries the mirror covers are read from disk
+        self.archive_mirror = archive_mirror
+
+    @functools.cached_property
+    def ercot(self) -> Ercot:
+        return Ercot()
+
+    @property
+    def public_endpoints_map(self) -> Mapping:
+        return self._get_public_endpoints_map()
+
+    @property
+    def esr_endpoints_map(self) -> Mapping:
+        return self._get_esr_endpoints_map()
 
     def _local_now(self):
         return pd.Timestamp("now", tz=self.default_timezone)
@@ -264,40 +528,26 @@ class ErcotAPI:
 
         return end
 
-    def get_token(self):
-        payload = {
-            "grant_type": "password",
-            "username": self.username,
-            "password": self.password,
-            "response_type": "id_token",
-            "scope": "openid fec253ea-0d06-4272-a5e6-b478baeecd70 offline_access",
-            "client_id": self.client_id,
-        }
+    @property
+    def token(self) -> str | None:
+        return self.token_manager.token
 
-        response = requests.post(
-            self.token_url,
-            data=payload,
-            timeout=REQUEST_TIMEOUT,
-        )
-        response_data = response.json()
+    @property
+    def token_expiry(self) -> float | None:
+        return self.token_manager.token_expiry
 
-        if "id_token" in response_data:
-            self.token = response_data["id_token"]
-            self.token_expiry = time.time() + TOKEN_EXPIRATION_SECONDS
-
-        else:
-            raise Exception("Failed to obtain token")
+    def get_token(self):
+        self.token_manager.refresh()
 
     def refresh_token_if_needed(self):
-        if not self.token or time.time() >= self.token_expiry:
-            self.get_token()
+        self.token_manager.get_token()
 
     def headers(self, api: APITypeEnum = APITypeEnum.PUBLIC_API) -> dict[str, str]:
-        self.refresh_token_if_needed()
+        token = self.token_manager.get_token()
 
         # Both forms of authentication are required
         headers = {
-            "Authorization": f"Bearer {self.token}",
+            "Authorization": f"Bearer {token}",
             "Ocp-Apim-Subscription-Key": self.public_subscription_key
             if api == APITypeEnum.PUBLIC_API
             else self.esr_subscription_key,
@@ -324,6 +574,7 @@ class ErcotAPI:
         delay = self.initial_delay
         reason = ""
         while retries <= self.max_retries:
+            self.rate_limiter.wait()
             try:
                 if method == "POST":
                     response = requests.post(
@@ -365,6 +616,9 @@ class ErcotAPI:
                 f" {retries}/{self.max_retries}"
                 f" requesting url: {url} with params: {api_params}",
             )
+            if reason == "Rate-limited":
+                # Hold back the other threads sharing this rate budget as well
+                self.rate_limiter.penalize(delay)
             time.sleep(delay + random.uniform(0, delay * 0.1))
             delay *= 2
 
@@ -1223,7 +1477,6 @@ class ErcotAPI:
                     verbose=verbose,
                 ),
             )
-            time.sleep(self.sleep_seconds)
 
         if not dfs:
             raise NoDataFoundException(
@@ -1446,28 +1699,36 @@ class ErcotAPI:
             date = pd.Timestamp.now(tz=self.default_timezone) - pd.Timedelta(minutes=15)
             end = None
 
-        if self._should_use_historical(date):
-            end = self._handle_end_date(date, end, days_to_add_if_no_end=1)
-            data = self.get_historical_data(
+        def get_historical(start, end):
+            return self.get_historical_data(
                 endpoint=LMP_BY_BUS_ENDPOINT,
-                start_date=date,
+                start_date=start,
                 end_date=end,
                 verbose=verbose,
             )
-        else:
+
+        def get_live(start, end):
             api_params = {
-                "SCEDTimestampFrom": date,
+                "SCEDTimestampFrom": start,
                 "SCEDTimestampTo": end,
             }
 
-            data = self.hit_ercot_api(
+            return self.hit_ercot_api(
                 endpoint=LMP_BY_BUS_ENDPOINT,
                 page_size=DEFAULT_PAGE_SIZE,
                 verbose=verbose,
                 **api_params,
             )
 
-        return self._handle_lmp_by_bus(data, verbose=verbose)
+        return self._get_hybrid_data(
+            date,
+            end,
+            get_historical=get_historical,
+            get_live=get_live,
+            handle=lambda data: self._handle_lmp_by_bus(data, verbose=verbose),
+            sort_columns=["SCED Timestamp", "Location"],
+            subset=["SCED Timestamp", "Location"],
+        )
 
     def _handle_lmp_by_bus(self, data, verbose=False):
         data = self.ercot._handle_sced_timestamp(data, verbose=verbose)
@@ -1605,27 +1866,37 @@ class ErcotAPI:
         # date plus one if it is not provided.
         end = self._handle_end_date(date, end, days_to_add_if_no_end=1)
 
-        if self._should_use_historical(date):
-            data = self.get_historical_data(
+        def get_historical(start, end):
+            return self.get_historical_data(
                 endpoint=SHADOW_PRICES_SCED_ENDPOINT,
-                start_date=date,
+                start_date=start,
                 end_date=end,
                 verbose=verbose,
             )
-        else:
+
+        def get_live(start, end):
             api_params = {
-                "SCEDTimestampFrom": date,
+                "SCEDTimestampFrom": start,
                 "SCEDTimestampTo": end,
             }
 
-            data = self.hit_ercot_api(
+            return self.hit_ercot_api(
                 endpoint=SHADOW_PRICES_SCED_ENDPOINT,
                 page_size=DEFAULT_PAGE_SIZE,
                 verbose=verbose,
                 **api_params,
             )
 
-        return self._handle_shadow_prices_sced(data, verbose=verbose)
+        # Constraints can repeat within a SCED run, so only identical rows are
+        # duplicates
+        return self._get_hybrid_data(
+            date,
+            end,
+            get_historical=get_historical,
+            get_live=get_live,
+            handle=lambda data: self._handle_shadow_prices_sced(data, verbose=verbose),
+            sort_columns=["SCED Timestamp", "Constraint ID"],
+        )
 
     def _handle_shadow_prices_sced(
         self,
@@ -1711,28 +1982,87 @@ class ErcotAPI:
 
         end = self._handle_end_date(date, end, days_to_add_if_no_end=1)
 
-        # Subtract 1 from the dates because this is published day-ahead
-        date = date - pd.Timedelta(days=1)
-        end = end - pd.Timedelta(days=1)
+        def get_historical(start, end):
+            # Subtract 1 from the dates because the archives are filtered by posted
+            # date and this is published day-ahead
+            return self.get_historical_data(
+                endpoint=SPP_DAY_AHEAD_HOURLY,
+                start_date=start - pd.Timedelta(days=1),
+                end_date=end - pd.Timedelta(days=1),
+                verbose=verbose,
+            )
 
-        data = self.get_historical_data(
-            endpoint=SPP_DAY_AHEAD_HOURLY,
-            start_date=date,
-            end_date=end,
-            verbose=verbose,
-        )
+        def get_live(start, end):
+            api_params = {
+                "deliveryDateFrom": start,
+                # Subtract off one second to avoid including the end date
+                "deliveryDateTo": end - pd.Timedelta(seconds=1),
+            }
 
-        data = Ercot().parse_doc(data, verbose=verbose)
+            return self._spp_day_ahead_hourly_live_to_archive_format(
+                self.hit_ercot_api(
+                    endpoint=SPP_DAY_AHEAD_HOURLY,
+                    page_size=DEFAULT_PAGE_SIZE,
+                    verbose=verbose,
+                    **api_params,
+                ),
+            )
 
-        data = Ercot()._finalize_spp_df(
-            data,
-            market=Markets.DAY_AHEAD_HOURLY,
-            locations="ALL",
-            location_type="ALL",
-            verbose=verbose,
+        def handle(data):
+            data = Ercot().parse_doc(data, verbose=verbose)
+
+            return Ercot()._finalize_spp_df(
+                data,
+                market=Markets.DAY_AHEAD_HOURLY,
+                locations="ALL",
+                location_type="ALL",
+                verbose=verbose,
+            )
+
+        return self._get_hybrid_data(
+            date,
+            end,
+            get_historical=get_historical,
+            get_live=get_live,
+            handle=handle,
+            sort_columns=["Interval Start", "Location"],
+            subset=["Interval Start", "Location"],
         )
 
-        return data.sort_values(["Interval Start", "Location"]).reset_index(drop=True)
+    def _spp_day_ahead_hourly_live_to_archive_format(
+        self,
+        data: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """Converts day ahead SPPs from the live API to the columns and formats of the
+        archive CSVs, which is what Ercot.parse_doc expects. The live API returns ISO
+        delivery dates and a boolean DSTFlag, while the archives use MM/DD/YYYY and
+        Y/N."""
+        missing = [
+            column
+            for column in SPP_DAY_AHEAD_HOURLY_ARCHIVE_COLUMNS
+            if column not in data.columns
+        ]
+        if missing:
+            raise ValueError(
+                f"{SPP_DAY_AHEAD_HOURLY} returned unexpected columns "
+                f"{data.columns.tolist()}, missing {missing}",
+            )
+
+        data = data[SPP_DAY_AHEAD_HOURLY_ARCHIVE_COLUMNS].copy()
+
+        data["DeliveryDate"] = pd.to_datetime(
+            data["DeliveryDate"],
+            format="ISO8601",
+        ).dt.strftime("%m/%d/%Y")
+
+        hour_ending = data["HourEnding"].astype(str).str.split(":").str[0]
+        data["HourEnding"] = hour_ending.str.zfill(2) + ":00"
+
+        if data["DSTFlag"].dtype != bool:
+            data["DSTFlag"] = data["DSTFlag"].astype(str).str.lower() == "true"
+        data["DSTFlag"] = data["DSTFlag"].map({True: "Y", False: "N"})
+
+        return data
 
     @support_date_range(frequency=None)
     def get_60_day_dam_disclosure(
@@ -1981,6 +2311,8 @@ class ErcotAPI:
         bulk_download: bool = True,
         include_source_filename: bool = False,
         api: APITypeEnum = APITypeEnum.PUBLIC_API,
+        usecols: list[str] | Callable[[str], bool] | None = None,
+        row_filter: Callable[[pd.DataFrame], pd.Series] | None = None,
     ) -> pd.DataFrame | bytes:
         """Retrieves historical data from the given emil_id from start to end date.
         The historical data endpoint only allows filtering by the postDatetimeTo and
@@ -2009,15 +2341,120 @@ class ErcotAPI:
             include_source_filename [bool]: if True, the returned dataframe will
                 include a column with the filename each row came from. Defaults to
                 False.
+            usecols [list | callable]: if provided, only these columns are parsed
+                from each document. Passed to pandas.read_csv.
+            row_filter [callable]: if provided, called with each parsed document
+                and must return a boolean mask of the rows to keep.
 
         Returns:
             [pandas.DataFrame]: a dataframe of historical data when read_as_csv is
                 True. Otherwise, returns the bytes.
         """
+        if not read_as_csv:
+            # Only return the bytes (not the filenames)
+            return [
+                bytes_data
+                for batch in self._iter_historical_documents(
+                    endpoint,
+                    start_date,
+                    end_date,
+                    verbose=verbose,
+                    bulk_download=bulk_download,
+                    api=api,
+                )
+                for bytes_data, _, _, _ in batch
+            ]
+
+        return pd.concat(
+            self.iter_historical_data(
+                endpoint,
+                start_date,
+                end_date,
+                add_post_datetime=add_post_datetime,
+                verbose=verbose,
+                bulk_download=bulk_download,
+                include_source_filename=include_source_filename,
+                api=api,
+                usecols=usecols,
+                row_filter=row_filter,
+            ),
+        )
+
+    def iter_historical_data(
+        self,
+        endpoint: str,
+        start_date: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp],
+        end_date: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp] | None = None,
+        add_post_datetime: bool = False,
+        verbose: bool = False,
+        bulk_download: bool = True,
+        include_source_filename: bool = False,
+        api: APITypeEnum = APITypeEnum.PUBLIC_API,
+        usecols: list[str] | Callable[[str], bool] | None = None,
+        row_filter: Callable[[pd.DataFrame], pd.Series] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yields historical data for the given endpoint one download batch at a
+        time, rather than holding every document in memory like get_historical_data.
+
+        Each yielded dataframe contains the parsed documents from one download:
+        self.batch_size documents when bulk_download is True, otherwise a single
+        document. Arguments are the same as for get_historical_data.
+
+        Returns:
+            [Iterator[pandas.DataFrame]]: dataframes of historical data, in the order
+                the archives were listed
+        """
+        for batch in self._iter_historical_documents(
+            endpoint,
+            start_date,
+            end_date,
+            verbose=verbose,
+            bulk_download=bulk_download,
+            api=api,
+        ):
+            dfs = []
+            for bytes_data, filename, posted_datetime, link in batch:
+                df = pd.read_csv(bytes_data, compression="zip", usecols=usecols)
+                if row_filter is not None:
+                    df = df[row_filter(df)]
+                if add_post_datetime:
+                    df["postDatetime"] = posted_datetime
+                if include_source_filename:
+                    # Store filename for xhr detection (prefer filename from zip,
+                    # fallback to link)
+                    df["_source_filename"] = filename if filename else link
+                dfs.append(df)
+
+            yield pd.concat(dfs)
+
+    def _iter_historical_documents(
+        self,
+        endpoint: str,
+        start_date: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp],
+        end_date: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp] | None = None,
+        verbose: bool = False,
+        bulk_download: bool = True,
+        api: APITypeEnum = APITypeEnum.PUBLIC_API,
+    ) -> Iterator[list[tuple[pd.io.common.BytesIO, str | None, str, str]]]:
+        """Yields batches of (bytes, filename, postDatetime, link) for the historical
+        documents of the given endpoint as each download completes."""
         emil_id = endpoint.split("/")[1]
         logger.debug(
             f"Getting historical data for {emil_id} from {start_date} to {end_date}",
         )
+
+        if self.archive_mirror is not None:
+            start, end = self._post_datetime_window(start_date, end_date)
+            if self.archive_mirror.covers(emil_id, start, end, api=api):
+                logger.debug(f"Reading historical data for {emil_id} from mirror")
+                yield from self.archive_mirror.iter_documents(
+                    emil_id,
+                    start,
+                    end,
+                    batch_size=self.batch_size,
+                )
+                return
+
         links_and_post_datetimes = self._get_historical_data_links(
             emil_id,
             start_date,
@@ -2025,9 +2462,6 @@ class ErcotAPI:
             verbose,
             api=api,
         )
-        links = [link for link, _ in links_and_post_datetimes]
-        doc_ids = [link.split("=")[-1] for link in links]
-        posted_datetimes = [tup[1] for tup in links_and_post_datetimes]
 
         if not links_and_post_datetimes:
             raise NoDataFoundException(
@@ -2035,48 +2469,55 @@ class ErcotAPI:
                 f"time range {start_date} to {end_date}",
             )
 
+        links = [link for link, _ in links_and_post_datetimes]
+        posted_datetimes = [tup[1] for tup in links_and_post_datetimes]
+
         if bulk_download:
             logger.debug("Bulk downloading historical data")
-            files = self._bulk_download_documents(
+            doc_ids = [link.split("=")[-1] for link in links]
+            offset = 0
+            for documents in self._iter_bulk_download_documents(
                 doc_ids=doc_ids,
                 emil_id=emil_id,
                 api=api,
-            )
+            ):
+                yield [
+                    (bytes_data, filename, posted_datetime, link)
+                    for (bytes_data, filename), posted_datetime, link in zip(
+                        documents,
+                        posted_datetimes[offset : offset + len(documents)],
+                        links[offset : offset + len(documents)],
+                    )
+                ]
+                offset += len(documents)
         else:
             logger.debug("Individually downloading historical data")
-            files = self._individually_download_documents(links=links, verbose=verbose)
-
-        if not read_as_csv:
-            # Only return the bytes (not the filenames)
-            return [f[0] for f in files]
-
-        dfs = []
-        for file_data, posted_datetime, link in zip(files, posted_datetimes, links):
-            # Handle both tuple (bytes, filename) and plain bytes for backward compatibility
-            if isinstance(file_data, tuple):
-                bytes_data, filename = file_data
-            else:
-                bytes_data = file_data
-                filename = None
-
-            df = pd.read_csv(bytes_data, compression="zip")
-            if add_post_datetime:
-                df["postDatetime"] = posted_datetime
-            if include_source_filename:
-                # Store filename for xhr detection (prefer filename from zip, fallback to link)
-                df["_source_filename"] = filename if filename else link
-            dfs.append(df)
-
-        return pd.concat(dfs)
+            post_datetime_by_link = dict(zip(links, posted_datetimes))
+            for link, bytes_data in self._iter_individually_downloaded_documents(
+                links=links,
+                verbose=verbose,
+            ):
+                yield [(bytes_data, None, post_datetime_by_link[link], link)]
 
     def _individually_download_documents(
         self,
         links: list[str],
         verbose: bool = False,
     ) -> list[pd.io.common.BytesIO]:
-        retries = 0
+        return [
+            bytes_data
+            for _, bytes_data in self._iter_individually_downloaded_documents(
+                links=links,
+                verbose=verbose,
+            )
+        ]
+
+    def _iter_individually_downloaded_documents(
+        self,
+        links: list[str],
+        verbose: bool = False,
+    ) -> Iterator[tuple[str, pd.io.common.BytesIO]]:
         max_retries = 3
-        documents = []
         for link in tqdm(
             links,
             desc="Fetching historical data",
@@ -2084,6 +2525,7 @@ class ErcotAPI:
             disable=not verbose,
             total=len(links),
         ):
+            retries = 0
             while retries < max_retries:
                 try:
                     response = self.make_api_call(
@@ -2091,22 +2533,13 @@ class ErcotAPI:
                         parse_json=False,
                     )
 
-                    bytes = pd.io.common.BytesIO(response)
-
-                    documents.append(bytes)
-                    time.sleep(self.sleep_seconds)
+                    yield link, pd.io.common.BytesIO(response)
                     break
 
+                # make_api_call already backs off on rate limiting and paces
+                # requests with the rate limiter, so this retries at once
                 except Exception as e:
-                    if "429 Client Error" in str(e):
-                        logger.info(
-                            f"Rate limited. Sleeping {self.sleep_seconds * 10} seconds",
-                        )
-                        time.sleep(self.sleep_seconds * 10)
-                    else:
-                        logger.error(f"Link: {link} failed with error: {e}")
-                        time.sleep(self.sleep_seconds)
-
+                    logger.error(f"Link: {link} failed with error: {e}")
                     retries += 1
 
             if retries == max_retries:
@@ -2114,23 +2547,36 @@ class ErcotAPI:
                     f"Max retries reached. Link: {link} failed after {max_retries} attempts.",
                 )
 
-        return documents
-
     def _bulk_download_documents(
         self,
         doc_ids: list[str],
         emil_id: str,
         api: APITypeEnum = APITypeEnum.PUBLIC_API,
     ) -> list[tuple[pd.io.common.BytesIO, str]]:
-        documents = []
-        doc_id_batches = [
-            doc_ids[i : i + self.batch_size]
-            for i in range(0, len(doc_ids), self.batch_size)
+        return [
+            document
+            for documents in self._iter_bulk_download_documents(
+                doc_ids=doc_ids,
+                emil_id=emil_id,
+                api=api,
+            )
+            for document in documents
         ]
-        # empty list that is the length of the doc_ids
-        # we will fill this list with the documents in the correct order
-        documents = [None] * len(doc_ids)
-        for batch in doc_id_batches:
+
+    def _iter_bulk_download_documents(
+        self,
+        doc_ids: list[str],
+        emil_id: str,
+        api: APITypeEnum = APITypeEnum.PUBLIC_API,
+    ) -> Iterator[list[tuple[pd.io.common.BytesIO, str]]]:
+        """Downloads the documents in batches of self.batch_size docIds, yielding each
+        batch as soon as it is downloaded. Within a batch, documents are in the
+        order of the supplied doc_ids since downstream code expects this."""
+        for i in range(0, len(doc_ids), self.batch_size):
+            batch = doc_ids[i : i + self.batch_size]
+            batch_index = {doc_id: index for index, doc_id in enumerate(batch)}
+            documents = [None] * len(batch)
+
             payload = {"docIds": batch}
             response = self.make_api_call(
                 f"{PUBLIC_BASE_URL if api == APITypeEnum.PUBLIC_API else ESR_BASE_URL}/archive/{emil_id}/download",
@@ -2148,19 +2594,17 @@ class ErcotAPI:
                 for inner_zip_name in file_list:
                     # place the document in the correct index
                     # based of the supplied doc_ids order
-                    # since downstream code expects this
                     doc_id = inner_zip_name.split(".")[0]
-                    doc_index = doc_ids.index(doc_id)
                     with outer_zip.open(inner_zip_name) as inner_zip_file:
-                        documents[doc_index] = (
+                        documents[batch_index[doc_id]] = (
                             pd.io.common.BytesIO(inner_zip_file.read()),
                             inner_zip_name,  # Store filename for xhr detection
                         )
 
-        # assert there are no None values in the documents list
-        # because this would indicate we missed a document
-        assert None not in documents, "Missing documents in bulk download"
-        return documents
+            # assert there are no None values in the documents list
+            # because this would indicate we missed a document
+            assert None not in documents, "Missing documents in bulk download"
+            yield documents
 
     def _get_historical_data_links(
         self,
@@ -2173,58 +2617,212 @@ class ErcotAPI:
         """Retrieves links to download historical data for the given emil_id from
         start to end date.
 
+        When the instance has an archive_listing_cache_dir, the listing is served
+        from and added to the on-disk cache for the emil_id.
+
         Returns:
             [list]: a list of links to download historical data
         """
+        start, end = self._post_datetime_window(start_date, end_date)
+
+        if self.archive_listing_cache_dir is None:
+            archives = self._list_archives(emil_id, start, end, verbose, api=api)
+        else:
+            archives = self._list_archives_with_cache(
+                emil_id,
+                start,
+                end,
+                verbose,
+                api=api,
+            )
+
+        links_and_post_datetimes = list(
+            zip(archives["href"], archives["postDatetime"]),
+        )
+
+        logger.info(f"Found {len(links_and_post_datetimes)} archives")
+
+        return links_and_post_datetimes
+
+    def _post_datetime_window(
+        self,
+        start_date: str | pd.Timestamp,
+        end_date: str | pd.Timestamp | None = None,
+    ) -> tuple[pd.Timestamp, pd.Timestamp]:
+        """Converts a start and end date to the naive ERCOT local times that archive
+        post datetimes are filtered by. A missing end date means now."""
+        start = pd.Timestamp(_timestamp_parser(start_date))
+        end = (
+            pd.Timestamp(_timestamp_parser(end_date))
+            if end_date is not None
+            else self._local_now().tz_localize(None).floor("s")
+        )
+
+        return start, end
+
+    def _list_archives(
+        self,
+        emil_id: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        verbose: bool = False,
+        api: APITypeEnum = APITypeEnum.PUBLIC_API,
+    ) -> pd.DataFrame:
+        """Lists the archives of the given emil_id posted from start to end as a
+        table of ARCHIVE_LISTING_COLUMNS. Pages after the first are fetched
+        concurrently."""
         urlstring = (
             f"{PUBLIC_BASE_URL}/archive/{emil_id}"
             if api == APITypeEnum.PUBLIC_API
             else f"{ESR_BASE_URL}/archive/{emil_id}"
         )
 
-        page_num = 1
-
         api_params = {
-            "postDatetimeFrom": _timestamp_parser(start_date),
-            "postDatetimeTo": _timestamp_parser(end_date),
+            "postDatetimeFrom": _timestamp_parser(start),
+            "postDatetimeTo": _timestamp_parser(end),
             "size": DEFAULT_HISTORICAL_SIZE,
-            "page": page_num,
         }
 
-        response = self.make_api_call(urlstring, api_params=api_params)
+        response = self.make_api_call(urlstring, api_params={**api_params, "page": 1})
 
-        meta = response["_meta"]
-        total_pages = meta["totalPages"]
+        total_pages = response["_meta"]["totalPages"]
         archives = response["archives"]
 
+        def fetch_page(page: int) -> list[dict]:
+            return self.make_api_call(
+                urlstring,
+                api_params={**api_params, "page": page},
+            )["archives"]
+
         with self._create_progress_bar(
             total_pages,
             "Fetching historical links",
             verbose=verbose,
         ) as pbar:
-            while page_num < total_pages:
-                page_num += 1
-                api_params["page"] = page_num
+            for page_archives in self._fetch_pages_concurrently(
+                fetch_page,
+                range(2, total_pages + 1),
+                pbar,
+            ):
+                archives.extend(page_archives)
+
+        hrefs = [
+            archive.get("_links").get("endpoint").get("href") for archive in archives
+        ]
 
-                response = self.make_api_call(
-                    urlstring,
-                    api_params=api_params,
-                )
-                archives.extend(response["archives"])
+        return pd.DataFrame(
+            {
+                "docId": [href.split("=")[-1] for href in hrefs],
+                "postDatetime": [archive.get("postDatetime") for archive in archives],
+                "href": hrefs,
+            },
+            columns=ARCHIVE_LISTING_COLUMNS,
+        )
 
-                pbar.update(1)
+    def _list_archives_with_cache(
+        self,
+        emil_id: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        verbose: bool = False,
+        api: APITypeEnum = APITypeEnum.PUBLIC_API,
+    ) -> pd.DataFrame:
+        """Lists archives like _list_archives, but only requests the parts of the
+        start to end window that the on-disk cache for the emil_id does not cover.
 
-        links_and_post_datetimes = [
-            (
-                archive.get("_links").get("endpoint").get("href"),
-                archive.get("postDatetime"),
-            )
-            for archive in archives
+        The cache covers a list of disjoint windows of post datetimes, so a query far
+        from the cached windows lists only its own range rather than the gap between
+        them. Listings newer than ARCHIVE_LISTING_CACHE_SETTLE_TIME are never marked
+        as covered because ERCOT may still be posting them.
+        """
+        cache_path = os.path.join(
+            self.archive_listing_cache_dir,
+            f"{api}_{emil_id}.json.gz",
+        )
+        cached, covered_windows = self._read_archive_listing_cache(cache_path)
+
+        missing_windows = _uncovered_windows(covered_windows, start, end)
+
+        listings = [cached] + [
+            self._list_archives(emil_id, window_start, window_end, verbose, api=api)
+            for window_start, window_end in missing_windows
         ]
+        listing = (
+            pd.concat(listings, ignore_index=True)
+            .drop_duplicates(subset="docId", keep="last")
+            .sort_values(["postDatetime", "docId"])
+            .reset_index(drop=True)
+        )
 
-        logger.info(f"Found {len(links_and_post_datetimes)} archives")
+        if missing_windows:
+            settled_end = min(
+                end,
+                self._local_now().tz_localize(None) - ARCHIVE_LISTING_CACHE_SETTLE_TIME,
+            )
+            # Every part of start to end is now listed, either from the cache or
+            # from the missing windows
+            if settled_end > start:
+                covered_windows = _merge_windows(
+                    [*covered_windows, (start, settled_end)],
+                )
+                self._write_archive_listing_cache(
+                    cache_path,
+                    listing,
+                    covered_windows,
+                )
 
-        return links_and_post_datetimes
+        post_datetimes = pd.to_datetime(listing["postDatetime"], format="ISO8601")
+
+        return listing[(post_datetimes >= start) & (post_datetimes <= end)]
+
+    def _read_archive_listing_cache(
+        self,
+        cache_path: str,
+    ) -> tuple[pd.DataFrame, list[tuple[pd.Timestamp, pd.Timestamp]]]:
+        """Returns the cached listing and the windows it covers, or an empty listing
+        covering nothing if the cache is missing, unreadable or written by another
+        version of the cache layout"""
+        empty = pd.DataFrame(columns=ARCHIVE_LISTING_COLUMNS), []
+        try:
+            with gzip.open(cache_path, "rt", encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return empty
+
+        if not _is_valid_archive_listing_cache(cache):
+            return empty
+
+        return (
+            pd.DataFrame(cache["archives"], columns=ARCHIVE_LISTING_COLUMNS),
+            [
+                (pd.Timestamp(window_start), pd.Timestamp(window_end))
+                for window_start, window_end in cache["covered_windows"]
+            ],
+        )
+
+    def _write_archive_listing_cache(
+        self,
+        cache_path: str,
+        listing: pd.DataFrame,
+        covered_windows: list[tuple[pd.Timestamp, pd.Timestamp]],
+    ) -> None:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a temporary file and swap it in so readers in other processes
+        # never see a partially written cache
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as cache_file:
+            json.dump(
+                {
+                    "version": ARCHIVE_LISTING_CACHE_VERSION,
+                    "archives": listing[ARCHIVE_LISTING_COLUMNS].to_dict("list"),
+                    "covered_windows": [
+                        [window_start.isoformat(), window_end.isoformat()]
+                        for window_start, window_end in covered_windows
+                    ],
+                },
+                cache_file,
+            )
+        os.replace(tmp_path, cache_path)
 
     def hit_ercot_api(
         self,
@@ -2272,17 +2870,15 @@ class ErcotAPI:
             else f"{ESR_BASE_URL}{endpoint}"
         )
 
-        current_page = 1
         # Make a first request to get the total number of pages and first data
-        parsed_api_params["page"] = current_page
+        first_page_params = {**parsed_api_params, "page": 1}
         response = self.make_api_call(
             urlstring,
-            api_params=parsed_api_params,
+            api_params=first_page_params,
             api=api,
         )
-        # The data comes back as a list of lists. We get the columns to
-        # create a dataframe after we have all the data
-        columns = [f["name"] for f in response["fields"]]
+        # Capitalize the first letter of each column name but leave the rest alone
+        columns = [f["name"][:1].upper() + f["name"][1:] for f in response["fields"]]
 
         # ensure that there is data before proceeding
         if "data" not in response or "_meta" not in response:
@@ -2290,7 +2886,6 @@ class ErcotAPI:
                 f"No data found for {endpoint} with params {api_params}",
             )
 
-        data_results = response["data"]
         total_pages = response["_meta"]["totalPages"]
         pages_to_retrieve = total_pages
 
@@ -2304,46 +2899,119 @@ class ErcotAPI:
                     f"Only retrieving {max_pages} pages out of {total_pages} total",
                 )
 
+        # The data comes back as a list of lists. Each page is converted to a
+        # dataframe as soon as it arrives so the lists can be released
+        pages = [pd.DataFrame(data=response["data"], columns=columns)]
+        del response
+
+        def fetch_page(page: int) -> pd.DataFrame:
+            page_response = self.make_api_call(
+                urlstring,
+                api_params={**parsed_api_params, "page": page},
+                api=api,
+            )
+            return pd.DataFrame(data=page_response["data"], columns=columns)
+
         with self._create_progress_bar(
             pages_to_retrieve,
             "Fetching data",
             verbose=verbose,
         ) as pbar:
-            while current_page < total_pages:
-                if max_pages is not None and current_page >= max_pages:
-                    break
+            pages.extend(
+                self._fetch_pages_concurrently(
+                    fetch_page,
+                    range(2, pages_to_retrieve + 1),
+                    pbar,
+                ),
+            )
 
-                current_page += 1
-                parsed_api_params["page"] = current_page
+        data = pd.concat(pages, ignore_index=True) if len(pages) > 1 else pages[0]
 
-                logger.info(
-                    f"Requesting url: {urlstring} with params {parsed_api_params}",
-                )
+        # Strip the extra whitespace from the string columns
+        for col in data.columns[data.dtypes == "object"]:
+            data[col] = data[col].str.strip()
 
-                response = self.make_api_call(
-                    urlstring,
-                    api_params=parsed_api_params,
-                )
+        return data
 
-                data_results.extend(response["data"])
+    def _should_use_historical(self, date: str | pd.Timestamp) -> bool:
+        return (
+            utils._handle_date(
+                date,
+                tz=self.default_timezone,
+            )
+            < self._historical_boundary()
+        )
 
-                pbar.update(1)
+    def _historical_boundary(self) -> pd.Timestamp:
+        """Data before this time is only available from the archives"""
+        return self._local_start_of_today() - pd.Timedelta(
+            days=HISTORICAL_DAYS_THRESHOLD,
+        )
 
-        # Capitalize the first letter of each column name but leave the rest alone
-        columns = [col[:1].upper() + col[1:] for col in columns]
+    def _get_hybrid_data(
+        self,
+        date: pd.Timestamp,
+        end: pd.Timestamp | None,
+        get_historical: Callable[[pd.Timestamp, pd.Timestamp], pd.DataFrame],
+        get_live: Callable[[pd.Timestamp, pd.Timestamp | None], pd.DataFrame],
+        handle: Callable[[pd.DataFrame], pd.DataFrame],
+        sort_columns: list[str],
+        subset: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Gets data from date to end, fetching the part before the historical
+        boundary from the archives and the rest from the live API.
 
-        # Strip the extra whitespace from the data
-        data = pd.DataFrame(data=data_results, columns=columns)
-        data = data.apply(lambda x: x.str.strip() if x.dtype == "object" else x)
+        When the range straddles the boundary both parts are fetched concurrently.
+        Each part is handled separately, since the archives and the live API format
+        values differently, and the results are merged and deduplicated on subset
+        (all columns if None).
 
-        return data
+        Arguments:
+            date: the start of the range
+            end: the end of the range. If None, the live API is queried without an
+                end, and the archives up to one day after date.
+            get_historical: fetches raw data between two times from the archives
+            get_live: fetches raw data between two times from the live API
+            handle: turns raw data from either source into the final format
+            sort_columns: the columns to sort the merged data by
+            subset: the columns identifying a row when deduplicating
+        """
+        boundary = self._historical_boundary()
 
-    def _should_use_historical(self, date: str | pd.Timestamp) -> bool:
-        return utils._handle_date(
-            date,
-            tz=self.default_timezone,
-        ) < self._local_start_of_today() - pd.Timedelta(
-            days=HISTORICAL_DAYS_THRESHOLD,
+        if date >= boundary:
+            return handle(get_live(date, end))
+
+        end = self._handle_end_date(date, end, days_to_add_if_no_end=1)
+
+        if end <= boundary:
+            return handle(get_historical(date, end))
+
+        logger.info(
+            f"Fetching data before {boundary} from the archives and after from "
+            "the live API",
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(get_historical, date, boundary),
+                executor.submit(get_live, boundary, end),
+            ]
+            # Wait for both parts before raising so no request is left running
+            parts = []
+            for future in futures:
+                try:
+                    parts.append(handle(future.result()))
+                except NoDataFoundException as e:
+                    logger.warning(f"No data for part of the range: {e}")
+
+        if not parts:
+            raise NoDataFoundException(f"No data found from {date} to {end}")
+
+        return (
+            pd.concat(parts, ignore_index=True)
+            .drop_duplicates(subset=subset, keep="last")
+            .sort_values(sort_columns)
+            .reset_index(drop=True)
         )
 
     def list_all_public_endpoints(self) -> None:
@@ -2389,11 +3057,11 @@ class ErcotAPI:
         api: APITypeEnum = APITypeEnum.PUBLIC_API,
     ) -> dict:
         # validate endpoint string
-        endpoint_contents = (
-            self.public_endpoints_map.get(endpoint, None)
+        endpoint_contents = get_endpoints_index(
+            PUBLIC_ENDPOINTS_MAP_FILE
             if api == APITypeEnum.PUBLIC_API
-            else self.esr_endpoints_map.get(endpoint, None)
-        )
+            else ESR_ENDPOINTS_MAP_FILE,
+        ).get(endpoint, None)
 
         if endpoint_contents is None:
             raise KeyError(f"{endpoint} is not a valid ERCOT API endpoint")
@@ -2402,25 +3070,38 @@ class ErcotAPI:
         parsed_api_params = {"size": page_size}
 
         for arg, value in api_params.items():
-            parser = endpoint_contents["parameters"].get(arg, {}).get("parser_method")
-            if parser is not None:
-                parsed_api_params[arg] = parser(value)
+            value_type = endpoint_contents["parameters"].get(arg)
+            if value_type is not None:
+                parsed_api_params[arg] = VALUE_TYPE_PARSERS[value_type](value)
 
         return parsed_api_params
 
-    def _get_public_endpoints_map(self) -> dict:
-        with open(PUBLIC_ENDPOINTS_MAP_FILE) as endpoints_file:
-            endpoints = json.load(endpoints_file)
-        endpoints = parse_all_endpoints(apijson=endpoints)
+    def _get_public_endpoints_map(self) -> Mapping:
+        return get_endpoints_map(PUBLIC_ENDPOINTS_MAP_FILE)
 
-        return endpoints
+    def _get_esr_endpoints_map(self) -> Mapping:
+        return get_endpoints_map(ESR_ENDPOINTS_MAP_FILE)
 
-    def _get_esr_endpoints_map(self) -> dict:
-        with open(ESR_ENDPOINTS_MAP_FILE) as esr_endpoints_file:
-            esr_endpoints = json.load(esr_endpoints_file)
-        esr_endpoints = parse_all_endpoints(apijson=esr_endpoints)
+    def _fetch_pages_concurrently(
+        self,
+        fetch_page: Callable[[int], T],
+        pages: range,
+        pbar: tqdm,
+    ) -> list[T]:
+        """Calls fetch_page for each page number on a thread pool and returns the
+        results in page order. make_api_call keeps the threads within the shared
+        rate budget."""
+        if not pages:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pages)),
+        ) as executor:
+            futures = [executor.submit(fetch_page, page) for page in pages]
+            for _ in as_completed(futures):
+                pbar.update(1)
 
-        return esr_endpoints
+            return [future.result() for future in futures]
 
     def _create_progress_bar(
         self,
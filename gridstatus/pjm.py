@@ -2,11 +2,15 @@ import io
 import math
 import os
 import random
+import threading
 import time
 import warnings
 import xml.etree.ElementTree as ET
-from typing import BinaryIO
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, BinaryIO, NamedTuple
 
+import numpy as np
 import pandas as pd
 import requests
 import tqdm
@@ -14,27 +18,282 @@ from bs4 import BeautifulSoup
 
 from gridstatus import utils
 from gridstatus.base import ISOBase, Markets, NoDataFoundException, NotSupported
-from gridstatus.decorators import (
-    _get_pjm_archive_date,
-    pjm_update_dates,
-    support_date_range,
-)
+from gridstatus.decorators import support_date_range
 from gridstatus.gs_logging import logger
 from gridstatus.lmp_config import lmp_config
 from gridstatus.pjm_constants import (
+    ACTUAL_AND_SCHEDULED_INTERCHANGE_SUMMARY_FIELD_NAMES,
+    ACTUAL_OPERATIONAL_STATISTICS_FIELD_NAMES,
+    AREA_CONTROL_ERROR_FIELD_NAMES,
+    AS_MARKET_RESULTS_COLUMN_DEPENDENCIES,
+    AS_MARKET_RESULTS_DAY_AHEAD_FIELD_NAMES,
+    AS_MARKET_RESULTS_REAL_TIME_FIELD_NAMES,
+    CLEARED_VIRTUALS_DAILY_FIELD_NAMES,
+    DAY_AHEAD_DEMAND_BIDS_FIELD_NAMES,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MIN_REQUEST_INTERVAL_SECONDS,
     DEFAULT_RETRIES,
+    DISPATCHED_RESERVES_COLUMN_DEPENDENCIES,
+    DISPATCHED_RESERVES_PRELIM_FIELD_NAMES,
+    DISPATCHED_RESERVES_VERIFIED_FIELD_NAMES,
     EMERGENCY_POSTINGS_GUEST_DASHBOARD_URL,
     EMERGENCY_POSTINGS_PUBLIC_REST_URL,
+    FORECASTED_GENERATION_OUTAGES_FIELD_NAMES,
+    GEN_OUTAGES_BY_TYPE_FIELD_NAMES,
+    GENERATION_CAPACITY_DAILY_FIELD_NAMES,
+    HOURLY_NET_EXPORTS_BY_STATE_FIELD_NAMES,
+    HOURLY_TRANSFER_LIMITS_AND_FLOWS_FIELD_NAMES,
     HUB_NODE_IDS,
+    INC_AND_DEC_BIDS_DAY_AHEAD_HOURLY_FIELD_NAMES,
+    INSTANTANEOUS_DISPATCH_RATES_FIELD_NAMES,
+    INTERFACE_FLOWS_AND_LIMITS_DAY_AHEAD_FIELD_NAMES,
+    IT_SCED_LMP_5_MIN_COLUMN_DEPENDENCIES,
+    IT_SCED_LMP_5_MIN_FIELD_NAMES,
+    LMP_COLUMN_DEPENDENCIES,
+    LMP_FIELD_NAMES,
+    LMP_UNVERIFIED_HOURLY_COLUMN_DEPENDENCIES,
+    LMP_UNVERIFIED_HOURLY_FIELD_NAMES,
+    LOAD_METERED_HOURLY_FIELD_NAMES,
     LOCATION_TYPES,
+    MARGINAL_EMISSION_RATES_5_MIN_FIELD_NAMES,
+    MARGINAL_VALUE_DAY_AHEAD_HOURLY_FIELD_NAMES,
+    MARGINAL_VALUE_REAL_TIME_5_MIN_FIELD_NAMES,
+    MAX_ROWS_PER_REQUEST,
+    OPERATIONAL_RESERVES_FIELD_NAMES,
+    PAI_INTERVALS_5_MIN_FIELD_NAMES,
+    PNODE_COUNT_ESTIMATE,
     PRICE_NODE_IDS,
+    PRICING_NODES_FIELD_NAMES,
+    PROJECTED_AREA_STATISTICS_AT_PEAK_FIELD_NAMES,
+    PROJECTED_PEAK_TIE_FLOW_FIELD_NAMES,
+    PROJECTED_RTO_STATISTICS_AT_PEAK_FIELD_NAMES,
+    REGULATION_MARKET_MONTHLY_FIELD_NAMES,
+    REGULATION_PRICES_5_MIN_FIELD_NAMES,
     REQUEST_TIMEOUT,
+    RESERVE_SUBZONE_BUSES_FIELD_NAMES,
+    RESERVE_SUBZONE_RESOURCES_FIELD_NAMES,
+    SCHEDULED_INTERCHANGE_REAL_TIME_FIELD_NAMES,
+    SETTLEMENTS_VERIFIED_LMP_5_MIN_FIELD_NAMES,
+    SETTLEMENTS_VERIFIED_LMP_HOURLY_FIELD_NAMES,
+    SNAPSHOT_DATASETS,
+    SOLAR_FORECAST_FIELD_NAMES,
+    SOLAR_GENERATION_5_MIN_FIELD_NAMES,
+    SYNC_RESERVE_EVENTS_COLUMN_DEPENDENCIES,
+    SYNC_RESERVE_EVENTS_FIELD_NAMES,
+    TIE_FLOWS_5_MIN_FIELD_NAMES,
+    TIME_COLUMNS,
+    TRANSFER_INTERFACE_INFORMATION_5_MIN_FIELD_NAMES,
+    TRANSMISSION_CONSTRAINTS_DAY_AHEAD_FIELD_NAMES,
+    TRANSMISSION_LIMITS_FIELD_NAMES,
+    UNVERIFIED_LMP_COLUMN_DEPENDENCIES,
+    WEIGHT_AVERAGE_AGGREGATION_DEFINITION_FIELD_NAMES,
+    WIND_FORECAST_FIELD_NAMES,
+    WIND_GENERATION_INSTANTANEOUS_FIELD_NAMES,
     ZONE_NODE_IDS,
 )
 
 
+def _get_pjm_archive_date(market: str | Markets) -> pd.Timestamp:
+    market = Markets(market)
+    tz = PJM.default_timezone
+    if market == Markets.REAL_TIME_5_MIN:
+        archive_date = pd.Timestamp.now(
+            tz=tz,
+        ) - pd.Timedelta(days=186)
+    elif market == Markets.REAL_TIME_HOURLY or market == Markets.DAY_AHEAD_HOURLY:
+        archive_date = pd.Timestamp.now(
+            tz=tz,
+        ) - pd.Timedelta(days=731)
+
+    return archive_date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# todo convert to custom PJMDateOffset class
+def pjm_update_dates(
+    dates: list[pd.Timestamp | None],
+    args_dict: dict[str, Any],
+) -> list[pd.Timestamp | None]:
+    """PJM has a weird API. This method updates the date range list to account
+    for the following restrictions:
+
+     - date ranges cannot span year boundaries
+     - date ranges cannot span archive / standard boundaries
+     - date range is inclusive of start and end dates
+    """
+
+    archive_date = _get_pjm_archive_date(args_dict["market"])
+
+    new_dates: list[pd.Timestamp | None] = []
+
+    for i, date in enumerate(dates):
+        # stop if last date
+        if i + 1 == len(dates):
+            # add last date if new range has started
+            if new_dates[-1] is not None:
+                new_dates.append(date)
+
+            break
+
+        new_dates.append(date)
+
+        # restriction 1: year boundary
+        next_date = dates[i + 1]
+        if date is not None and next_date is not None:
+            for year in range(date.year, next_date.year):
+                current_year_end = pd.Timestamp(
+                    year=year,
+                    month=12,
+                    day=31,
+                    hour=23,
+                    minute=59,
+                    tz=args_dict["self"].default_timezone,
+                )
+                new_dates.append(current_year_end)
+                next_year_start = pd.Timestamp(
+                    year=year + 1,
+                    month=1,
+                    day=1,
+                    hour=0,
+                    minute=0,
+                    tz=args_dict["self"].default_timezone,
+                )
+
+                new_dates.append(None)  # signal to skip to next date
+
+                # dont need another range if the range ends at the start of the next year
+                if next_year_start != next_date:
+                    new_dates.append(next_year_start)
+
+    # remove trailing None
+    if new_dates[-1] is None:
+        new_dates = new_dates[:-1]
+
+    # restriction 2: archive / standard boundary
+    for i, date in enumerate(new_dates[:-1]):
+        next_date = new_dates[i + 1]
+        # check if archive date is between date and next_date
+        if None not in [date, next_date] and date < archive_date < next_date:
+            day_before_archive = archive_date - pd.Timedelta(days=1)
+            add_before = pd.Timestamp(
+                year=day_before_archive.year,
+                month=day_before_archive.month,
+                day=day_before_archive.day,
+                hour=23,
+                minute=59,
+                tz=args_dict["self"].default_timezone,
+            )
+
+            new_dates = (
+                new_dates[: i + 1]
+                + [
+                    add_before,
+                    None,
+                    archive_date,
+                ]
+                + new_dates[i + 1 :]
+            )
+
+    return new_dates
+
+
+def _estimate_pjm_lmp_rows_per_interval(
+    args_dict: dict[str, Any],
+    date: pd.Timestamp,
+    archive_date: pd.Timestamp,
+) -> int:
+    """Estimates how many rows one interval of a PJM LMP query starting at date
+    returns, i.e. how many locations PJM sends"""
+    # before the archive date PJM cannot filter locations, and the real time 5
+    # minute feed cannot filter location types, so every node is downloaded
+    if date < archive_date:
+        return PNODE_COUNT_ESTIMATE
+
+    # the node count of a location type isn't known up front, so assume all
+    if args_dict.get("location_type"):
+        return PNODE_COUNT_ESTIMATE
+
+    locations = args_dict.get("locations", "hubs")
+    if isinstance(locations, str):
+        if locations == "hubs":
+            return len(args_dict["self"].hub_node_ids)
+        return PNODE_COUNT_ESTIMATE
+
+    return max(len(locations), 1)
+
+
+def pjm_plan_dates(
+    dates: list[pd.Timestamp | None],
+    args_dict: dict[str, Any],
+) -> list[pd.Timestamp | None]:
+    """Plans PJM LMP requests so each one returns about a page of rows.
+
+    Applies the restrictions of pjm_update_dates, then splits every range into
+    windows of as many market intervals as fit in one page of
+    MAX_ROWS_PER_REQUEST rows, given how many locations the query returns. A
+    year of hub prices is a couple of dozen windows, while a day of all nodes
+    is split into windows of a few intervals. The windows don't depend on each
+    other, so support_date_range can fetch them concurrently.
+    """
+    dates = pjm_update_dates(dates, args_dict)
+
+    market = Markets(args_dict["market"])
+    archive_date = _get_pjm_archive_date(market)
+    interval = pd.Timedelta(
+        minutes=5 if market == Markets.REAL_TIME_5_MIN else 60,
+    )
+
+    new_dates: list[pd.Timestamp | None] = []
+
+    for i, date in enumerate(dates):
+        new_dates.append(date)
+
+        next_date = dates[i + 1] if i + 1 < len(dates) else None
+        if date is None or next_date is None:
+            continue
+
+        rows_per_interval = _estimate_pjm_lmp_rows_per_interval(
+            args_dict,
+            date,
+            archive_date,
+        )
+        window = interval * max(MAX_ROWS_PER_REQUEST // rows_per_interval, 1)
+
+        split = date + window
+        while split < next_date:
+            new_dates.append(split)
+            split += window
+
+    return new_dates
+
+
+class PJMSnapshot(NamedTuple):
+    """Latest interval of several PJM datasets, returned by PJM.get_snapshot"""
+
+    # dataset name -> data
+    frames: dict[str, pd.DataFrame]
+    # dataset name -> seconds taken to fetch it, including failed fetches
+    latency_seconds: dict[str, float]
+    # dataset name -> error, for datasets that could not be fetched
+    errors: dict[str, Exception]
+
+
 class PJM(ISOBase):
-    """PJM"""
+    """PJM
+
+    Data Miner methods accept ``columns=``, which returns just the given output
+    columns, plus the time columns, and requests only the fields they need.
+    These methods don't, because their output columns are pivoted from the
+    values of a field rather than renamed from fields, so there are no fields
+    to leave out:
+
+    - get_fuel_mix
+    - get_load
+    - get_load_forecast
+    - get_load_forecast_5_min
+    - get_load_forecast_historical
+    - get_solar_generation_by_area
+    - get_wind_generation_by_area
+    """
 
     name = "PJM"
     iso_id = "pjm"
@@ -79,18 +338,48 @@ class PJM(ISOBase):
         self,
         api_key: str | None = None,
         retries: int = DEFAULT_RETRIES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        min_request_interval_seconds: float = DEFAULT_MIN_REQUEST_INTERVAL_SECONDS,
     ) -> None:
         """
         Arguments:
-            api_key (str, optional): PJM API key. Alternatively, can be set
+            api_key (str, optional): PJM API key. Can be a comma-separated list
+                of keys if you have multiple keys. Alternatively, can be set
                 in PJM_API_KEY environment variable. Register for an API key
                 at https://www.pjm.com/
+            max_workers (int, optional): number of pages of a query, or windows
+                of a date range, to fetch at the same time
+            min_request_interval_seconds (float, optional): minimum time between
+                the start of two API requests with the same key, shared by all
+                threads. Non-member accounts should use 10 seconds.
         """
         super().__init__()
         self.retries = retries
+        self.max_workers = max_workers
         self.api_key = api_key or os.getenv("PJM_API_KEY")
+        self.api_keys = [
+            key.strip() for key in (self.api_key or "").split(",") if key.strip()
+        ]
+
+        # Each key has its own rate budget. Requests go to the key that can
+        # start soonest, so a key that is rate-limited is skipped while the
+        # others have capacity
+        self.rate_limiters = {
+            key: utils.RateLimiter(min_interval_seconds=min_request_interval_seconds)
+            for key in self.api_keys
+        }
+        self._key_lock = threading.Lock()
+
+        # one connection pool for every thread of every query
+        self.session = requests.Session()
 
-        if not self.api_key:
+        # pnode metadata is joined onto every LMP query, so it is downloaded at
+        # most once a day per instance
+        self._pnode_ids: pd.DataFrame | None = None
+        self._pnode_ids_date = None
+        self._pnode_ids_lock = threading.Lock()
+
+        if not self.api_keys:
             raise ValueError("api_key must be provided or set in PJM_API_KEY env var")
 
     @support_date_range(frequency="365D")
@@ -365,7 +654,30 @@ class PJM(ISOBase):
             drop=True,
         )
 
-    def get_pnode_ids(self) -> pd.DataFrame:
+    def get_pnode_ids(self, refresh: bool = False) -> pd.DataFrame:
+        """Returns the active pnodes, sorted by pnode_id.
+
+        The table is downloaded once per day (in PJM local time) and reused by
+        later calls on the same instance.
+
+        Arguments:
+            refresh (bool, optional): download the table even if it is cached
+        """
+        return self._get_cached_pnode_ids(refresh=refresh).copy()
+
+    def _get_cached_pnode_ids(self, refresh: bool = False) -> pd.DataFrame:
+        today = pd.Timestamp.now(tz=self.default_timezone).date()
+
+        # Holding the lock while downloading makes concurrent callers share one
+        # download
+        with self._pnode_ids_lock:
+            if refresh or self._pnode_ids is None or self._pnode_ids_date != today:
+                self._pnode_ids = self._download_pnode_ids()
+                self._pnode_ids_date = today
+
+            return self._pnode_ids
+
+    def _download_pnode_ids(self) -> pd.DataFrame:
         data = {
             "fields": "effective_date,pnode_id,pnode_name,pnode_subtype,pnode_type\
                 ,termination_date,voltage_level,zone",
@@ -389,22 +701,38 @@ class PJM(ISOBase):
         # so we need to extract it from full name
         # other LMP datasets have but do it this way
         # for consistent logic
-        def extract_short_name(row: pd.Series) -> str:
-            if row["voltage_level"] is None or pd.isna(row["voltage_level"]):
-                return row["pnode_name"]
-            else:
-                # Find the index where voltage_level starts
-                # and extract everything before it
-                index = row["pnode_name"].find(row["voltage_level"])
-                # if not found, return full name
-                if index == -1:
-                    return row["pnode_name"]
-                return row["pnode_name"][:index].strip()
-
-        nodes["pnode_short_name"] = nodes.apply(extract_short_name, axis=1)
+        nodes["pnode_short_name"] = self._extract_pnode_short_names(nodes)
 
         return nodes
 
+    @staticmethod
+    def _extract_pnode_short_names(nodes: pd.DataFrame) -> pd.Series:
+        """Returns the part of each pnode_name before its voltage_level.
+
+        Names without a voltage level, or that do not contain it, are returned
+        whole. There are only a handful of distinct voltage levels, so the names
+        are split with one vectorized operation per level.
+        """
+        short_names = nodes["pnode_name"].copy()
+
+        for voltage_level, index in (
+            nodes[nodes["voltage_level"].notna()]
+            .groupby("voltage_level")
+            .groups.items()
+        ):
+            # An empty voltage level is found at the start of the name
+            if voltage_level == "":
+                short_names.loc[index] = ""
+                continue
+
+            names = nodes.loc[index, "pnode_name"]
+            names = names[names.str.contains(voltage_level, regex=False)]
+            short_names.loc[names.index] = (
+                names.str.split(voltage_level, n=1, regex=False).str[0].str.strip()
+            )
+
+        return short_names
+
     @lmp_config(
         supports={
             Markets.REAL_TIME_5_MIN: ["today", "historical"],
@@ -412,7 +740,11 @@ class PJM(ISOBase):
             Markets.DAY_AHEAD_HOURLY: ["today", "historical"],
         },
     )
-    @support_date_range(frequency="365D", update_dates=pjm_update_dates)
+    @support_date_range(
+        frequency="365D",
+        update_dates=pjm_plan_dates,
+        max_workers=lambda args_dict: args_dict["self"].max_workers,
+    )
     def _get_lmp(
         self,
         date: str | pd.Timestamp,
@@ -421,6 +753,7 @@ class PJM(ISOBase):
         locations: str = "hubs",
         location_type: str | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """Returns LMP at a previous date.
 
@@ -452,12 +785,17 @@ class PJM(ISOBase):
                 this type. Defaults to None. Possible location types are:
                 'ZONE', 'LOAD', 'GEN', 'AGGREGATE', 'INTERFACE', 'EXT',
                 'HUB', 'EHV', 'TIE', 'RESIDUAL_METERED_EDC'.
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM, also
+                before the archive date. Defaults to all columns.
         """
 
         if locations == "hubs":
             locations = self.hub_node_ids
 
         params = {}
+        # Filters the API cannot apply are applied to each page as it arrives
+        row_filter = None
 
         if market == Markets.REAL_TIME_5_MIN:
             market_endpoint = "rt_fivemin_hrl_lmps"
@@ -492,31 +830,39 @@ class PJM(ISOBase):
                 warnings.warn(
                     (
                         "When using Real Time 5 Minute market, location_type filter"
-                        " will happen after all data is downloaded"
+                        " will happen as data is downloaded"
                     ),
                 )
+                row_filter = self._lmp_location_type_filter(location_type)
             else:
                 params["type"] = f"*{location_type}*"
 
             if locations is not None:
                 locations = None
 
+        # Only the fields the output is built from. Fields can be selected before
+        # the archive date too, even though rows can't be filtered
+        params["fields"] = (
+            f"congestion_price_{market_type},datetime_beginning_utc,"
+            f"marginal_loss_price_{market_type},pnode_id,"
+            f"system_energy_price_{market_type},total_lmp_{market_type},type"
+        )
+        # The location type filter needs the type of every row
+        required_columns = ["Location Type"] if location_type else []
+
         if date >= _get_pjm_archive_date(market):
             # after archive date, filtering allowed
-            params["fields"] = (
-                f"congestion_price_{market_type},datetime_beginning_ept,datetime_beginning_utc,equipment,marginal_loss_price_{market_type},pnode_id,pnode_name,row_is_current,system_energy_price_{market_type},total_lmp_{market_type},type,version_nbr,voltage,zone",
-            )
-
             if locations and locations != "ALL":
                 params["pnode_id"] = ";".join(map(str, locations))
 
         elif locations is not None and locations != "ALL":
             warnings.warn(
                 (
-                    "Querying before archive date, so filtering by location will happen"
-                    " after all data is downloaded"
+                    "Querying before archive date, so all locations are downloaded"
+                    " and filtered as they arrive"
                 ),
             )
+            row_filter = self._lmp_locations_filter(locations)
 
         # returns on the latest version of the data
         params["row_is_current"] = "TRUE"
@@ -529,6 +875,11 @@ class PJM(ISOBase):
                 params=params,
                 verbose=verbose,
                 interval_duration_min=interval_duration_min,
+                columns=columns,
+                field_names=LMP_FIELD_NAMES[market_type],
+                column_dependencies=LMP_COLUMN_DEPENDENCIES,
+                required_columns=required_columns,
+                row_filter=row_filter,
             )
         except NoDataFoundException as e:
             if "No data found" not in str(e):
@@ -537,7 +888,8 @@ class PJM(ISOBase):
             if market_endpoint == "rt_fivemin_hrl_lmps":
                 market_endpoint = "rt_unverified_fivemin_lmps"
                 params["fields"] = (
-                    "congestion_price_rt,datetime_beginning_ept,datetime_beginning_utc,marginal_loss_price_rt,occ_check,pnode_id,pnode_name,ref_caseid_used_multi_interval,total_lmp_rt,type"
+                    "congestion_price_rt,datetime_beginning_utc,"
+                    "marginal_loss_price_rt,pnode_id,total_lmp_rt,type"
                 )
                 # remove this field because it's not supported in this endpoint
                 del params["row_is_current"]
@@ -549,16 +901,17 @@ class PJM(ISOBase):
                 params=params,
                 verbose=verbose,
                 interval_duration_min=interval_duration_min,
+                columns=columns,
+                field_names=LMP_FIELD_NAMES[market_type],
+                column_dependencies=UNVERIFIED_LMP_COLUMN_DEPENDENCIES,
+                required_columns=required_columns,
+                row_filter=row_filter,
             )
 
-            data["system_energy_price_rt"] = (
-                data["total_lmp_rt"]
-                - data["congestion_price_rt"]
-                - data["marginal_loss_price_rt"]
-            )
+            data = self._add_lmp_energy_price(data, "rt")
 
         # API cannot filter location type for rt 5 min
-        data = data.rename(columns={"type": "Location Type"})
+        data = data.rename(columns=LMP_FIELD_NAMES[market_type])
         if location_type and market == Markets.REAL_TIME_5_MIN:
             data = data[data["Location Type"] == location_type]
 
@@ -577,15 +930,12 @@ class PJM(ISOBase):
                 "pnode_id": "Location Id",
                 "pnode_name": "Location Name",
                 "pnode_short_name": "Location Short Name",
-                f"total_lmp_{market_type}": "LMP",
-                f"system_energy_price_{market_type}": "Energy",
-                f"congestion_price_{market_type}": "Congestion",
-                f"marginal_loss_price_{market_type}": "Loss",
             },
         )
         data["Market"] = market.value
 
-        data = data[
+        data = self._select_columns(
+            data,
             [
                 "Time",
                 "Interval Start",
@@ -599,13 +949,81 @@ class PJM(ISOBase):
                 "Energy",
                 "Congestion",
                 "Loss",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         data = data.sort_values("Interval Start")
 
         return data
 
+    @staticmethod
+    def _add_lmp_energy_price(data: pd.DataFrame, market_type: str) -> pd.DataFrame:
+        """Adds the energy price of feeds that don't publish it, as LMP less
+        congestion and loss. Skipped if the columns projection left out any of
+        them."""
+        total = f"total_lmp_{market_type}"
+        congestion = f"congestion_price_{market_type}"
+        loss = f"marginal_loss_price_{market_type}"
+        if {total, congestion, loss} <= set(data.columns):
+            data[f"system_energy_price_{market_type}"] = (
+                data[total] - data[congestion] - data[loss]
+            )
+        return data
+
+    @staticmethod
+    def _lmp_locations_filter(
+        locations: list | tuple,
+    ) -> Callable[[pd.DataFrame], pd.Series]:
+        location_ids = set(map(int, locations))
+        return lambda page: page["pnode_id"].isin(location_ids)
+
+    @staticmethod
+    def _lmp_location_type_filter(
+        location_type: str,
+    ) -> Callable[[pd.DataFrame], pd.Series]:
+        return lambda page: page["type"] == location_type
+
+    def iter_lmp(
+        self,
+        date: str | pd.Timestamp,
+        end: str | pd.Timestamp,
+        market: str,
+        locations: str = "hubs",
+        location_type: str | None = None,
+        frequency: str = "1D",
+        verbose: bool = False,
+        columns: list[str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yields LMPs from date to end one window of length frequency at a time.
+
+        Takes the same arguments as the per-market LMP methods. Use this instead
+        of loading a long range at once: only one window is held in memory, and
+        rows outside locations and location_type are dropped as each page
+        arrives, even before the archive date when PJM cannot filter them.
+
+        Args:
+            frequency: the length of each window, e.g. "1D" or "7D"
+            columns: output columns to return, in addition to the time columns.
+                Defaults to all columns.
+        """
+        date = utils._handle_date(date, tz=self.default_timezone)
+        end = utils._handle_date(end, tz=self.default_timezone)
+
+        window_starts = pd.date_range(date, end, freq=frequency, inclusive="left")
+        window_ends = [*window_starts[1:], end]
+
+        for window_start, window_end in zip(window_starts, window_ends):
+            yield self._get_lmp(
+                window_start,
+                market=market,
+                end=window_end,
+                locations=locations,
+                location_type=location_type,
+                verbose=verbose,
+                columns=columns,
+            )
+
     @lmp_config(
         supports={
             Markets.REAL_TIME_5_MIN: ["today", "historical"],
@@ -621,6 +1039,7 @@ class PJM(ISOBase):
         locations: str = "hubs",
         location_type: str | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """Deprecated. Use the per-dataset methods instead:
         :meth:`get_lmp_real_time_5_min`, :meth:`get_lmp_real_time_hourly`,
@@ -640,6 +1059,7 @@ class PJM(ISOBase):
             locations=locations,
             location_type=location_type,
             verbose=verbose,
+            columns=columns,
         )
 
     def get_lmp_real_time_5_min(
@@ -647,14 +1067,22 @@ class PJM(ISOBase):
         date: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp],
         end: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp] | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        """Get real-time 5-minute LMPs for all nodes."""
+        """Get real-time 5-minute LMPs for all nodes.
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
+        """
         return self._get_lmp(
             date,
             market=Markets.REAL_TIME_5_MIN,
             end=end,
             locations="ALL",
             verbose=verbose,
+            columns=columns,
         )
 
     def get_lmp_real_time_hourly(
@@ -662,14 +1090,22 @@ class PJM(ISOBase):
         date: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp],
         end: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp] | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        """Get real-time hourly LMPs for all nodes."""
+        """Get real-time hourly LMPs for all nodes.
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
+        """
         return self._get_lmp(
             date,
             market=Markets.REAL_TIME_HOURLY,
             end=end,
             locations="ALL",
             verbose=verbose,
+            columns=columns,
         )
 
     def get_lmp_day_ahead_hourly(
@@ -677,29 +1113,37 @@ class PJM(ISOBase):
         date: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp],
         end: str | pd.Timestamp | tuple[pd.Timestamp, pd.Timestamp] | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        """Get day-ahead hourly LMPs for all nodes."""
+        """Get day-ahead hourly LMPs for all nodes.
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
+        """
         return self._get_lmp(
             date,
             market=Markets.DAY_AHEAD_HOURLY,
             end=end,
             locations="ALL",
             verbose=verbose,
+            columns=columns,
         )
 
     def _add_pnode_info_to_lmp_data(self, data: pd.DataFrame) -> pd.DataFrame:
         # the pnode_name in the lmp data isn't always full name
         # so, let drop it for now
         # will get full name by merge with pnode data later
-        data = data.drop(columns=["pnode_name"])
+        data = data.drop(columns=["pnode_name"], errors="ignore")
 
-        p_nodes = self.get_pnode_ids()[
-            ["pnode_id", "pnode_name", "voltage_level", "pnode_short_name"]
+        p_nodes = self._get_cached_pnode_ids().set_index("pnode_id")[
+            ["pnode_name", "voltage_level", "pnode_short_name"]
         ]
 
-        data = data.merge(p_nodes, on="pnode_id")
-
-        return data
+        # Look up each row's pnode by index rather than merging on the column.
+        # Rows whose pnode is not active are dropped
+        return data.join(p_nodes, on="pnode_id", how="inner").reset_index(drop=True)
 
     @support_date_range(frequency="365D")
     def get_lmp_real_time_unverified_5_min(
@@ -709,22 +1153,26 @@ class PJM(ISOBase):
         locations: str | list | None = "hubs",
         location_type: str | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """Get real-time unverified 5-minute LMPs for a date range.
 
         Mirrors the output shape of ``get_lmp(market=REAL_TIME_5_MIN)`` but
         always hits ``rt_unverified_fivemin_lmps`` so callers can pull the
         freshest data (verified is delayed ~25 minutes).
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         if locations == "hubs":
             locations = self.hub_node_ids
 
         params = {
             "fields": (
-                "congestion_price_rt,datetime_beginning_ept,"
-                "datetime_beginning_utc,marginal_loss_price_rt,occ_check,"
-                "pnode_id,pnode_name,ref_caseid_used_multi_interval,"
-                "total_lmp_rt,type"
+                "congestion_price_rt,datetime_beginning_utc,"
+                "marginal_loss_price_rt,pnode_id,total_lmp_rt,type"
             ),
         }
 
@@ -752,15 +1200,15 @@ class PJM(ISOBase):
             params=params,
             verbose=verbose,
             interval_duration_min=5,
+            columns=columns,
+            field_names=LMP_FIELD_NAMES["rt"],
+            column_dependencies=UNVERIFIED_LMP_COLUMN_DEPENDENCIES,
+            required_columns=["Location Type"] if location_type else None,
         )
 
-        data["system_energy_price_rt"] = (
-            data["total_lmp_rt"]
-            - data["congestion_price_rt"]
-            - data["marginal_loss_price_rt"]
-        )
+        data = self._add_lmp_energy_price(data, "rt")
 
-        data = data.rename(columns={"type": "Location Type"})
+        data = data.rename(columns=LMP_FIELD_NAMES["rt"])
         if location_type:
             data = data[data["Location Type"] == location_type]
 
@@ -775,15 +1223,12 @@ class PJM(ISOBase):
                 "pnode_id": "Location Id",
                 "pnode_name": "Location Name",
                 "pnode_short_name": "Location Short Name",
-                "total_lmp_rt": "LMP",
-                "system_energy_price_rt": "Energy",
-                "congestion_price_rt": "Congestion",
-                "marginal_loss_price_rt": "Loss",
             },
         )
         data["Market"] = Markets.REAL_TIME_5_MIN.value
 
-        return data[
+        return self._select_columns(
+            data,
             [
                 "Time",
                 "Interval Start",
@@ -797,8 +1242,9 @@ class PJM(ISOBase):
                 "Energy",
                 "Congestion",
                 "Loss",
-            ]
-        ].sort_values("Interval Start")
+            ],
+            columns,
+        ).sort_values("Interval Start")
 
     @support_date_range(frequency="365D")
     def get_lmp_real_time_unverified_hourly(
@@ -808,11 +1254,18 @@ class PJM(ISOBase):
         locations: str | None = None,
         location_type: str | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        """Get real-time unverified hourly LMPs"""
+        """Get real-time unverified hourly LMPs
+
+        Args:
+            columns: output columns to return, in addition to Interval Start and
+                Interval End. Only the fields these columns need are requested
+                from PJM. Defaults to all columns.
+        """
 
         params = {
-            "fields": "datetime_beginning_utc, datetime_beginning_ept, pnode_name, type, total_lmp_rt, congestion_price_rt, marginal_loss_price_rt",
+            "fields": "datetime_beginning_utc, pnode_name, type, total_lmp_rt, congestion_price_rt, marginal_loss_price_rt",
         }
         if location_type:
             location_type = location_type.upper()
@@ -829,6 +1282,13 @@ class PJM(ISOBase):
             params=params,
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=LMP_UNVERIFIED_HOURLY_FIELD_NAMES,
+            column_dependencies=LMP_UNVERIFIED_HOURLY_COLUMN_DEPENDENCIES,
+            # the location filter matches on the pnode name
+            required_columns=(
+                ["Location"] if locations is not None and locations != "ALL" else None
+            ),
         )
         if locations == "hubs":
             locations = self.hub_node_ids
@@ -841,25 +1301,18 @@ class PJM(ISOBase):
                 map(int, locations),
             )
 
-        data["system_energy_price_rt"] = (
-            data["total_lmp_rt"]
-            - data["congestion_price_rt"]
-            - data["marginal_loss_price_rt"]
-        )
+        data = self._add_lmp_energy_price(data, "rt")
 
         df = data.rename(
             columns={
-                "pnode_name": "Location",
-                "type": "Location Type",
-                "total_lmp_rt": "LMP",
+                **LMP_UNVERIFIED_HOURLY_FIELD_NAMES,
                 "system_energy_price_rt": "Energy",
-                "congestion_price_rt": "Congestion",
-                "marginal_loss_price_rt": "Loss",
             },
         )
         df = df.sort_values("Interval Start").reset_index(drop=True)
 
-        return df[
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -869,8 +1322,9 @@ class PJM(ISOBase):
                 "Energy",
                 "Congestion",
                 "Loss",
-            ]
-        ]
+            ],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_it_sced_lmp_5_min(
@@ -878,12 +1332,20 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        """Get 5 minute LMPs from the Integrated Forward Market (IFM)"""
+        """Get 5 minute LMPs from the Integrated Forward Market (IFM)
 
+        Args:
+            columns: output columns to return, in addition to Interval Start and
+                Interval End. Only the fields these columns need are requested
+                from PJM. Defaults to all columns.
+        """
+
+        # pnode names come from the pnode lookup
         params = {
             "fields": (
-                "case_approval_datetime_utc,datetime_beginning_utc,itsced_lmp,marginal_congestion,marginal_loss,pnode_id,pnode_name"
+                "case_approval_datetime_utc,datetime_beginning_utc,itsced_lmp,marginal_congestion,marginal_loss,pnode_id"
             ),
         }
 
@@ -894,28 +1356,28 @@ class PJM(ISOBase):
             params=params,
             verbose=verbose,
             interval_duration_min=5,
+            columns=columns,
+            field_names=IT_SCED_LMP_5_MIN_FIELD_NAMES,
+            column_dependencies=IT_SCED_LMP_5_MIN_COLUMN_DEPENDENCIES,
         )
 
         df = self._add_pnode_info_to_lmp_data(df)
 
-        df.columns = df.columns.map(lambda x: x.replace("_", " ").title())
-
         df = df.rename(
             columns={
-                "Case Approval Datetime Utc": "Case Approval Time",
-                "Itsced Lmp": "LMP",
-                "Pnode Id": "Location Id",
-                "Pnode Name": "Location Name",
-                "Pnode Short Name": "Location Short Name",
-                "Marginal Congestion": "Congestion",
-                "Marginal Loss": "Loss",
+                **IT_SCED_LMP_5_MIN_FIELD_NAMES,
+                "pnode_id": "Location Id",
+                "pnode_name": "Location Name",
+                "pnode_short_name": "Location Short Name",
             },
         )
 
         # LMP = Energy + Congestion + Loss so Energy = LMP - Congestion - Loss
-        df["Energy"] = df["LMP"] - df["Congestion"] - df["Loss"]
+        if {"LMP", "Congestion", "Loss"} <= set(df.columns):
+            df["Energy"] = df["LMP"] - df["Congestion"] - df["Loss"]
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -927,13 +1389,15 @@ class PJM(ISOBase):
                 "Energy",
                 "Congestion",
                 "Loss",
-            ]
-        ]
+            ],
+            columns,
+        )
 
-        df["Case Approval Time"] = pd.to_datetime(
-            df["Case Approval Time"],
-            utc=True,
-        ).dt.tz_convert(self.default_timezone)
+        if "Case Approval Time" in df.columns:
+            df["Case Approval Time"] = pd.to_datetime(
+                df["Case Approval Time"],
+                utc=True,
+            ).dt.tz_convert(self.default_timezone)
 
         return df
 
@@ -943,7 +1407,15 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
+        """Get settlements verified 5 minute LMPs
+
+        Args:
+            columns: output columns to return, in addition to Interval Start and
+                Interval End. Only the fields these columns need are requested
+                from PJM. Defaults to all columns.
+        """
         df = self._get_pjm_json(
             "rt_fivemin_mnt_lmps",
             start=date,
@@ -954,35 +1426,38 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=SETTLEMENTS_VERIFIED_LMP_5_MIN_FIELD_NAMES,
+            # the rows are sorted by location name
+            required_columns=["Location Name"],
         )
 
-        return self._handle_settlements_verified_lmp_5_min(df)
+        return self._handle_settlements_verified_lmp(
+            df,
+            SETTLEMENTS_VERIFIED_LMP_5_MIN_FIELD_NAMES,
+            columns,
+        )
 
-    def _handle_settlements_verified_lmp_5_min(
+    def _handle_settlements_verified_lmp(
         self,
         data: pd.DataFrame,
+        field_names: dict[str, str],
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        rename = {
-            "Interval Start": "Interval Start",
-            "Interval End": "Interval End",
-            "pnode_id": "Location Id",
-            "pnode_name": "Location Name",
-            "type": "Location Type",
-            "voltage": "Voltage",
-            "equipment": "Equipment",
-            "zone": "Zone",
-            "total_lmp_rt": "LMP",
-            "system_energy_price_rt": "Energy",
-            "congestion_price_rt": "Congestion",
-            "marginal_loss_price_rt": "Loss",
-        }
-
-        data = data.rename(columns=rename)[rename.values()]
+        data = data.rename(columns=field_names).sort_values(
+            ["Interval Start", "Location Name"],
+        )
+        data = self._select_columns(
+            data,
+            ["Interval Start", "Interval End", *field_names.values()],
+            columns,
+        )
 
         for col in ["Location Type", "Zone"]:
-            data[col] = data[col].astype("category")
+            if col in data.columns:
+                data[col] = data[col].astype("category")
 
-        return data.sort_values(["Interval Start", "Location Name"])
+        return data
 
     @support_date_range(frequency=None)
     def get_settlements_verified_lmp_hourly(
@@ -990,7 +1465,15 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
+        """Get settlements verified hourly real-time and day-ahead LMPs
+
+        Args:
+            columns: output columns to return, in addition to Interval Start and
+                Interval End. Only the fields these columns need are requested
+                from PJM. Defaults to all columns.
+        """
         df = self._get_pjm_json(
             "rt_da_monthly_lmps",
             start=date,
@@ -1001,39 +1484,17 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=SETTLEMENTS_VERIFIED_LMP_HOURLY_FIELD_NAMES,
+            # the rows are sorted by location name
+            required_columns=["Location Name"],
         )
 
-        return self._handle_settlements_verified_lmp_hourly(df)
-
-    def _handle_settlements_verified_lmp_hourly(
-        self,
-        data: pd.DataFrame,
-    ) -> pd.DataFrame:
-        rename = {
-            "Interval Start": "Interval Start",
-            "Interval End": "Interval End",
-            "pnode_id": "Location Id",
-            "pnode_name": "Location Name",
-            "type": "Location Type",
-            "voltage": "Voltage",
-            "equipment": "Equipment",
-            "zone": "Zone",
-            "total_lmp_rt": "LMP RT",
-            "system_energy_price_rt": "Energy RT",
-            "congestion_price_rt": "Congestion RT",
-            "marginal_loss_price_rt": "Loss RT",
-            "total_lmp_da": "LMP DA",
-            "system_energy_price_da": "Energy DA",
-            "congestion_price_da": "Congestion DA",
-            "marginal_loss_price_da": "Loss DA",
-        }
-
-        data = data.rename(columns=rename)[rename.values()]
-
-        for col in ["Location Type", "Zone"]:
-            data[col] = data[col].astype("category")
-
-        return data.sort_values(["Interval Start", "Location Name"])
+        return self._handle_settlements_verified_lmp(
+            df,
+            SETTLEMENTS_VERIFIED_LMP_HOURLY_FIELD_NAMES,
+            columns,
+        )
 
     def _make_api_call(
         self,
@@ -1051,14 +1512,30 @@ class PJM(ISOBase):
         reason = ""
         while retries <= self.retries:
             try:
+                api_key = self._get_next_key()
+                headers = {
+                    **kwargs.get("headers", {}),
+                    "Ocp-Apim-Subscription-Key": api_key,
+                }
                 logger.info(f"Requesting {url} with {kwargs}")
                 if method == "POST":
-                    response = requests.post(url, timeout=REQUEST_TIMEOUT, **kwargs)
+                    response = self.session.post(
+                        url,
+                        timeout=REQUEST_TIMEOUT,
+                        **{**kwargs, "headers": headers},
+                    )
                 else:
-                    response = requests.get(url, timeout=REQUEST_TIMEOUT, **kwargs)
+                    response = self.session.get(
+                        url,
+                        timeout=REQUEST_TIMEOUT,
+                        **{**kwargs, "headers": headers},
+                    )
 
                 if response.status_code == 429:
                     reason = "Rate-limited"
+                    # Back off only this key. Requests from other threads move
+                    # to the other keys in the meantime
+                    self.rate_limiters[api_key].penalize(delay)
                 else:
                     response.raise_for_status()
                     return response.json()
@@ -1080,6 +1557,22 @@ class PJM(ISOBase):
             time.sleep(delay + random.uniform(0, delay * 0.1))
             delay *= 2
 
+    def _get_next_key(self) -> str:
+        """Returns the API key that can start a request soonest, after waiting
+        for that key's rate budget"""
+        with self._key_lock:
+            api_key = min(
+                self.api_keys,
+                key=lambda key: self.rate_limiters[key].next_slot(),
+            )
+            delay = self.rate_limiters[api_key].reserve()
+
+        # Sleep outside the lock so other threads can claim the other keys
+        if delay > 0:
+            time.sleep(delay)
+
+        return api_key
+
     def _get_pjm_json(
         self,
         endpoint: str,
@@ -1087,14 +1580,47 @@ class PJM(ISOBase):
         params: dict,
         end: str | pd.Timestamp | None = None,
         start_row: int = 1,
-        row_count: int = 50000,
+        row_count: int = MAX_ROWS_PER_REQUEST,
         interval_duration_min: float | None = None,
         filter_timestamp_name: str = "datetime_beginning",
         verbose: bool = False,
+        columns: list[str] | None = None,
+        field_names: dict[str, str] | None = None,
+        column_dependencies: dict[str, list[str]] | None = None,
+        required_columns: list[str] | None = None,
+        row_filter: Callable[[pd.DataFrame], pd.Series] | None = None,
     ):
+        """Retrieves all pages of a Data Miner query.
+
+        If columns is given, only the fields in params["fields"] needed for those
+        output columns are requested. field_names maps fields to the output
+        columns they are renamed to, and column_dependencies maps derived output
+        columns to the columns they are computed from. required_columns are
+        output columns the parsing always uses, like sort keys, so their fields
+        are requested whatever the columns. Fields that are not in field_names,
+        like timestamps, are always requested.
+
+        row_filter is applied to each page as it arrives and returns a boolean
+        mask of the rows to keep. Use it for filters the API cannot apply, so
+        that only the matching rows are held in memory.
+        """
         if start == "latest":
             raise NotSupported(f"{self.name} does not support 'latest'")
 
+        # Queries without a fields list, like archived feeds that don't accept
+        # one, return every field
+        if columns is not None and "fields" in params:
+            params = {
+                **params,
+                "fields": self._project_fields(
+                    params["fields"],
+                    columns,
+                    field_names or {},
+                    column_dependencies or {},
+                    required_columns,
+                ),
+            }
+
         default_params = {
             "startRow": start_row,
             "rowCount": row_count,
@@ -1126,11 +1652,8 @@ class PJM(ISOBase):
             params_to_log["Ocp-Apim-Subscription-Key"] = "API_KEY_HIDDEN"
 
         logger.info(f"Retrieving data from {endpoint} with params {params_to_log}")
-        r = self._make_api_call(
-            "https://api.pjm.com/api/v1/" + endpoint,
-            params=final_params,
-            headers={"Ocp-Apim-Subscription-Key": self.api_key},
-        )
+        url = "https://api.pjm.com/api/v1/" + endpoint
+        r = self._make_api_call(url, params=final_params)
 
         if "errors" in r:
             raise RuntimeError(r["errors"])
@@ -1139,32 +1662,30 @@ class PJM(ISOBase):
         if r["totalRows"] == 0:
             raise NoDataFoundException(f"No data found for {endpoint}")
 
-        df = pd.DataFrame(r["items"])
+        pages = [self._filter_page(self._items_to_frame(r["items"]), row_filter)]
 
+        # totalRows gives the offset of every remaining page up front, so they can
+        # be requested concurrently instead of following the next links
         num_pages = math.ceil(r["totalRows"] / row_count)
         if num_pages > 1:
-            to_add = [df]
-            for page in tqdm.tqdm(range(1, num_pages), initial=1, total=num_pages):
-                next_url = next(x for x in r["links"] if x["rel"] == "next")["href"]
-                r = self._make_api_call(
-                    next_url,
-                    headers={
-                        "Ocp-Apim-Subscription-Key": self.api_key,
-                    },
-                )
-                to_add.append(pd.DataFrame(r["items"]))
+            pages.extend(
+                self._fetch_pages_concurrently(
+                    url,
+                    final_params,
+                    start_rows=range(
+                        start_row + row_count,
+                        start_row + r["totalRows"],
+                        row_count,
+                    ),
+                    row_filter=row_filter,
+                ),
+            )
 
-            df = pd.concat(to_add)
+        df = pd.concat(pages) if len(pages) > 1 else pages[0]
 
         if "datetime_beginning_utc" in df.columns:
-            df["Interval Start"] = (
-                # Some datetimes from the source have milliseconds. Parsing these
-                # requires specifying the format.
-                pd.to_datetime(df["datetime_beginning_utc"], format="ISO8601")
-                .dt.tz_localize(
-                    "UTC",
-                )
-                .dt.tz_convert(self.default_timezone)
+            df["Interval Start"] = self._parse_utc_timestamps(
+                df["datetime_beginning_utc"],
             )
 
             # drop datetime_beginning_utc
@@ -1173,20 +1694,11 @@ class PJM(ISOBase):
             # PJM API is inclusive of end,
             # so we need to drop where end timestamp is included
             if end is not None:
-                df = df[
-                    df["Interval Start"].dt.strftime(
-                        "%Y-%m-%d %H:%M",
-                    )
-                    != end.strftime("%Y-%m-%d %H:%M")
-                ]
+                df = df[self._not_in_end_minute(df["Interval Start"], end)]
 
             if "datetime_ending_utc" in df.columns:
-                df["Interval End"] = (
-                    pd.to_datetime(df["datetime_ending_utc"], format="ISO8601")
-                    .dt.tz_localize(
-                        "UTC",
-                    )
-                    .dt.tz_convert(self.default_timezone)
+                df["Interval End"] = self._parse_utc_timestamps(
+                    df["datetime_ending_utc"],
                 )
 
                 # drop datetime_ending_utc
@@ -1201,6 +1713,149 @@ class PJM(ISOBase):
 
         return df
 
+    @staticmethod
+    def _project_fields(
+        fields: str,
+        columns: list[str],
+        field_names: dict[str, str],
+        column_dependencies: dict[str, list[str]],
+        required_columns: list[str] | None = None,
+    ) -> str:
+        """Returns the fields needed to produce columns"""
+        available = {
+            *TIME_COLUMNS,
+            *field_names.values(),
+            *column_dependencies,
+        }
+        unknown = [column for column in columns if column not in available]
+        if unknown:
+            raise ValueError(
+                f"Unknown columns {unknown}. Available columns: {sorted(available)}",
+            )
+
+        requested = [*TIME_COLUMNS, *columns, *(required_columns or [])]
+        needed = set(requested)
+        for column in requested:
+            needed.update(column_dependencies.get(column, []))
+
+        return ",".join(
+            field
+            for field in (field.strip() for field in fields.split(","))
+            if field not in field_names or field_names[field] in needed
+        )
+
+    @staticmethod
+    def _select_columns(
+        df: pd.DataFrame,
+        output_columns: list[str],
+        columns: list[str] | None,
+    ) -> pd.DataFrame:
+        """Selects output_columns, limited to columns and the time columns if
+        columns is given"""
+        if columns is not None:
+            keep = {*TIME_COLUMNS, *columns}
+            output_columns = [column for column in output_columns if column in keep]
+
+        return df[output_columns]
+
+    def _fetch_pages_concurrently(
+        self,
+        url: str,
+        params: dict,
+        start_rows: range,
+        row_filter: Callable[[pd.DataFrame], pd.Series] | None = None,
+    ) -> list[pd.DataFrame]:
+        """Fetches the pages of a Data Miner query starting at each of start_rows
+        on a thread pool and returns them in order. _make_api_call keeps the
+        threads within the shared rate budget. Each page is filtered with
+        row_filter before the next one is parsed, so rows that are filtered out
+        are released right away."""
+
+        def fetch_page(start_row: int) -> pd.DataFrame:
+            r = self._make_api_call(url, params={**params, "startRow": start_row})
+            return self._filter_page(self._items_to_frame(r["items"]), row_filter)
+
+        with (
+            ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(start_rows)),
+            ) as executor,
+            tqdm.tqdm(initial=1, total=len(start_rows) + 1) as pbar,
+        ):
+            futures = [
+                executor.submit(fetch_page, start_row) for start_row in start_rows
+            ]
+            for _ in as_completed(futures):
+                pbar.update(1)
+
+            return [future.result() for future in futures]
+
+    def _parse_utc_timestamps(self, values: pd.Series) -> pd.Series:
+        """Parses PJM's UTC datetime strings into the default timezone.
+
+        Rows of a query share a small set of timestamps, so only the unique
+        values are parsed. They are parsed with the fixed format PJM uses, and
+        only the values that carry milliseconds fall back to the slower ISO8601
+        parser.
+        """
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Series(uniques)
+
+        parsed = pd.to_datetime(uniques, format="%Y-%m-%dT%H:%M:%S", errors="coerce")
+        fallback = parsed.isna()
+        if fallback.any():
+            parsed[fallback] = pd.to_datetime(uniques[fallback], format="ISO8601")
+
+        parsed = parsed.dt.tz_localize("UTC").dt.tz_convert(self.default_timezone)
+
+        # Missing values have code -1, which allow_fill turns into NaT
+        return pd.Series(
+            parsed.array.take(codes, allow_fill=True),
+            index=values.index,
+        )
+
+    @staticmethod
+    def _not_in_end_minute(
+        interval_start: pd.Series,
+        end: pd.Timestamp,
+    ) -> np.ndarray:
+        """Returns a mask of the rows whose local wall clock time is not in the
+        same minute as end's.
+
+        Compares integer minutes instead of formatting every timestamp with
+        strftime, which takes seconds on large LMP frames.
+        """
+        start_minutes = (
+            interval_start.dt.tz_localize(None).to_numpy().astype("datetime64[m]")
+        )
+        end_minute = np.datetime64(end.tz_localize(None).to_datetime64(), "m")
+        return start_minutes != end_minute
+
+    @staticmethod
+    def _filter_page(
+        page: pd.DataFrame,
+        row_filter: Callable[[pd.DataFrame], pd.Series] | None,
+    ) -> pd.DataFrame:
+        if row_filter is None or page.empty:
+            return page
+
+        # Copy so the filtered rows do not keep the whole page alive
+        return page[row_filter(page)].copy()
+
+    @staticmethod
+    def _items_to_frame(items: list[dict]) -> pd.DataFrame:
+        """Builds a DataFrame from Data Miner items one column at a time.
+
+        Every item has the same fields, so each column is collected into a list
+        that pandas converts to a single typed array. This is much faster than
+        pd.DataFrame(items), which infers the columns item by item.
+        """
+        if not items:
+            return pd.DataFrame()
+
+        return pd.DataFrame(
+            {field: [item[field] for item in items] for field in items[0]},
+        )
+
     def get_raw_interconnection_queue(self, verbose: bool = False) -> BinaryIO:
         url = "https://services.pjm.com/PJMPlanningApi/api/Queue/ExportToXls"
         response = requests.post(
@@ -1279,6 +1934,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the hourly solar forecast including behind the meter solar forecast.
@@ -1289,6 +1945,9 @@ class PJM(ISOBase):
             date (str | pd.Timestamp): Start datetime for data
             end (str | pd.Timestamp | None, optional): End datetime for data. Defaults to None.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pd.DataFrame: A DataFrame with the solar forecast data.
@@ -1306,9 +1965,11 @@ class PJM(ISOBase):
             filter_timestamp_name="evaluated_at",
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=SOLAR_FORECAST_FIELD_NAMES,
         )
 
-        return self._parse_solar_forecast(df)
+        return self._parse_solar_forecast(df, columns)
 
     @support_date_range(frequency=None)
     def get_solar_forecast_5_min(
@@ -1316,6 +1977,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the 5-min solar forecast including behind the meter solar forecast.
@@ -1326,6 +1988,9 @@ class PJM(ISOBase):
             date (str | pd.Timestamp): Start datetime for data
             end (str | pd.Timestamp | None, optional): End datetime for data. Defaults to None.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pd.DataFrame: A DataFrame with the solar forecast data.
@@ -1343,33 +2008,36 @@ class PJM(ISOBase):
             filter_timestamp_name="evaluated_at",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=SOLAR_FORECAST_FIELD_NAMES,
         )
 
-        return self._parse_solar_forecast(df)
+        return self._parse_solar_forecast(df, columns)
 
-    def _parse_solar_forecast(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "evaluated_at_utc": "Publish Time",
-                "solar_forecast_btm_mwh": "Solar Forecast BTM",
-                "solar_forecast_mwh": "Solar Forecast",
-            },
-        )
+    def _parse_solar_forecast(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=SOLAR_FORECAST_FIELD_NAMES)
 
-        df["Publish Time"] = pd.to_datetime(
-            df["Publish Time"],
-            utc=True,
-        ).dt.tz_convert(self.default_timezone)
+        if "Publish Time" in df.columns:
+            df["Publish Time"] = pd.to_datetime(
+                df["Publish Time"],
+                utc=True,
+            ).dt.tz_convert(self.default_timezone)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
                 "Publish Time",
                 "Solar Forecast BTM",
                 "Solar Forecast",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -1379,6 +2047,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the hourly wind forecast
@@ -1389,6 +2058,9 @@ class PJM(ISOBase):
             date (str | pd.Timestamp): Start datetime for data
             end (Optional[str  |  pd.Timestamp], optional): End datetime for data. Defaults to None.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pd.DataFrame: A DataFrame with the wind forecast data.
@@ -1406,9 +2078,11 @@ class PJM(ISOBase):
             filter_timestamp_name="evaluated_at",
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=WIND_FORECAST_FIELD_NAMES,
         )
 
-        return self._parse_wind_forecast(df)
+        return self._parse_wind_forecast(df, columns)
 
     @support_date_range(frequency=None)
     def get_wind_forecast_5_min(
@@ -1416,6 +2090,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the 5-min wind forecast
@@ -1426,6 +2101,9 @@ class PJM(ISOBase):
             date (str | pd.Timestamp): Start datetime for data
             end (Optional[str  |  pd.Timestamp], optional): End datetime for data. Defaults to None.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pd.DataFrame: A DataFrame with the wind forecast data.
@@ -1443,31 +2121,35 @@ class PJM(ISOBase):
             filter_timestamp_name="evaluated_at",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=WIND_FORECAST_FIELD_NAMES,
         )
 
-        return self._parse_wind_forecast(df)
+        return self._parse_wind_forecast(df, columns)
 
-    def _parse_wind_forecast(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "evaluated_at_utc": "Publish Time",
-                "wind_forecast_mwh": "Wind Forecast",
-            },
-        )
+    def _parse_wind_forecast(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=WIND_FORECAST_FIELD_NAMES)
 
-        df["Publish Time"] = pd.to_datetime(
-            df["Publish Time"],
-            utc=True,
-        ).dt.tz_convert(self.default_timezone)
+        if "Publish Time" in df.columns:
+            df["Publish Time"] = pd.to_datetime(
+                df["Publish Time"],
+                utc=True,
+            ).dt.tz_convert(self.default_timezone)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
                 "Publish Time",
                 "Wind Forecast",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -1477,10 +2159,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the generation outage data
         From: https://dataminer2.pjm.com/feed/gen_outages_by_type/definition
+
+        Args:
+            columns: output columns to return, in addition to Interval Start and Interval End.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -1494,28 +2182,26 @@ class PJM(ISOBase):
             end=end,
             filter_timestamp_name="forecast_execution_date",
             verbose=verbose,
+            columns=columns,
+            field_names=GEN_OUTAGES_BY_TYPE_FIELD_NAMES,
         )
 
-        return self._parse_gen_outages_by_type(df)
+        return self._parse_gen_outages_by_type(df, columns)
 
-    def _parse_gen_outages_by_type(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "forecast_execution_date_ept": "Publish Time",
-                "forecast_date": "Interval Start",
-                "region": "Region",
-                "planned_outages_mw": "Planned Outages MW",
-                "maintenance_outages_mw": "Maintenance Outages MW",
-                "forced_outages_mw": "Forced Outages MW",
-                "total_outages_mw": "Total Outages MW",
-            },
-        )
+    def _parse_gen_outages_by_type(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=GEN_OUTAGES_BY_TYPE_FIELD_NAMES)
 
         df["Interval Start"] = self.to_local_datetime(df, "Interval Start")
         df["Interval End"] = df["Interval Start"] + pd.DateOffset(days=1)
-        df["Publish Time"] = self.to_local_datetime(df, "Publish Time")
+        if "Publish Time" in df.columns:
+            df["Publish Time"] = self.to_local_datetime(df, "Publish Time")
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -1525,8 +2211,9 @@ class PJM(ISOBase):
                 "Maintenance Outages MW",
                 "Forced Outages MW",
                 "Total Outages MW",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -1537,10 +2224,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """RTO-wide projected data for the peak of the day
 
         https://dataminer2.pjm.com/feed/ops_sum_frcst_peak_rto/definition
+
+        Args:
+            columns: output columns to return, in addition to Interval Start and Interval End.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -1556,13 +2249,17 @@ class PJM(ISOBase):
             end=end,
             filter_timestamp_name="generated_at",
             verbose=verbose,
+            columns=columns,
+            field_names=PROJECTED_RTO_STATISTICS_AT_PEAK_FIELD_NAMES,
+            required_columns=["Projected Peak Time", "Publish Time"],
         )
 
-        return self._handle_projected_rto_statistics_at_peak(df)
+        return self._handle_projected_rto_statistics_at_peak(df, columns)
 
     def _handle_projected_rto_statistics_at_peak(
         self,
         df: pd.DataFrame,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         df["projected_peak_datetime_ept"] = pd.to_datetime(
             df["projected_peak_datetime_ept"],
@@ -1571,20 +2268,9 @@ class PJM(ISOBase):
             self.default_timezone,
         )
 
-        df = df.rename(
-            columns={
-                "projected_peak_datetime_ept": "Projected Peak Time",
-                "generated_at_ept": "Publish Time",
-                "area": "Area",
-                "internal_scheduled_capacity": "Internal Scheduled Capacity",
-                "scheduled_tie_flow_total": "Scheduled Tie Flow Total",
-                "capacity_adjustments": "Capacity Adjustments",
-                "total_scheduled_capacity": "Total Scheduled Capacity",
-                "load_forecast": "Load Forecast",
-                "operating_reserve": "Operating Reserve",
-                "unscheduled_steam_capacity": "Unscheduled Steam Capacity",
-            },
-        ).drop(columns=["projected_peak_datetime_utc"])
+        df = df.rename(columns=PROJECTED_RTO_STATISTICS_AT_PEAK_FIELD_NAMES).drop(
+            columns=["projected_peak_datetime_utc"],
+        )
 
         df["Interval Start"] = df["Projected Peak Time"].dt.floor("D")
         df["Interval End"] = df["Interval Start"] + pd.DateOffset(days=1)
@@ -1593,8 +2279,9 @@ class PJM(ISOBase):
             df,
             ["Interval Start", "Interval End", "Publish Time"],
         )
+        df = df.sort_values("Publish Time").reset_index(drop=True)
 
-        return df.sort_values("Publish Time").reset_index(drop=True)
+        return self._select_columns(df, list(df.columns), columns)
 
     @support_date_range(frequency="365D")
     def get_projected_area_statistics_at_peak(
@@ -1602,10 +2289,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """Area projected data for the peak of the day
 
         https://dataminer2.pjm.com/feed/ops_sum_frcst_peak_area/definition
+
+        Args:
+            columns: output columns to return, in addition to Interval Start and Interval End.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -1619,13 +2312,17 @@ class PJM(ISOBase):
             end=end,
             filter_timestamp_name="generated_at",
             verbose=verbose,
+            columns=columns,
+            field_names=PROJECTED_AREA_STATISTICS_AT_PEAK_FIELD_NAMES,
+            required_columns=["Projected Peak Time", "Publish Time"],
         )
 
-        return self._handle_projected_area_statistics_at_peak(df)
+        return self._handle_projected_area_statistics_at_peak(df, columns)
 
     def _handle_projected_area_statistics_at_peak(
         self,
         df: pd.DataFrame,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         df["projected_peak_datetime_ept"] = pd.to_datetime(
             df["projected_peak_datetime_ept"],
@@ -1635,16 +2332,9 @@ class PJM(ISOBase):
             self.default_timezone,
         )
 
-        df = df.rename(
-            columns={
-                "projected_peak_datetime_ept": "Projected Peak Time",
-                "generated_at_ept": "Publish Time",
-                "area": "Area",
-                "internal_scheduled_capacity": "Internal Scheduled Capacity",
-                "pjm_load_forecast": "PJM Load Forecast",
-                "unscheduled_steam_capacity": "Unscheduled Steam Capacity",
-            },
-        ).drop(columns=["projected_peak_datetime_utc"])
+        df = df.rename(columns=PROJECTED_AREA_STATISTICS_AT_PEAK_FIELD_NAMES).drop(
+            columns=["projected_peak_datetime_utc"],
+        )
 
         df["Interval Start"] = df["Projected Peak Time"].dt.floor("D")
         df["Interval End"] = df["Interval Start"] + pd.DateOffset(days=1)
@@ -1653,8 +2343,9 @@ class PJM(ISOBase):
             df,
             ["Interval Start", "Interval End", "Publish Time"],
         )
+        df = df.sort_values("Publish Time").reset_index(drop=True)
 
-        return df.sort_values("Publish Time").reset_index(drop=True)
+        return self._select_columns(df, list(df.columns), columns)
 
     def to_local_datetime(self, df: pd.DataFrame, column_name: str) -> pd.Series:
         return pd.to_datetime(df[column_name]).dt.tz_localize(
@@ -1667,6 +2358,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the 5 min solar generation data from:
@@ -1678,6 +2370,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with 5 minute solar generation data.
@@ -1694,24 +2389,28 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=SOLAR_GENERATION_5_MIN_FIELD_NAMES,
         )
 
-        return self._parse_solar_generation_5_min(df)
+        return self._parse_solar_generation_5_min(df, columns)
 
-    def _parse_solar_generation_5_min(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "solar_generation_mw": "Solar Generation",
-            },
-        )
+    def _parse_solar_generation_5_min(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=SOLAR_GENERATION_5_MIN_FIELD_NAMES)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
                 "Solar Generation",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -1721,6 +2420,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the instantaneous wind generation data from:
@@ -1732,6 +2432,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with instantaneous wind generation data
@@ -1749,24 +2452,28 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=0.25,
             verbose=verbose,
+            columns=columns,
+            field_names=WIND_GENERATION_INSTANTANEOUS_FIELD_NAMES,
         )
 
-        return self._parse_wind_generation_instantaneous(df)
+        return self._parse_wind_generation_instantaneous(df, columns)
 
-    def _parse_wind_generation_instantaneous(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "wind_generation_mw": "Wind Generation",
-            },
-        )
+    def _parse_wind_generation_instantaneous(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=WIND_GENERATION_INSTANTANEOUS_FIELD_NAMES)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
                 "Wind Generation",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -1776,6 +2483,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the reserve market quantities in Megawatts from:
@@ -1787,6 +2495,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with reserve market quantities
@@ -1804,26 +2515,29 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=0.25,
             verbose=verbose,
+            columns=columns,
+            field_names=OPERATIONAL_RESERVES_FIELD_NAMES,
         )
 
-        return self._parse_operational_reserves(df)
+        return self._parse_operational_reserves(df, columns)
 
-    def _parse_operational_reserves(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "reserve_name": "Reserve Name",
-                "reserve_mw": "Reserve",
-            },
-        )
+    def _parse_operational_reserves(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=OPERATIONAL_RESERVES_FIELD_NAMES)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
                 "Reserve Name",
                 "Reserve",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -1833,6 +2547,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the transfer interface information from:
@@ -1844,6 +2559,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with transfer interface information
@@ -1861,24 +2579,21 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=TRANSFER_INTERFACE_INFORMATION_5_MIN_FIELD_NAMES,
         )
 
-        return self._parse_transfer_interface_information_5_min(df)
+        return self._parse_transfer_interface_information_5_min(df, columns)
 
     def _parse_transfer_interface_information_5_min(
         self,
         df: pd.DataFrame,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "name": "Interface Name",
-                "actual_flow": "Actual Flow",
-                "warning_level": "Warning Level",
-                "transfer_limit": "Transfer Limit",
-            },
-        )
+        df = df.rename(columns=TRANSFER_INTERFACE_INFORMATION_5_MIN_FIELD_NAMES)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -1886,8 +2601,9 @@ class PJM(ISOBase):
                 "Actual Flow",
                 "Warning Level",
                 "Transfer Limit",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -1897,6 +2613,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the current transmission limit information from:
@@ -1909,6 +2626,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with transmission limit information
@@ -1926,35 +2646,21 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=TRANSMISSION_LIMITS_FIELD_NAMES,
+            required_columns=["Constraint Name"],
         )
 
-        return self._parse_transmission_limits(df, date, end)
+        return self._parse_transmission_limits(df, date, end, columns)
 
     def _parse_transmission_limits(
         self,
         df: pd.DataFrame,
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "constraint_name": "Constraint Name",
-                "constraint_type": "Constraint Type",
-                "contingency": "Contingency",
-                "shadow_price": "Shadow Price",
-            },
-        )
-
-        df = df[
-            [
-                "Interval Start",
-                "Interval End",
-                "Constraint Name",
-                "Constraint Type",
-                "Contingency",
-                "Shadow Price",
-            ]
-        ]
+        df = df.rename(columns=TRANSMISSION_LIMITS_FIELD_NAMES)
 
         # When there are no binding constraints, PJM publishes rows with "Constraint
         # Name" == "none". We do not want to return these rows.
@@ -1965,6 +2671,19 @@ class PJM(ISOBase):
                 f"No transmission limits found for {date} to {end}",
             )
 
+        df = self._select_columns(
+            df,
+            [
+                "Interval Start",
+                "Interval End",
+                "Constraint Name",
+                "Constraint Type",
+                "Contingency",
+                "Shadow Price",
+            ],
+            columns,
+        )
+
         return df.sort_values("Interval Start").reset_index(drop=True)
 
     @support_date_range(frequency=None)
@@ -2100,6 +2819,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ):
         """
         Retrieves the day-ahead ancillary service market results from :
@@ -2111,6 +2831,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with day-ahead ancillary service
@@ -2129,38 +2852,34 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=AS_MARKET_RESULTS_DAY_AHEAD_FIELD_NAMES,
+            column_dependencies=AS_MARKET_RESULTS_COLUMN_DEPENDENCIES,
         )
 
-        return self._parse_dam_as_market_results(df)
-
-    def _parse_dam_as_market_results(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "locale": "Locale",
-                "service": "Service Type",
-                "mcp": "Market Clearing Price",
-                "mcp_capped": "Market Clearing Price Capped",
-                "as_req_mw": "Ancillary Service Required",
-                "total_mw": "Total MW",
-                "as_mw": "Assigned MW",
-                "ss_mw": "Self-Scheduled MW",
-                "ircmwt2": "Interface Reserve Capability MW",
-                "dsr_as_mw": "Demand Response MW Assigned",
-                "nsr_mw": "Non-Synchronized Reserve MW Assigned",
-            },
-        )
+        return self._parse_dam_as_market_results(df, columns=columns)
 
-        # Add new Ancillary Service column
-        locale_full_name_to_abbreviation = {
-            v: k for k, v in self.locale_abbreviated_to_full.items()
-        }
-        df["Ancillary Service"] = (
-            df["Locale"].replace(locale_full_name_to_abbreviation)
-            + "-"
-            + df["Service Type"]
-        )
+    def _parse_dam_as_market_results(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=AS_MARKET_RESULTS_DAY_AHEAD_FIELD_NAMES)
+
+        # Add new Ancillary Service column. Locale and Service Type are only
+        # missing when the caller asked for columns that do not need them
+        if {"Locale", "Service Type"} <= set(df.columns):
+            locale_full_name_to_abbreviation = {
+                v: k for k, v in self.locale_abbreviated_to_full.items()
+            }
+            df["Ancillary Service"] = (
+                df["Locale"].replace(locale_full_name_to_abbreviation)
+                + "-"
+                + df["Service Type"]
+            )
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2176,8 +2895,9 @@ class PJM(ISOBase):
                 "Interface Reserve Capability MW",
                 "Demand Response MW Assigned",
                 "Non-Synchronized Reserve MW Assigned",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -2187,6 +2907,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ):
         """
         Retrieves the real-time ancillary service market results from :
@@ -2202,6 +2923,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with real-time ancillary service
@@ -2234,47 +2958,39 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=interval_duration,
             verbose=verbose,
+            columns=columns,
+            field_names=AS_MARKET_RESULTS_REAL_TIME_FIELD_NAMES,
+            column_dependencies=AS_MARKET_RESULTS_COLUMN_DEPENDENCIES,
         )
 
-        return self._parse_real_time_as_market_results(df)
+        return self._parse_real_time_as_market_results(df, columns=columns)
 
-    def _parse_real_time_as_market_results(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "locale": "Locale",
-                "service": "Service Type",
-                "mcp": "Market Clearing Price",
-                "mcp_capped": "Market Clearing Price Capped",
-                "reg_ccp": "Regulation Capability Clearing Price",
-                "reg_pcp": "Regulation Performance Clearing Price",
-                "as_req_mw": "Ancillary Service Required",
-                "total_mw": "Total MW",
-                "as_mw": "Assigned MW",
-                "ss_mw": "Self-Scheduled MW",
-                "tier1_mw": "Tier 1 MW",
-                "ircmwt2": "Interface Reserve Capability MW",
-                "dsr_as_mw": "Demand Response MW Assigned",
-                "nsr_mw": "Non-Synchronized Reserve MW Assigned",
-                "regd_mw": "REGD MW",
-            },
-        )
+    def _parse_real_time_as_market_results(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=AS_MARKET_RESULTS_REAL_TIME_FIELD_NAMES)
         # Replace abbreviated locale values will full values
         df = df.replace({"Locale": self.locale_abbreviated_to_full})
 
         # Replace abbreviated service type values with full values
         df = df.replace({"Service Type": self.service_type_abbreviated_to_full})
 
-        # Add new Ancillary Service column
-        locale_full_name_to_abbreviation = {
-            v: k for k, v in self.locale_abbreviated_to_full.items()
-        }
-        df["Ancillary Service"] = (
-            df["Locale"].replace(locale_full_name_to_abbreviation)
-            + "-"
-            + df["Service Type"]
-        )
+        # Add new Ancillary Service column. Locale and Service Type are only
+        # missing when the caller asked for columns that do not need them
+        if {"Locale", "Service Type"} <= set(df.columns):
+            locale_full_name_to_abbreviation = {
+                v: k for k, v in self.locale_abbreviated_to_full.items()
+            }
+            df["Ancillary Service"] = (
+                df["Locale"].replace(locale_full_name_to_abbreviation)
+                + "-"
+                + df["Service Type"]
+            )
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2294,8 +3010,9 @@ class PJM(ISOBase):
                 "Demand Response MW Assigned",
                 "Non-Synchronized Reserve MW Assigned",
                 "REGD MW",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -2305,6 +3022,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ):
         """
         Retrieves hourly real-time ancillary service market results prior to 2022-09-01.
@@ -2317,6 +3035,9 @@ class PJM(ISOBase):
             date: Start date. Must be between 2013-06-14 and 2022-08-31.
             end: End date. Must be before 2022-09-01.
             verbose: Print verbose output.
+            columns: Output columns to return, in addition to Interval Start and
+                Interval End. Only the fields these columns need are requested
+                from PJM. Defaults to all columns.
 
         Returns:
             DataFrame with hourly AS market results.
@@ -2350,9 +3071,12 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=AS_MARKET_RESULTS_REAL_TIME_FIELD_NAMES,
+            column_dependencies=AS_MARKET_RESULTS_COLUMN_DEPENDENCIES,
         )
 
-        return self._parse_real_time_as_market_results(df)
+        return self._parse_real_time_as_market_results(df, columns=columns)
 
     @support_date_range(frequency=None)
     def get_load_metered_hourly(
@@ -2360,11 +3084,17 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ):
         """
         Retrieves the hourly metered load data from:
 
         https://dataminer2.pjm.com/feed/hrl_load_metered/definition
+
+        Arguments:
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2377,23 +3107,21 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=LOAD_METERED_HOURLY_FIELD_NAMES,
         )
 
-        return self._parse_load_metered_hourly(df)
+        return self._parse_load_metered_hourly(df, columns=columns)
 
-    def _parse_load_metered_hourly(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "load_area": "Load Area",
-                "mkt_region": "Mkt Region",
-                "mw": "MW",
-                "nerc_region": "NERC Region",
-                "zone": "Zone",
-                "is_verified": "Is Verified",
-            },
-        )
+    def _parse_load_metered_hourly(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=LOAD_METERED_HOURLY_FIELD_NAMES)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2403,8 +3131,9 @@ class PJM(ISOBase):
                 "Load Area",
                 "MW",
                 "Is Verified",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -2414,11 +3143,17 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ):
         """
         Retrieves the forecasted generation outages for the next 90 days from:
 
         https://dataminer2.pjm.com/feed/frcstd_gen_outages/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2431,26 +3166,26 @@ class PJM(ISOBase):
             filter_timestamp_name="forecast_execution_date",
             interval_duration_min=1440,
             verbose=verbose,
+            columns=columns,
+            field_names=FORECASTED_GENERATION_OUTAGES_FIELD_NAMES,
         )
 
-        return self._parse_forecasted_generation_outages(df)
+        return self._parse_forecasted_generation_outages(df, columns)
 
-    def _parse_forecasted_generation_outages(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(
-            columns={
-                "forecast_execution_date_ept": "Publish Time",
-                "forecast_date": "Interval Start",
-                "forecast_gen_outage_mw_rto": "RTO MW",
-                "forecast_gen_outage_mw_west": "West MW",
-                "forecast_gen_outage_mw_other": "Other MW",
-            },
-        )
+    def _parse_forecasted_generation_outages(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        df = df.rename(columns=FORECASTED_GENERATION_OUTAGES_FIELD_NAMES)
 
         df["Interval Start"] = self.to_local_datetime(df, "Interval Start")
         df["Interval End"] = df["Interval Start"] + pd.DateOffset(days=1)
-        df["Publish Time"] = self.to_local_datetime(df, "Publish Time")
+        if "Publish Time" in df.columns:
+            df["Publish Time"] = self.to_local_datetime(df, "Publish Time")
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2458,8 +3193,9 @@ class PJM(ISOBase):
                 "RTO MW",
                 "West MW",
                 "Other MW",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -2469,10 +3205,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the marginal value data from:
         https://dataminer2.pjm.com/feed/rt_marginal_value/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         df = self._get_pjm_json(
             "rt_marginal_value",
@@ -2484,19 +3226,14 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=MARGINAL_VALUE_REAL_TIME_5_MIN_FIELD_NAMES,
         )
 
-        df = df.rename(
-            columns={
-                "monitored_facility": "Monitored Facility",
-                "contingency_facility": "Contingency Facility",
-                "transmission_constraint_penalty_factor": "Transmission Constraint Penalty Factor",
-                "limit_control_percentage": "Limit Control Percentage",
-                "shadow_price": "Shadow Price",
-            },
-        )
+        df = df.rename(columns=MARGINAL_VALUE_REAL_TIME_5_MIN_FIELD_NAMES)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2505,8 +3242,9 @@ class PJM(ISOBase):
                 "Transmission Constraint Penalty Factor",
                 "Limit Control Percentage",
                 "Shadow Price",
-            ]
-        ]
+            ],
+            columns,
+        )
         return df
 
     @support_date_range(frequency=None)
@@ -2515,10 +3253,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the marginal value data from:
         https://dataminer2.pjm.com/feed/da_marginal_value/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         df = self._get_pjm_json(
             "da_marginal_value",
@@ -2530,23 +3274,21 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=MARGINAL_VALUE_DAY_AHEAD_HOURLY_FIELD_NAMES,
         )
-        df = df.rename(
-            columns={
-                "monitored_facility": "Monitored Facility",
-                "contingency_facility": "Contingency Facility",
-                "shadow_price": "Shadow Price",
-            },
-        )
-        df = df[
+        df = df.rename(columns=MARGINAL_VALUE_DAY_AHEAD_HOURLY_FIELD_NAMES)
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
                 "Monitored Facility",
                 "Contingency Facility",
                 "Shadow Price",
-            ]
-        ]
+            ],
+            columns,
+        )
         return df
 
     @support_date_range(frequency=None)
@@ -2555,10 +3297,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the transmission constraints data from:
         https://dataminer2.pjm.com/feed/da_transconstraints/definition
+
+        Arguments:
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these columns
+                need are requested from PJM. Defaults to all columns.
         """
         df = self._get_pjm_json(
             "da_transconstraints",
@@ -2570,16 +3318,12 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=TRANSMISSION_CONSTRAINTS_DAY_AHEAD_FIELD_NAMES,
         )
-        df = df.rename(
-            columns={
-                "duration": "Duration",
-                "day_ahead_congestion_event": "Day Ahead Congestion Event",
-                "monitored_facility": "Monitored Facility",
-                "contingency_facility": "Contingency Facility",
-            },
-        )
-        df = df[
+        df = df.rename(columns=TRANSMISSION_CONSTRAINTS_DAY_AHEAD_FIELD_NAMES)
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2587,8 +3331,9 @@ class PJM(ISOBase):
                 "Day Ahead Congestion Event",
                 "Monitored Facility",
                 "Contingency Facility",
-            ]
-        ]
+            ],
+            columns,
+        )
         return df
 
     @support_date_range(frequency=None)
@@ -2597,10 +3342,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the day ahead demand bids data from:
         https://dataminer2.pjm.com/feed/hrl_dmd_bids/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2613,15 +3364,16 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=60,
             verbose=verbose,
-        ).rename(
-            columns={
-                "hrly_da_demand_bid": "Demand Bid",
-                "area": "Area",
-            },
-        )
+            columns=columns,
+            field_names=DAY_AHEAD_DEMAND_BIDS_FIELD_NAMES,
+            required_columns=["Area"],
+        ).rename(columns=DAY_AHEAD_DEMAND_BIDS_FIELD_NAMES)
 
-        df = df[["Interval Start", "Interval End", "Area", "Demand Bid"]].sort_values(
-            ["Interval Start", "Area"],
+        df = df.sort_values(["Interval Start", "Area"])
+        df = self._select_columns(
+            df,
+            ["Interval Start", "Interval End", "Area", "Demand Bid"],
+            columns,
         )
 
         return df
@@ -2632,10 +3384,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the area control error data from:
         https://dataminer2.pjm.com/feed/area_control_error/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2646,13 +3404,11 @@ class PJM(ISOBase):
                 "fields": "datetime_beginning_utc,ace_mw",
             },
             verbose=verbose,
+            columns=columns,
+            field_names=AREA_CONTROL_ERROR_FIELD_NAMES,
         )
-        df = df.rename(
-            columns={
-                "ace_mw": "Area Control Error",
-            },
-        )
-        return df[["Time", "Area Control Error"]]
+        df = df.rename(columns=AREA_CONTROL_ERROR_FIELD_NAMES)
+        return self._select_columns(df, ["Time", "Area Control Error"], columns)
 
     @support_date_range(frequency=None)
     def get_dispatched_reserves_prelim(
@@ -2660,10 +3416,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the dispatched reserves preliminary data from:
         https://dataminer2.pjm.com/feed/dispatched_reserves/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2675,28 +3437,21 @@ class PJM(ISOBase):
             },
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=DISPATCHED_RESERVES_PRELIM_FIELD_NAMES,
+            column_dependencies=DISPATCHED_RESERVES_COLUMN_DEPENDENCIES,
         )
 
-        df = df.rename(
-            columns={
-                "area": "Area",
-                "reserve_type": "Reserve Type",
-                "reserve_quantity": "Reserve Quantity",
-                "reserve_requirement": "Reserve Requirement",
-                "reliability_requirement": "Reliability Requirement",
-                "extended_requirement": "Extended Requirement",
-                "mw_adjustment": "MW Adjustment",
-                "market_clearing_price": "Market Clearing Price",
-                "shortage_indicator": "Shortage Indicator",
-            },
-        )
-
-        df["Area"] = df["Area"].str.replace("Mid-Atlantic/Dominion", "MAD")
-        df["Ancillary Service"] = df["Area"] + "-" + df["Reserve Type"]
+        df = df.rename(columns=DISPATCHED_RESERVES_PRELIM_FIELD_NAMES)
 
-        df = df.replace({"Area": self.locale_abbreviated_to_full})
+        if "Area" in df.columns:
+            df["Area"] = df["Area"].str.replace("Mid-Atlantic/Dominion", "MAD")
+            if "Reserve Type" in df.columns:
+                df["Ancillary Service"] = df["Area"] + "-" + df["Reserve Type"]
 
-        return df[
+            df = df.replace({"Area": self.locale_abbreviated_to_full})
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2710,8 +3465,9 @@ class PJM(ISOBase):
                 "MW Adjustment",
                 "Market Clearing Price",
                 "Shortage Indicator",
-            ]
-        ]
+            ],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_dispatched_reserves_verified(
@@ -2719,10 +3475,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the dispatched reserves verified data from:
         https://dataminer2.pjm.com/feed/rt_dispatch_reserves/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2734,28 +3496,21 @@ class PJM(ISOBase):
             },
             interval_duration_min=5,
             verbose=verbose,
-        )
-
-        df = df.rename(
-            columns={
-                "area": "Area",
-                "reserve_type": "Reserve Type",
-                "total_reserve_mw": "Total Reserve",
-                "reserve_reqmt_mw": "Reserve Requirement",
-                "reliability_reqmt_mw": "Reliability Requirement",
-                "extended_reqmt_mw": "Extended Requirement",
-                "additional_extended_reqmt_mw": "Additional Extended Requirement",
-                "deficit_mw": "Deficit",
-            },
-        )
-        full_name_to_abbreviation = {
-            v: k for k, v in self.locale_abbreviated_to_full.items()
-        }
-        df["Ancillary Service"] = (
-            df["Area"].replace(full_name_to_abbreviation) + "-" + df["Reserve Type"]
-        )
-
-        return df[
+            columns=columns,
+            field_names=DISPATCHED_RESERVES_VERIFIED_FIELD_NAMES,
+            column_dependencies=DISPATCHED_RESERVES_COLUMN_DEPENDENCIES,
+        )
+
+        df = df.rename(columns=DISPATCHED_RESERVES_VERIFIED_FIELD_NAMES)
+        if {"Area", "Reserve Type"} <= set(df.columns):
+            full_name_to_abbreviation = {
+                v: k for k, v in self.locale_abbreviated_to_full.items()
+            }
+            df["Ancillary Service"] = (
+                df["Area"].replace(full_name_to_abbreviation) + "-" + df["Reserve Type"]
+            )
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2768,8 +3523,9 @@ class PJM(ISOBase):
                 "Extended Requirement",
                 "Additional Extended Requirement",
                 "Deficit",
-            ]
-        ]
+            ],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_regulation_market_monthly(
@@ -2777,10 +3533,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the PJM Regulation Market Monthly data from:
         https://dataminer2.pjm.com/feed/reg_market_results/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2792,51 +3554,38 @@ class PJM(ISOBase):
             },
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=REGULATION_MARKET_MONTHLY_FIELD_NAMES,
         )
         df["Interval End"] = df["Interval Start"] + pd.Timedelta(minutes=60)
-        df = df.rename(
-            columns={
-                "datetime_beginning_utc": "Interval Start",
-                "rega_procure": "RegA Procure",
-                "regd_procure": "RegD Procure",
-                "rega_ssmw": "RegA SSMW",
-                "regd_ssmw": "RegD SSMW",
-                "requirement": "Requirement",
-                "total_mw": "Total MW",
-                "deficiency": "Deficiency",
-                "rto_perfscore": "RTO Perfscore",
-                "rega_mileage": "RegA Mileage",
-                "regd_mileage": "RegD Mileage",
-                "rega_hourly": "RegA Hourly",
-                "regd_hourly": "RegD Hourly",
-                "is_approved": "Is Approved",
-                "modified_datetime_utc": "Modified Datetime UTC",
-            },
-        )
-
+        df = df.rename(columns=REGULATION_MARKET_MONTHLY_FIELD_NAMES)
+
+        dtypes = {
+            "RegD SSMW": float,
+            "RegA SSMW": float,
+            "RegD Procure": float,
+            "RegA Procure": float,
+            "Total MW": float,
+            "Deficiency": float,
+            "RTO Perfscore": float,
+            "RegA Mileage": float,
+            "RegD Mileage": float,
+            "RegA Hourly": float,
+            "RegD Hourly": float,
+            "Is Approved": int,
+        }
         df = df.astype(
-            {
-                "RegD SSMW": float,
-                "RegA SSMW": float,
-                "RegD Procure": float,
-                "RegA Procure": float,
-                "Total MW": float,
-                "Deficiency": float,
-                "RTO Perfscore": float,
-                "RegA Mileage": float,
-                "RegD Mileage": float,
-                "RegA Hourly": float,
-                "RegD Hourly": float,
-                "Is Approved": int,
-            },
+            {column: dtype for column, dtype in dtypes.items() if column in df.columns},
         )
 
-        df["Modified Datetime UTC"] = pd.to_datetime(
-            df["Modified Datetime UTC"],
-            utc=True,
-        )
+        if "Modified Datetime UTC" in df.columns:
+            df["Modified Datetime UTC"] = pd.to_datetime(
+                df["Modified Datetime UTC"],
+                utc=True,
+            )
 
-        return df[
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2854,8 +3603,9 @@ class PJM(ISOBase):
                 "RegD Hourly",
                 "Is Approved",
                 "Modified Datetime UTC",
-            ]
-        ]
+            ],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_regulation_prices_5_min(
@@ -2863,10 +3613,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves 5-minute regulation pricing data from:
         https://api.pjm.com/api/v1/reg_prices
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         params = {
@@ -2881,22 +3637,15 @@ class PJM(ISOBase):
             end=end,
             params=params,
             verbose=verbose,
+            columns=columns,
+            field_names=REGULATION_PRICES_5_MIN_FIELD_NAMES,
             interval_duration_min=5,
         )
 
-        df = df.rename(
-            columns={
-                "area": "Area",
-                "reserve_quantity": "Regulation Quantity",
-                "reserve_requirement": "Regulation Requirement",
-                "market_clearing_price": "Market Clearing Price",
-                "market_capped_clearing_price": "Market Capped Clearing Price",
-                "capability_clearing_price": "Capability Clearing Price",
-                "performance_clearing_price": "Performance Clearing Price",
-            },
-        )
+        df = df.rename(columns=REGULATION_PRICES_5_MIN_FIELD_NAMES)
 
-        return df[
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -2907,8 +3656,9 @@ class PJM(ISOBase):
                 "Market Capped Clearing Price",
                 "Capability Clearing Price",
                 "Performance Clearing Price",
-            ]
-        ]
+            ],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_tie_flows_5_min(
@@ -2916,10 +3666,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the PJM Tie Flows 5 Minute data from:
         https://dataminer2.pjm.com/feed/tie_flows/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2931,14 +3687,10 @@ class PJM(ISOBase):
             },
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=TIE_FLOWS_5_MIN_FIELD_NAMES,
         )
-        df = df.rename(
-            columns={
-                "tie_flow_name": "Tie Flow Name",
-                "actual_mw": "Actual",
-                "scheduled_mw": "Scheduled",
-            },
-        )
+        df = df.rename(columns=TIE_FLOWS_5_MIN_FIELD_NAMES)
 
         # NB: The data has an extra second on each timestamp like 2025-05-20 12:00:01,
         # so we need to floor to the minute. The flooring needs to be done on UTC
@@ -2954,9 +3706,11 @@ class PJM(ISOBase):
             .dt.tz_convert(self.default_timezone)
         )
 
-        return df[
-            ["Interval Start", "Interval End", "Tie Flow Name", "Actual", "Scheduled"]
-        ]
+        return self._select_columns(
+            df,
+            ["Interval Start", "Interval End", "Tie Flow Name", "Actual", "Scheduled"],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_instantaneous_dispatch_rates(
@@ -2964,10 +3718,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the instantaneous dispatch rate data from:
         https://dataminer2.pjm.com/feed/inst_dispatch_rate/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -2979,37 +3739,132 @@ class PJM(ISOBase):
             },
             interval_duration_min=0.25,
             verbose=verbose,
+            columns=columns,
+            field_names=INSTANTANEOUS_DISPATCH_RATES_FIELD_NAMES,
         )
 
-        df = df.rename(
-            columns={"zone": "Zone", "dispatch_rate": "Instantaneous Dispatch Rate"},
-        )
+        df = df.rename(columns=INSTANTANEOUS_DISPATCH_RATES_FIELD_NAMES)
 
         return (
-            df[
+            self._select_columns(
+                df,
                 [
                     "Interval Start",
                     "Interval End",
                     "Zone",
                     "Instantaneous Dispatch Rate",
-                ]
-            ]
+                ],
+                columns,
+            )
             .sort_values(
                 "Interval Start",
             )
             .reset_index(drop=True)
         )
 
+    def get_snapshot(
+        self,
+        datasets: list[str] | None = None,
+        latest_only: bool = True,
+        verbose: bool = False,
+    ) -> PJMSnapshot:
+        """Fetches the latest interval of several real-time datasets at once.
+
+        The datasets are fetched concurrently and share this instance's API keys
+        and rate budget, so a snapshot takes about as long as the slowest
+        dataset. A dataset that fails doesn't fail the snapshot: its error is
+        returned in errors instead.
+
+        Arguments:
+            datasets (list[str], optional): the datasets to fetch. Defaults to all
+                of them: "load", "fuel_mix", "operational_reserves",
+                "tie_flows_5_min", "instantaneous_dispatch_rates" and
+                "area_control_error".
+            latest_only (bool, optional): if True, only the rows of each
+                dataset's latest interval are returned. Otherwise all rows of the
+                recent window searched for it are returned.
+            verbose (bool, optional): print verbose output. Defaults to False.
+
+        Returns:
+            PJMSnapshot: frames, latency_seconds and errors, each keyed by dataset
+        """
+        if datasets is None:
+            datasets = list(SNAPSHOT_DATASETS)
+
+        unknown = set(datasets) - set(SNAPSHOT_DATASETS)
+        if unknown:
+            raise ValueError(
+                f"Unknown datasets {sorted(unknown)}. "
+                f"Must be in {list(SNAPSHOT_DATASETS)}",
+            )
+
+        now = pd.Timestamp.now(tz=self.default_timezone)
+
+        def fetch(dataset: str) -> pd.DataFrame:
+            method_name, lookback_minutes = SNAPSHOT_DATASETS[dataset]
+            start_time = time.perf_counter()
+            try:
+                df = getattr(self, method_name)(
+                    date=now - pd.Timedelta(minutes=lookback_minutes),
+                    end=now,
+                    verbose=verbose,
+                )
+            finally:
+                latency_seconds[dataset] = time.perf_counter() - start_time
+
+            if latest_only and not df.empty:
+                time_column = (
+                    "Interval Start" if "Interval Start" in df.columns else "Time"
+                )
+                df = df[df[time_column] == df[time_column].max()].reset_index(
+                    drop=True,
+                )
+
+            return df
+
+        frames = {}
+        latency_seconds = {}
+        errors = {}
+
+        with ThreadPoolExecutor(max_workers=max(len(datasets), 1)) as executor:
+            futures = {dataset: executor.submit(fetch, dataset) for dataset in datasets}
+
+            for dataset, future in futures.items():
+                try:
+                    frames[dataset] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch {dataset} for snapshot: {e}")
+                    errors[dataset] = e
+
+        logger.info(
+            "Snapshot latency: "
+            + ", ".join(
+                f"{dataset}={latency_seconds[dataset]:.2f}s" for dataset in datasets
+            ),
+        )
+
+        return PJMSnapshot(
+            frames=frames,
+            latency_seconds={dataset: latency_seconds[dataset] for dataset in datasets},
+            errors=errors,
+        )
+
     @support_date_range(frequency=None)
     def get_hourly_net_exports_by_state(
         self,
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the hourly net exports by state data from:
         https://dataminer2.pjm.com/feed/state_net_interchange/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3021,14 +3876,15 @@ class PJM(ISOBase):
             },
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=HOURLY_NET_EXPORTS_BY_STATE_FIELD_NAMES,
         )
-        df = df.rename(
-            columns={
-                "state": "State",
-                "net_interchange": "Net Interchange",
-            },
+        df = df.rename(columns=HOURLY_NET_EXPORTS_BY_STATE_FIELD_NAMES)
+        return self._select_columns(
+            df,
+            ["Interval Start", "Interval End", "State", "Net Interchange"],
+            columns,
         )
-        return df[["Interval Start", "Interval End", "State", "Net Interchange"]]
 
     @support_date_range(frequency=None)
     def get_hourly_transfer_limits_and_flows(
@@ -3036,10 +3892,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the hourly transfer limits and flows data from:
         https://dataminer2.pjm.com/feed/transfer_limits_and_flows/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3051,23 +3913,21 @@ class PJM(ISOBase):
             },
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=HOURLY_TRANSFER_LIMITS_AND_FLOWS_FIELD_NAMES,
         )
-        df = df.rename(
-            columns={
-                "transfer_limit_area": "Transfer Limit Area",
-                "transfers": "Average Transfers",
-                "transfer_limit": "Average Transfer Limit",
-            },
-        )
-        return df[
+        df = df.rename(columns=HOURLY_TRANSFER_LIMITS_AND_FLOWS_FIELD_NAMES)
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
                 "Transfer Limit Area",
                 "Average Transfers",
                 "Average Transfer Limit",
-            ]
-        ]
+            ],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_actual_and_scheduled_interchange_summary(
@@ -3075,10 +3935,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the actual and scheduled interchange summary data from:
         https://dataminer2.pjm.com/feed/actual_and_scheduled_interchange_summary/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3090,16 +3956,12 @@ class PJM(ISOBase):
             },
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=ACTUAL_AND_SCHEDULED_INTERCHANGE_SUMMARY_FIELD_NAMES,
         )
-        df = df.rename(
-            columns={
-                "tie_line": "Tie Line",
-                "actual_flow": "Actual Flow",
-                "sched_flow": "Scheduled Flow",
-                "inadv_flow": "Inadvertent Flow",
-            },
-        )
-        return df[
+        df = df.rename(columns=ACTUAL_AND_SCHEDULED_INTERCHANGE_SUMMARY_FIELD_NAMES)
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -3107,8 +3969,9 @@ class PJM(ISOBase):
                 "Actual Flow",
                 "Scheduled Flow",
                 "Inadvertent Flow",
-            ]
-        ]
+            ],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_scheduled_interchange_real_time(
@@ -3116,10 +3979,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the scheduled interchange real time data from:
         https://dataminer2.pjm.com/feed/rt_scheduled_interchange/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3131,16 +4000,17 @@ class PJM(ISOBase):
             },
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=SCHEDULED_INTERCHANGE_REAL_TIME_FIELD_NAMES,
+        )
+        df = df.rename(columns=SCHEDULED_INTERCHANGE_REAL_TIME_FIELD_NAMES).sort_values(
+            "Interval Start"
+        )
+        return self._select_columns(
+            df,
+            ["Interval Start", "Interval End", "Tie Line", "Hourly Net Tie Schedule"],
+            columns,
         )
-        df = df.rename(
-            columns={
-                "tie_line": "Tie Line",
-                "hrly_net_tie_sched": "Hourly Net Tie Schedule",
-            },
-        ).sort_values("Interval Start")
-        return df[
-            ["Interval Start", "Interval End", "Tie Line", "Hourly Net Tie Schedule"]
-        ]
 
     @support_date_range(frequency=None)
     def get_interface_flows_and_limits_day_ahead(
@@ -3148,10 +4018,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the interface flows and limit day ahead data from:
         https://dataminer2.pjm.com/feed/da_interface_flows_and_limits/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3163,17 +4039,15 @@ class PJM(ISOBase):
             },
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=INTERFACE_FLOWS_AND_LIMITS_DAY_AHEAD_FIELD_NAMES,
         )
-        df = df.rename(
-            columns={
-                "interface_limit_name": "Interface Limit Name",
-                "flow_mw": "Flow",
-                "limit_mw": "Limit",
-            },
+        df = df.rename(columns=INTERFACE_FLOWS_AND_LIMITS_DAY_AHEAD_FIELD_NAMES)
+        return self._select_columns(
+            df,
+            ["Interval Start", "Interval End", "Interface Limit Name", "Flow", "Limit"],
+            columns,
         )
-        return df[
-            ["Interval Start", "Interval End", "Interface Limit Name", "Flow", "Limit"]
-        ]
 
     @support_date_range(frequency=None)
     def get_projected_peak_tie_flow(
@@ -3181,10 +4055,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the projected peak tie flow data from:
         https://dataminer2.pjm.com/feed/ops_sum_prjctd_tie_flow/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3196,16 +4076,21 @@ class PJM(ISOBase):
             },
             interval_duration_min=60,
             verbose=verbose,
+            columns=columns,
+            field_names=PROJECTED_PEAK_TIE_FLOW_FIELD_NAMES,
+            required_columns=["Projected Peak Time"],
             filter_timestamp_name="generated_at",
         )
 
-        df["Publish Time"] = pd.to_datetime(df["generated_at_ept"]).dt.tz_localize(
-            self.default_timezone,
-        )
+        df = df.rename(columns=PROJECTED_PEAK_TIE_FLOW_FIELD_NAMES)
 
+        if "Publish Time" in df.columns:
+            df["Publish Time"] = pd.to_datetime(df["Publish Time"]).dt.tz_localize(
+                self.default_timezone,
+            )
         df["Projected Peak Time"] = (
             pd.to_datetime(
-                df["projected_peak_datetime_utc"],
+                df["Projected Peak Time"],
                 format="ISO8601",
             )
             .dt.tz_localize("UTC")
@@ -3214,13 +4099,8 @@ class PJM(ISOBase):
 
         df["Interval Start"] = df["Projected Peak Time"].dt.floor("D")
         df["Interval End"] = df["Interval Start"] + pd.Timedelta(days=1)
-        df = df.rename(
-            columns={
-                "interface": "Interface",
-                "scheduled_tie_flow": "Scheduled Tie Flow",
-            },
-        )
-        return df[
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -3228,8 +4108,9 @@ class PJM(ISOBase):
                 "Projected Peak Time",
                 "Interface",
                 "Scheduled Tie Flow",
-            ]
-        ]
+            ],
+            columns,
+        )
 
     @support_date_range(frequency=None)
     def get_actual_operational_statistics(
@@ -3237,10 +4118,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the actual operational statistics data from:
         https://dataminer2.pjm.com/feed/ops_sum_prev_period/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3252,36 +4139,29 @@ class PJM(ISOBase):
             },
             filter_timestamp_name="generated_at",
             verbose=verbose,
+            columns=columns,
+            field_names=ACTUAL_OPERATIONAL_STATISTICS_FIELD_NAMES,
+            required_columns=["Area"],
         )
 
-        df = df.rename(
-            columns={
-                "generated_at_ept": "Publish Time",
-                "area": "Area",
-                "area_load_forecast": "Area Load Forecast",
-                "actual_load": "Actual Load",
-                "dispatch_rate": "Dispatch Rate",
-            },
-        )
-        df["Publish Time"] = pd.to_datetime(df["Publish Time"]).dt.tz_localize(
-            self.default_timezone,
-        )
-
-        return (
-            df[
-                [
-                    "Interval Start",
-                    "Interval End",
-                    "Publish Time",
-                    "Area",
-                    "Area Load Forecast",
-                    "Actual Load",
-                    "Dispatch Rate",
-                ]
-            ]
-            .sort_values(["Interval Start", "Area"])
-            .reset_index(drop=True)
-        )
+        df = df.rename(columns=ACTUAL_OPERATIONAL_STATISTICS_FIELD_NAMES)
+        if "Publish Time" in df.columns:
+            df["Publish Time"] = pd.to_datetime(df["Publish Time"]).dt.tz_localize(
+                self.default_timezone,
+            )
+        return self._select_columns(
+            df.sort_values(["Interval Start", "Area"]),
+            [
+                "Interval Start",
+                "Interval End",
+                "Publish Time",
+                "Area",
+                "Area Load Forecast",
+                "Actual Load",
+                "Dispatch Rate",
+            ],
+            columns,
+        ).reset_index(drop=True)
 
     def _filter_active_records(
         self,
@@ -3316,10 +4196,16 @@ class PJM(ISOBase):
         self,
         as_of: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the pricing nodes data from:
         https://dataminer2.pjm.com/feed/pnode/definition
+
+        Args:
+            columns: output columns to return.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         as_of = utils._handle_date(as_of, tz=self.default_timezone)
         if as_of == "now":
@@ -3335,48 +4221,50 @@ class PJM(ISOBase):
                 "fields": "pnode_id,pnode_name,pnode_type,pnode_subtype,zone,voltage_level,effective_date,termination_date",
             },
             verbose=verbose,
+            columns=columns,
+            field_names=PRICING_NODES_FIELD_NAMES,
+            required_columns=[
+                "Effective Date",
+                "Termination Date",
+                "Pricing Node Name",
+            ],
         )
 
-        df = df.rename(
-            columns={
-                "pnode_id": "Pricing Node ID",
-                "pnode_name": "Pricing Node Name",
-                "pnode_type": "Pricing Node Type",
-                "pnode_subtype": "Pricing Node SubType",
-                "zone": "Zone",
-                "voltage_level": "Voltage Level",
-                "effective_date": "Effective Date",
-                "termination_date": "Termination Date",
-            },
-        )
-
-        df = self._filter_active_records(df, as_of)
+        df = df.rename(columns=PRICING_NODES_FIELD_NAMES)
 
-        return (
-            df[
-                [
-                    "Pricing Node ID",
-                    "Pricing Node Name",
-                    "Pricing Node Type",
-                    "Pricing Node SubType",
-                    "Zone",
-                    "Voltage Level",
-                    "Effective Date",
-                    "Termination Date",
-                ]
-            ]
-            .sort_values(["Effective Date", "Pricing Node Name"])
-            .reset_index(drop=True)
+        df = self._filter_active_records(df, as_of).sort_values(
+            ["Effective Date", "Pricing Node Name"]
         )
 
+        return self._select_columns(
+            df,
+            [
+                "Pricing Node ID",
+                "Pricing Node Name",
+                "Pricing Node Type",
+                "Pricing Node SubType",
+                "Zone",
+                "Voltage Level",
+                "Effective Date",
+                "Termination Date",
+            ],
+            columns,
+        ).reset_index(drop=True)
+
     def get_reserve_subzone_resources(
         self,
         as_of: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the reserve subzone resources data from:
         https://dataminer2.pjm.com/feed/sync_pri_reserves_resources_list/definition
+
+        Args:
+            columns: output columns to return.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         as_of = utils._handle_date(as_of, tz=self.default_timezone)
         if as_of == "now":
@@ -3392,46 +4280,43 @@ class PJM(ISOBase):
                 "fields": "effective_date,terminate_date,subzone,resource_id,resource_name,resource_type,zone",
             },
             verbose=verbose,
+            columns=columns,
+            field_names=RESERVE_SUBZONE_RESOURCES_FIELD_NAMES,
+            required_columns=["Effective Date", "Termination Date"],
         )
 
-        df = df.rename(
-            columns={
-                "effective_date": "Effective Date",
-                "terminate_date": "Termination Date",
-                "subzone": "Subzone",
-                "resource_id": "Resource ID",
-                "resource_name": "Resource Name",
-                "resource_type": "Resource Type",
-                "zone": "Zone",
-            },
-        )
+        df = df.rename(columns=RESERVE_SUBZONE_RESOURCES_FIELD_NAMES)
 
-        df = self._filter_active_records(df, as_of)
+        df = self._filter_active_records(df, as_of).sort_values("Effective Date")
 
-        return (
-            df[
-                [
-                    "Resource ID",
-                    "Resource Name",
-                    "Resource Type",
-                    "Zone",
-                    "Subzone",
-                    "Effective Date",
-                    "Termination Date",
-                ]
-            ]
-            .sort_values("Effective Date")
-            .reset_index(drop=True)
-        )
+        return self._select_columns(
+            df,
+            [
+                "Resource ID",
+                "Resource Name",
+                "Resource Type",
+                "Zone",
+                "Subzone",
+                "Effective Date",
+                "Termination Date",
+            ],
+            columns,
+        ).reset_index(drop=True)
 
     def get_reserve_subzone_buses(
         self,
         as_of: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the reserve subzone buses data from:
         https://dataminer2.pjm.com/feed/sync_pri_reserves_buses_list/definition
+
+        Args:
+            columns: output columns to return.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         as_of = utils._handle_date(as_of, tz=self.default_timezone)
         if as_of == "now":
@@ -3447,43 +4332,47 @@ class PJM(ISOBase):
                 "fields": "effective_date,terminate_date,subzone,pnode_id,pnode_name,pnode_type",
             },
             verbose=verbose,
+            columns=columns,
+            field_names=RESERVE_SUBZONE_BUSES_FIELD_NAMES,
+            required_columns=[
+                "Effective Date",
+                "Termination Date",
+                "Pricing Node Name",
+            ],
         )
 
-        df = df.rename(
-            columns={
-                "effective_date": "Effective Date",
-                "terminate_date": "Termination Date",
-                "subzone": "Subzone",
-                "pnode_id": "Pricing Node ID",
-                "pnode_name": "Pricing Node Name",
-                "pnode_type": "Pricing Node Type",
-            },
-        )
+        df = df.rename(columns=RESERVE_SUBZONE_BUSES_FIELD_NAMES)
 
-        df = self._filter_active_records(df, as_of)
-        return (
-            df[
-                [
-                    "Pricing Node ID",
-                    "Pricing Node Name",
-                    "Pricing Node Type",
-                    "Subzone",
-                    "Effective Date",
-                    "Termination Date",
-                ]
-            ]
-            .sort_values(["Effective Date", "Pricing Node Name"])
-            .reset_index(drop=True)
+        df = self._filter_active_records(df, as_of).sort_values(
+            ["Effective Date", "Pricing Node Name"]
         )
+        return self._select_columns(
+            df,
+            [
+                "Pricing Node ID",
+                "Pricing Node Name",
+                "Pricing Node Type",
+                "Subzone",
+                "Effective Date",
+                "Termination Date",
+            ],
+            columns,
+        ).reset_index(drop=True)
 
     def get_weight_average_aggregation_definition(
         self,
         as_of: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the weight average aggregation definition data from:
         https://dataminer2.pjm.com/feed/agg_definitions/definition
+
+        Args:
+            columns: output columns to return.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         as_of = utils._handle_date(as_of, tz=self.default_timezone)
         if as_of == "now":
@@ -3500,48 +4389,51 @@ class PJM(ISOBase):
                 "fields": "effective_date_ept,terminate_date_ept,agg_pnode_id,agg_pnode_name,bus_pnode_id,bus_pnode_name,bus_pnode_factor",
             },
             verbose=verbose,
+            columns=columns,
+            field_names=WEIGHT_AVERAGE_AGGREGATION_DEFINITION_FIELD_NAMES,
+            required_columns=[
+                "Effective Date",
+                "Termination Date",
+                "Aggregate Node Name",
+            ],
         )
 
-        df = df.rename(
-            columns={
-                "effective_date_ept": "Effective Date",
-                "terminate_date_ept": "Termination Date",
-                "agg_pnode_id": "Aggregate Node ID",
-                "agg_pnode_name": "Aggregate Node Name",
-                "bus_pnode_id": "Bus Node ID",
-                "bus_pnode_name": "Bus Node Name",
-                "bus_pnode_factor": "Bus Node Factor",
-            },
-        )
-
-        df = self._filter_active_records(df, as_of)
+        df = df.rename(columns=WEIGHT_AVERAGE_AGGREGATION_DEFINITION_FIELD_NAMES)
 
-        return (
-            df[
-                [
-                    "Aggregate Node ID",
-                    "Aggregate Node Name",
-                    "Bus Node ID",
-                    "Bus Node Name",
-                    "Bus Node Factor",
-                    "Effective Date",
-                    "Termination Date",
-                ]
-            ]
-            .sort_values(["Effective Date", "Aggregate Node Name"])
-            .reset_index(drop=True)
+        df = self._filter_active_records(df, as_of).sort_values(
+            ["Effective Date", "Aggregate Node Name"]
         )
 
+        return self._select_columns(
+            df,
+            [
+                "Aggregate Node ID",
+                "Aggregate Node Name",
+                "Bus Node ID",
+                "Bus Node Name",
+                "Bus Node Factor",
+                "Effective Date",
+                "Termination Date",
+            ],
+            columns,
+        ).reset_index(drop=True)
+
     @support_date_range(frequency=None)
     def get_generation_capacity_daily(
         self,
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the daily generation capacity data from:
         https://dataminer2.pjm.com/feed/day_gen_capacity/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3553,6 +4445,8 @@ class PJM(ISOBase):
             },
             filter_timestamp_name="bid_datetime_beginning",
             verbose=verbose,
+            columns=columns,
+            field_names=GENERATION_CAPACITY_DAILY_FIELD_NAMES,
         )
 
         df["Interval Start"] = (
@@ -3562,24 +4456,20 @@ class PJM(ISOBase):
         )
         df["Interval End"] = df["Interval Start"] + pd.Timedelta(hours=1)
 
-        df = df.rename(
-            columns={
-                "eco_max": "Economic Max MW",
-                "emerg_max": "Emergency Max MW",
-                "total_committed": "Total Committed MW",
-            },
-        )
+        df = df.rename(columns=GENERATION_CAPACITY_DAILY_FIELD_NAMES)
 
         return (
-            df[
+            self._select_columns(
+                df,
                 [
                     "Interval Start",
                     "Interval End",
                     "Economic Max MW",
                     "Emergency Max MW",
                     "Total Committed MW",
-                ]
-            ]
+                ],
+                columns,
+            )
             .sort_values("Interval Start")
             .reset_index(drop=True)
         )
@@ -3590,10 +4480,16 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the daily cleared virtual transactions data from:
         https://dataminer2.pjm.com/feed/day_inc_dec_utc/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         if end is None:
             end = date + pd.DateOffset(days=1)
@@ -3610,13 +4506,20 @@ class PJM(ISOBase):
             "startRow": 1,
             "rowCount": 50000,
         }
+        if columns is not None:
+            params["fields"] = self._project_fields(
+                params["fields"],
+                columns,
+                CLEARED_VIRTUALS_DAILY_FIELD_NAMES,
+                {},
+            )
 
         r = self._get_json(
             "https://api.pjm.com/api/v1/day_inc_dec_utc",
             verbose=verbose,
             retries=self.retries,
             params=params,
-            headers={"Ocp-Apim-Subscription-Key": self.api_key},
+            headers={"Ocp-Apim-Subscription-Key": self._get_next_key()},
         )
 
         if "errors" in r:
@@ -3636,24 +4539,20 @@ class PJM(ISOBase):
         )
         df["Interval End"] = df["Interval Start"] + pd.DateOffset(days=1)
 
-        df = df.rename(
-            columns={
-                "dec_mw": "Dec MW",
-                "inc_mw": "Inc MW",
-                "utc_mw": "UTC MW",
-            },
-        )
+        df = df.rename(columns=CLEARED_VIRTUALS_DAILY_FIELD_NAMES)
 
         return (
-            df[
+            self._select_columns(
+                df,
                 [
                     "Interval Start",
                     "Interval End",
                     "Dec MW",
                     "Inc MW",
                     "UTC MW",
-                ]
-            ]
+                ],
+                columns,
+            )
             .sort_values("Interval Start")
             .reset_index(drop=True)
         )
@@ -3664,12 +4563,18 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the hourly day-ahead increment and decrement bids data from:
         https://dataminer2.pjm.com/feed/hrl_da_incs_decs/definition
 
         Note: This data has a 4-month publication delay.
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
 
         df = self._get_pjm_json(
@@ -3681,6 +4586,9 @@ class PJM(ISOBase):
             },
             filter_timestamp_name="bid_datetime_beginning",
             verbose=verbose,
+            columns=columns,
+            field_names=INC_AND_DEC_BIDS_DAY_AHEAD_HOURLY_FIELD_NAMES,
+            required_columns=["Publish Time", "Price Point"],
         )
 
         df["Interval Start"] = (
@@ -3690,14 +4598,7 @@ class PJM(ISOBase):
         )
         df["Interval End"] = df["Interval Start"] + pd.Timedelta(hours=1)
 
-        df = df.rename(
-            columns={
-                "modified_datetime_utc": "Publish Time",
-                "price_point": "Price Point",
-                "inc_mw": "Inc MW",
-                "dec_mw": "Dec MW",
-            },
-        )
+        df = df.rename(columns=INC_AND_DEC_BIDS_DAY_AHEAD_HOURLY_FIELD_NAMES)
 
         df["Publish Time"] = (
             pd.to_datetime(df["Publish Time"], format="ISO8601")
@@ -3705,28 +4606,32 @@ class PJM(ISOBase):
             .dt.tz_convert(self.default_timezone)
         )
 
-        return (
-            df[
-                [
-                    "Interval Start",
-                    "Interval End",
-                    "Publish Time",
-                    "Price Point",
-                    "Inc MW",
-                    "Dec MW",
-                ]
-            ]
-            .sort_values(["Interval Start", "Publish Time", "Price Point"])
-            .reset_index(drop=True)
-        )
+        return self._select_columns(
+            df.sort_values(["Interval Start", "Publish Time", "Price Point"]),
+            [
+                "Interval Start",
+                "Interval End",
+                "Publish Time",
+                "Price Point",
+                "Inc MW",
+                "Dec MW",
+            ],
+            columns,
+        ).reset_index(drop=True)
 
     def get_sync_reserve_events(
         self,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the synchronized reserve events data from:
         https://dataminer2.pjm.com/feed/sync_reserve_events/definition
+
+        Args:
+            columns: output columns to return, in addition to the time columns.
+                Only the fields these columns need are requested from PJM.
+                Defaults to all columns.
         """
         df = self._get_pjm_json(
             "sync_reserve_events",
@@ -3736,6 +4641,9 @@ class PJM(ISOBase):
                 "fields": "event_start_ept,event_end_ept,duration,synchronized_reserve_zone,synchronized_sub_zone,percent_deployed",
             },
             verbose=verbose,
+            columns=columns,
+            field_names=SYNC_RESERVE_EVENTS_FIELD_NAMES,
+            column_dependencies=SYNC_RESERVE_EVENTS_COLUMN_DEPENDENCIES,
         )
 
         df["Interval Start"] = pd.to_datetime(df["event_start_ept"]).dt.tz_localize(
@@ -3749,21 +4657,16 @@ class PJM(ISOBase):
             nonexistent="shift_forward",
         )
 
-        df = df.rename(
-            columns={
-                "duration": "Duration",
-                "synchronized_reserve_zone": "Synchronized Reserve Zone",
-                "synchronized_sub_zone": "Synchronized Subzone",
-                "percent_deployed": "Percent Deployed",
-            },
-        )
-        df["Duration"] = df["Duration"].astype(str)
-        df["Duration Minutes"] = (
-            pd.to_timedelta(df["Duration"]).dt.total_seconds().astype(int) // 60
-        )
+        df = df.rename(columns=SYNC_RESERVE_EVENTS_FIELD_NAMES)
+        if "Duration" in df.columns:
+            df["Duration"] = df["Duration"].astype(str)
+            df["Duration Minutes"] = (
+                pd.to_timedelta(df["Duration"]).dt.total_seconds().astype(int) // 60
+            )
 
         return (
-            df[
+            self._select_columns(
+                df,
                 [
                     "Interval Start",
                     "Interval End",
@@ -3772,8 +4675,9 @@ class PJM(ISOBase):
                     "Synchronized Reserve Zone",
                     "Synchronized Subzone",
                     "Percent Deployed",
-                ]
-            ]
+                ],
+                columns,
+            )
             .sort_values("Interval Start")
             .reset_index(drop=True)
         )
@@ -3952,6 +4856,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the 5-minute Performance Assessment Intervals (PAI) data from PJM.
@@ -3969,6 +4874,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these
+                columns need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with 5-minute PAI intervals data.
@@ -3984,21 +4892,21 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=PAI_INTERVALS_5_MIN_FIELD_NAMES,
         )
 
-        df = df.rename(
-            columns={
-                "pai_description": "Performance Assessment Interval",
-            },
-        )
+        df = df.rename(columns=PAI_INTERVALS_5_MIN_FIELD_NAMES)
 
-        df = df[
+        df = self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
                 "Performance Assessment Interval",
-            ]
-        ]
+            ],
+            columns,
+        )
 
         return df.sort_values("Interval Start").reset_index(drop=True)
 
@@ -4008,6 +4916,7 @@ class PJM(ISOBase):
         date: str | pd.Timestamp,
         end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """
         Retrieves the 5-minute marginal emission rates data from PJM.
@@ -4025,6 +4934,9 @@ class PJM(ISOBase):
             end: (str or pandas.Timestamp, optional): End datetime for data.
                 Defaults to one day past `date` if not specified.
             verbose (bool, optional): print verbose output. Defaults to False.
+            columns (list[str], optional): output columns to return, in addition
+                to Interval Start and Interval End. Only the fields these
+                columns need are requested from PJM. Defaults to all columns.
 
         Returns:
             pandas.DataFrame: A DataFrame with 5-minute marginal emission rates data.
@@ -4048,19 +4960,17 @@ class PJM(ISOBase):
             filter_timestamp_name="datetime_beginning",
             interval_duration_min=5,
             verbose=verbose,
+            columns=columns,
+            field_names=MARGINAL_EMISSION_RATES_5_MIN_FIELD_NAMES,
+            required_columns=["Pnode Name"],
         )
 
-        df = df.rename(
-            columns={
-                "pnode_name": "Pnode Name",
-                "pnode_id": "Pnode ID",
-                "marginal_co2_rate": "Marginal CO2 Rate",
-                "marginal_so2_rate": "Marginal SO2 Rate",
-                "marginal_nox_rate": "Marginal NOx Rate",
-            },
-        )
+        df = df.rename(columns=MARGINAL_EMISSION_RATES_5_MIN_FIELD_NAMES)
 
-        df = df[
+        df = df.sort_values(["Interval Start", "Pnode Name"]).reset_index(drop=True)
+
+        return self._select_columns(
+            df,
             [
                 "Interval Start",
                 "Interval End",
@@ -4069,10 +4979,9 @@ class PJM(ISOBase):
                 "Marginal CO2 Rate",
                 "Marginal SO2 Rate",
                 "Marginal NOx Rate",
-            ]
-        ]
-
-        return df.sort_values(["Interval Start", "Pnode Name"]).reset_index(drop=True)
+            ],
+            columns,
+        )
 
     # NOTE: This file can only be accessed once per 30 minutes from the same IP address.
     # Otherwise the CSV will return a rate limit message inside the file.
@@ -9,11 +9,472 @@ EMERGENCY_POSTINGS_PUBLIC_REST_URL: str = (
     "https://emergencyprocedures.pjm.com/ep/rest/public/posting"
 )
 
+# Data Miner allows member accounts 600 requests per minute. Non-member accounts
+# are limited to 6 per minute and should pass min_request_interval_seconds=10
+DEFAULT_MIN_REQUEST_INTERVAL_SECONDS: float = 0.1
+
+# Number of pages of a Data Miner query, or windows of a date range, fetched at
+# the same time
+DEFAULT_MAX_WORKERS: int = 4
+
+# Data Miner returns at most this many rows per request
+MAX_ROWS_PER_REQUEST: int = 50000
+
+# Approximate number of pnodes in the LMP feeds. Used to size requests that
+# download every node, e.g. queries before the archive date
+PNODE_COUNT_ESTIMATE: int = 12000
+
+# Datasets PJM.get_snapshot can fetch: the method that fetches each dataset and
+# how far back to look for its latest interval, in minutes. Hourly fuel mix is
+# published with a lag, so it looks further back
+SNAPSHOT_DATASETS: dict[str, tuple[str, int]] = {
+    "load": ("get_load", 30),
+    "fuel_mix": ("get_fuel_mix", 180),
+    "operational_reserves": ("get_operational_reserves", 30),
+    "tie_flows_5_min": ("get_tie_flows_5_min", 30),
+    "instantaneous_dispatch_rates": ("get_instantaneous_dispatch_rates", 30),
+    "area_control_error": ("get_area_control_error", 30),
+}
+
 # Timeout for API requests in seconds (connect, read)
 CONNECT_TIMEOUT_SECONDS = 10
 READ_TIMEOUT_SECONDS = 15
 REQUEST_TIMEOUT = (CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS)
 
+# Time columns of Data Miner methods, which are returned whatever the columns= of
+# the call
+TIME_COLUMNS: tuple[str, ...] = ("Time", "Interval Start", "Interval End")
+
+# Output column of each Data Miner field. Used both to rename the fields and, when
+# callers pass columns=, to request only the fields those columns need
+LOAD_METERED_HOURLY_FIELD_NAMES: dict[str, str] = {
+    "load_area": "Load Area",
+    "mkt_region": "Mkt Region",
+    "mw": "MW",
+    "nerc_region": "NERC Region",
+    "zone": "Zone",
+    "is_verified": "Is Verified",
+}
+
+AS_MARKET_RESULTS_DAY_AHEAD_FIELD_NAMES: dict[str, str] = {
+    "locale": "Locale",
+    "service": "Service Type",
+    "mcp": "Market Clearing Price",
+    "mcp_capped": "Market Clearing Price Capped",
+    "as_req_mw": "Ancillary Service Required",
+    "total_mw": "Total MW",
+    "as_mw": "Assigned MW",
+    "ss_mw": "Self-Scheduled MW",
+    "ircmwt2": "Interface Reserve Capability MW",
+    "dsr_as_mw": "Demand Response MW Assigned",
+    "nsr_mw": "Non-Synchronized Reserve MW Assigned",
+}
+
+AS_MARKET_RESULTS_REAL_TIME_FIELD_NAMES: dict[str, str] = {
+    "locale": "Locale",
+    "service": "Service Type",
+    "mcp": "Market Clearing Price",
+    "mcp_capped": "Market Clearing Price Capped",
+    "reg_ccp": "Regulation Capability Clearing Price",
+    "reg_pcp": "Regulation Performance Clearing Price",
+    "as_req_mw": "Ancillary Service Required",
+    "total_mw": "Total MW",
+    "as_mw": "Assigned MW",
+    "ss_mw": "Self-Scheduled MW",
+    "tier1_mw": "Tier 1 MW",
+    "ircmwt2": "Interface Reserve Capability MW",
+    "dsr_as_mw": "Demand Response MW Assigned",
+    "nsr_mw": "Non-Synchronized Reserve MW Assigned",
+    "regd_mw": "REGD MW",
+}
+
+# Derived output columns and the columns they are computed from
+AS_MARKET_RESULTS_COLUMN_DEPENDENCIES: dict[str, list[str]] = {
+    "Ancillary Service": ["Locale", "Service Type"],
+}
+
+TRANSMISSION_CONSTRAINTS_DAY_AHEAD_FIELD_NAMES: dict[str, str] = {
+    "duration": "Duration",
+    "day_ahead_congestion_event": "Day Ahead Congestion Event",
+    "monitored_facility": "Monitored Facility",
+    "contingency_facility": "Contingency Facility",
+}
+
+# Output columns of the LMP feeds, by market type. Location Id, Name and Short
+# Name come from pnode_id, which is always requested
+LMP_FIELD_NAMES: dict[str, dict[str, str]] = {
+    market_type: {
+        "type": "Location Type",
+        f"total_lmp_{market_type}": "LMP",
+        f"system_energy_price_{market_type}": "Energy",
+        f"congestion_price_{market_type}": "Congestion",
+        f"marginal_loss_price_{market_type}": "Loss",
+    }
+    for market_type in ("rt", "da")
+}
+
+LMP_COLUMN_DEPENDENCIES: dict[str, list[str]] = {
+    "Market": [],
+    "Location Id": [],
+    "Location Name": [],
+    "Location Short Name": [],
+}
+
+# The unverified feeds have no energy price, so it is computed from the others
+UNVERIFIED_LMP_COLUMN_DEPENDENCIES: dict[str, list[str]] = {
+    **LMP_COLUMN_DEPENDENCIES,
+    "Energy": ["LMP", "Congestion", "Loss"],
+}
+
+LMP_UNVERIFIED_HOURLY_FIELD_NAMES: dict[str, str] = {
+    "pnode_name": "Location",
+    "type": "Location Type",
+    "total_lmp_rt": "LMP",
+    "congestion_price_rt": "Congestion",
+    "marginal_loss_price_rt": "Loss",
+}
+
+LMP_UNVERIFIED_HOURLY_COLUMN_DEPENDENCIES: dict[str, list[str]] = {
+    "Energy": ["LMP", "Congestion", "Loss"],
+}
+
+IT_SCED_LMP_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "case_approval_datetime_utc": "Case Approval Time",
+    "itsced_lmp": "LMP",
+    "marginal_congestion": "Congestion",
+    "marginal_loss": "Loss",
+}
+
+IT_SCED_LMP_5_MIN_COLUMN_DEPENDENCIES: dict[str, list[str]] = {
+    "Location Id": [],
+    "Location Name": [],
+    "Location Short Name": [],
+    "Energy": ["LMP", "Congestion", "Loss"],
+}
+
+SETTLEMENTS_VERIFIED_LMP_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "pnode_id": "Location Id",
+    "pnode_name": "Location Name",
+    "type": "Location Type",
+    "voltage": "Voltage",
+    "equipment": "Equipment",
+    "zone": "Zone",
+    "total_lmp_rt": "LMP",
+    "system_energy_price_rt": "Energy",
+    "congestion_price_rt": "Congestion",
+    "marginal_loss_price_rt": "Loss",
+}
+
+SETTLEMENTS_VERIFIED_LMP_HOURLY_FIELD_NAMES: dict[str, str] = {
+    "pnode_id": "Location Id",
+    "pnode_name": "Location Name",
+    "type": "Location Type",
+    "voltage": "Voltage",
+    "equipment": "Equipment",
+    "zone": "Zone",
+    "total_lmp_rt": "LMP RT",
+    "system_energy_price_rt": "Energy RT",
+    "congestion_price_rt": "Congestion RT",
+    "marginal_loss_price_rt": "Loss RT",
+    "total_lmp_da": "LMP DA",
+    "system_energy_price_da": "Energy DA",
+    "congestion_price_da": "Congestion DA",
+    "marginal_loss_price_da": "Loss DA",
+}
+
+SOLAR_FORECAST_FIELD_NAMES: dict[str, str] = {
+    "evaluated_at_utc": "Publish Time",
+    "solar_forecast_btm_mwh": "Solar Forecast BTM",
+    "solar_forecast_mwh": "Solar Forecast",
+}
+
+WIND_FORECAST_FIELD_NAMES: dict[str, str] = {
+    "evaluated_at_utc": "Publish Time",
+    "wind_forecast_mwh": "Wind Forecast",
+}
+
+GEN_OUTAGES_BY_TYPE_FIELD_NAMES: dict[str, str] = {
+    "forecast_execution_date_ept": "Publish Time",
+    "forecast_date": "Interval Start",
+    "region": "Region",
+    "planned_outages_mw": "Planned Outages MW",
+    "maintenance_outages_mw": "Maintenance Outages MW",
+    "forced_outages_mw": "Forced Outages MW",
+    "total_outages_mw": "Total Outages MW",
+}
+
+PROJECTED_RTO_STATISTICS_AT_PEAK_FIELD_NAMES: dict[str, str] = {
+    "projected_peak_datetime_ept": "Projected Peak Time",
+    "generated_at_ept": "Publish Time",
+    "area": "Area",
+    "internal_scheduled_capacity": "Internal Scheduled Capacity",
+    "scheduled_tie_flow_total": "Scheduled Tie Flow Total",
+    "capacity_adjustments": "Capacity Adjustments",
+    "total_scheduled_capacity": "Total Scheduled Capacity",
+    "load_forecast": "Load Forecast",
+    "operating_reserve": "Operating Reserve",
+    "unscheduled_steam_capacity": "Unscheduled Steam Capacity",
+}
+
+PROJECTED_AREA_STATISTICS_AT_PEAK_FIELD_NAMES: dict[str, str] = {
+    "projected_peak_datetime_ept": "Projected Peak Time",
+    "generated_at_ept": "Publish Time",
+    "area": "Area",
+    "internal_scheduled_capacity": "Internal Scheduled Capacity",
+    "pjm_load_forecast": "PJM Load Forecast",
+    "unscheduled_steam_capacity": "Unscheduled Steam Capacity",
+}
+
+SOLAR_GENERATION_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "solar_generation_mw": "Solar Generation",
+}
+
+WIND_GENERATION_INSTANTANEOUS_FIELD_NAMES: dict[str, str] = {
+    "wind_generation_mw": "Wind Generation",
+}
+
+OPERATIONAL_RESERVES_FIELD_NAMES: dict[str, str] = {
+    "reserve_name": "Reserve Name",
+    "reserve_mw": "Reserve",
+}
+
+TRANSFER_INTERFACE_INFORMATION_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "name": "Interface Name",
+    "actual_flow": "Actual Flow",
+    "warning_level": "Warning Level",
+    "transfer_limit": "Transfer Limit",
+}
+
+TRANSMISSION_LIMITS_FIELD_NAMES: dict[str, str] = {
+    "constraint_name": "Constraint Name",
+    "constraint_type": "Constraint Type",
+    "contingency": "Contingency",
+    "shadow_price": "Shadow Price",
+}
+
+FORECASTED_GENERATION_OUTAGES_FIELD_NAMES: dict[str, str] = {
+    "forecast_execution_date_ept": "Publish Time",
+    "forecast_date": "Interval Start",
+    "forecast_gen_outage_mw_rto": "RTO MW",
+    "forecast_gen_outage_mw_west": "West MW",
+    "forecast_gen_outage_mw_other": "Other MW",
+}
+
+MARGINAL_VALUE_REAL_TIME_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "monitored_facility": "Monitored Facility",
+    "contingency_facility": "Contingency Facility",
+    "transmission_constraint_penalty_factor": "Transmission Constraint Penalty Factor",
+    "limit_control_percentage": "Limit Control Percentage",
+    "shadow_price": "Shadow Price",
+}
+
+MARGINAL_VALUE_DAY_AHEAD_HOURLY_FIELD_NAMES: dict[str, str] = {
+    "monitored_facility": "Monitored Facility",
+    "contingency_facility": "Contingency Facility",
+    "shadow_price": "Shadow Price",
+}
+
+DAY_AHEAD_DEMAND_BIDS_FIELD_NAMES: dict[str, str] = {
+    "hrly_da_demand_bid": "Demand Bid",
+    "area": "Area",
+}
+
+AREA_CONTROL_ERROR_FIELD_NAMES: dict[str, str] = {
+    "ace_mw": "Area Control Error",
+}
+
+DISPATCHED_RESERVES_PRELIM_FIELD_NAMES: dict[str, str] = {
+    "area": "Area",
+    "reserve_type": "Reserve Type",
+    "reserve_quantity": "Reserve Quantity",
+    "reserve_requirement": "Reserve Requirement",
+    "reliability_requirement": "Reliability Requirement",
+    "extended_requirement": "Extended Requirement",
+    "mw_adjustment": "MW Adjustment",
+    "market_clearing_price": "Market Clearing Price",
+    "shortage_indicator": "Shortage Indicator",
+}
+
+DISPATCHED_RESERVES_VERIFIED_FIELD_NAMES: dict[str, str] = {
+    "area": "Area",
+    "reserve_type": "Reserve Type",
+    "total_reserve_mw": "Total Reserve",
+    "reserve_reqmt_mw": "Reserve Requirement",
+    "reliability_reqmt_mw": "Reliability Requirement",
+    "extended_reqmt_mw": "Extended Requirement",
+    "additional_extended_reqmt_mw": "Additional Extended Requirement",
+    "deficit_mw": "Deficit",
+}
+
+# Ancillary Service combines the area and reserve type
+DISPATCHED_RESERVES_COLUMN_DEPENDENCIES: dict[str, list[str]] = {
+    "Ancillary Service": ["Area", "Reserve Type"],
+}
+
+REGULATION_MARKET_MONTHLY_FIELD_NAMES: dict[str, str] = {
+    "rega_procure": "RegA Procure",
+    "regd_procure": "RegD Procure",
+    "rega_ssmw": "RegA SSMW",
+    "regd_ssmw": "RegD SSMW",
+    "requirement": "Requirement",
+    "total_mw": "Total MW",
+    "deficiency": "Deficiency",
+    "rto_perfscore": "RTO Perfscore",
+    "rega_mileage": "RegA Mileage",
+    "regd_mileage": "RegD Mileage",
+    "rega_hourly": "RegA Hourly",
+    "regd_hourly": "RegD Hourly",
+    "is_approved": "Is Approved",
+    "modified_datetime_utc": "Modified Datetime UTC",
+}
+
+REGULATION_PRICES_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "area": "Area",
+    "reserve_quantity": "Regulation Quantity",
+    "reserve_requirement": "Regulation Requirement",
+    "market_clearing_price": "Market Clearing Price",
+    "market_capped_clearing_price": "Market Capped Clearing Price",
+    "capability_clearing_price": "Capability Clearing Price",
+    "performance_clearing_price": "Performance Clearing Price",
+}
+
+TIE_FLOWS_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "tie_flow_name": "Tie Flow Name",
+    "actual_mw": "Actual",
+    "scheduled_mw": "Scheduled",
+}
+
+INSTANTANEOUS_DISPATCH_RATES_FIELD_NAMES: dict[str, str] = {
+    "zone": "Zone",
+    "dispatch_rate": "Instantaneous Dispatch Rate",
+}
+
+HOURLY_NET_EXPORTS_BY_STATE_FIELD_NAMES: dict[str, str] = {
+    "state": "State",
+    "net_interchange": "Net Interchange",
+}
+
+HOURLY_TRANSFER_LIMITS_AND_FLOWS_FIELD_NAMES: dict[str, str] = {
+    "transfer_limit_area": "Transfer Limit Area",
+    "transfers": "Average Transfers",
+    "transfer_limit": "Average Transfer Limit",
+}
+
+ACTUAL_AND_SCHEDULED_INTERCHANGE_SUMMARY_FIELD_NAMES: dict[str, str] = {
+    "tie_line": "Tie Line",
+    "actual_flow": "Actual Flow",
+    "sched_flow": "Scheduled Flow",
+    "inadv_flow": "Inadvertent Flow",
+}
+
+SCHEDULED_INTERCHANGE_REAL_TIME_FIELD_NAMES: dict[str, str] = {
+    "tie_line": "Tie Line",
+    "hrly_net_tie_sched": "Hourly Net Tie Schedule",
+}
+
+INTERFACE_FLOWS_AND_LIMITS_DAY_AHEAD_FIELD_NAMES: dict[str, str] = {
+    "interface_limit_name": "Interface Limit Name",
+    "flow_mw": "Flow",
+    "limit_mw": "Limit",
+}
+
+GENERATION_CAPACITY_DAILY_FIELD_NAMES: dict[str, str] = {
+    "eco_max": "Economic Max MW",
+    "emerg_max": "Emergency Max MW",
+    "total_committed": "Total Committed MW",
+}
+
+PROJECTED_PEAK_TIE_FLOW_FIELD_NAMES: dict[str, str] = {
+    "generated_at_ept": "Publish Time",
+    "projected_peak_datetime_utc": "Projected Peak Time",
+    "interface": "Interface",
+    "scheduled_tie_flow": "Scheduled Tie Flow",
+}
+
+ACTUAL_OPERATIONAL_STATISTICS_FIELD_NAMES: dict[str, str] = {
+    "generated_at_ept": "Publish Time",
+    "area": "Area",
+    "area_load_forecast": "Area Load Forecast",
+    "actual_load": "Actual Load",
+    "dispatch_rate": "Dispatch Rate",
+}
+
+PRICING_NODES_FIELD_NAMES: dict[str, str] = {
+    "pnode_id": "Pricing Node ID",
+    "pnode_name": "Pricing Node Name",
+    "pnode_type": "Pricing Node Type",
+    "pnode_subtype": "Pricing Node SubType",
+    "zone": "Zone",
+    "voltage_level": "Voltage Level",
+    "effective_date": "Effective Date",
+    "termination_date": "Termination Date",
+}
+
+RESERVE_SUBZONE_RESOURCES_FIELD_NAMES: dict[str, str] = {
+    "effective_date": "Effective Date",
+    "terminate_date": "Termination Date",
+    "subzone": "Subzone",
+    "resource_id": "Resource ID",
+    "resource_name": "Resource Name",
+    "resource_type": "Resource Type",
+    "zone": "Zone",
+}
+
+RESERVE_SUBZONE_BUSES_FIELD_NAMES: dict[str, str] = {
+    "effective_date": "Effective Date",
+    "terminate_date": "Termination Date",
+    "subzone": "Subzone",
+    "pnode_id": "Pricing Node ID",
+    "pnode_name": "Pricing Node Name",
+    "pnode_type": "Pricing Node Type",
+}
+
+WEIGHT_AVERAGE_AGGREGATION_DEFINITION_FIELD_NAMES: dict[str, str] = {
+    "effective_date_ept": "Effective Date",
+    "terminate_date_ept": "Termination Date",
+    "agg_pnode_id": "Aggregate Node ID",
+    "agg_pnode_name": "Aggregate Node Name",
+    "bus_pnode_id": "Bus Node ID",
+    "bus_pnode_name": "Bus Node Name",
+    "bus_pnode_factor": "Bus Node Factor",
+}
+
+CLEARED_VIRTUALS_DAILY_FIELD_NAMES: dict[str, str] = {
+    "dec_mw": "Dec MW",
+    "inc_mw": "Inc MW",
+    "utc_mw": "UTC MW",
+}
+
+INC_AND_DEC_BIDS_DAY_AHEAD_HOURLY_FIELD_NAMES: dict[str, str] = {
+    "modified_datetime_utc": "Publish Time",
+    "price_point": "Price Point",
+    "inc_mw": "Inc MW",
+    "dec_mw": "Dec MW",
+}
+
+SYNC_RESERVE_EVENTS_FIELD_NAMES: dict[str, str] = {
+    "duration": "Duration",
+    "synchronized_reserve_zone": "Synchronized Reserve Zone",
+    "synchronized_sub_zone": "Synchronized Subzone",
+    "percent_deployed": "Percent Deployed",
+}
+
+SYNC_RESERVE_EVENTS_COLUMN_DEPENDENCIES: dict[str, list[str]] = {
+    "Duration Minutes": ["Duration"],
+}
+
+PAI_INTERVALS_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "pai_description": "Performance Assessment Interval",
+}
+
+MARGINAL_EMISSION_RATES_5_MIN_FIELD_NAMES: dict[str, str] = {
+    "pnode_name": "Pnode Name",
+    "pnode_id": "Pnode ID",
+    "marginal_co2_rate": "Marginal CO2 Rate",
+    "marginal_so2_rate": "Marginal SO2 Rate",
+    "marginal_nox_rate": "Marginal NOx Rate",
+}
+
 LOCATION_TYPES: tuple[str, ...] = (
     "ZONE",
     "LOAD",
@@ -1,10 +1,26 @@
 import os
 import time
 
+import pandas as pd
 import pytest
 
+from gridstatus import CAISO
+
 CAISO_OASIS_RECORD_COOLDOWN_SECONDS = 30
 
+# Stands in for the CAISO pnode map: the trading hubs, a DLAP and a few nodes
+CAISO_PNODE_MAP = pd.DataFrame(
+    {
+        "APNODE_ID": [
+            "TH_NP15_GEN-APND",
+            "TH_SP15_GEN-APND",
+            "TH_ZP26_GEN-APND",
+            "DLAP_PGAE-APND",
+        ],
+        "PNODE_ID": ["NODE_1", "NODE_2", "NODE_3", "NODE_1"],
+    },
+)
+
 _last_caiso_oasis_record_time: float | None = None
 
 
@@ -34,3 +50,29 @@ def caiso_oasis_record_cooldown(request: pytest.FixtureRequest):
 
     if recording and marked:
         _last_caiso_oasis_record_time = time.time()
+
+
+@pytest.fixture(autouse=True)
+def caiso_pnode_map(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Answer CAISO pnode map queries with CAISO_PNODE_MAP.
+
+    The CAISO LMP methods validate and type locations with the pnode map, which
+    recorded LMP cassettes don't include. Locations missing from this map are
+    typed by their names, as they are for a real map. Tests that patch
+    get_oasis_dataset on a CAISO instance give their own map, and tests marked
+    ``@pytest.mark.real_pnode_map`` query OASIS for it.
+    """
+    if request.node.get_closest_marker("real_pnode_map"):
+        return
+
+    get_oasis_dataset = CAISO.get_oasis_dataset
+
+    def fake_get_oasis_dataset(self: CAISO, dataset: str, *args, **kwargs):
+        if dataset == "pnode_map":
+            return CAISO_PNODE_MAP.copy()
+        return get_oasis_dataset(self, dataset, *args, **kwargs)
+
+    monkeypatch.setattr(CAISO, "get_oasis_dataset", fake_get_oasis_dataset)
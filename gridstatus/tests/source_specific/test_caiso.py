@@ -1,12 +1,25 @@
+import gzip
+import io
+import json
 import math
+import threading
+import zipfile
+from collections.abc import Callable
+from types import ModuleType
 
 import numpy as np
 import pandas as pd
 import pytest
+import requests
 
 from gridstatus import CAISO, Markets
 from gridstatus.base import NoDataFoundException, NotSupported
-from gridstatus.caiso.caiso import _collapse_group_to_array
+from gridstatus.caiso import caiso_utils
+from gridstatus.caiso.caiso import (
+    _collapse_group_to_array,
+    _lmp_location_types,
+    _pivot_lmp_types,
+)
 from gridstatus.caiso.caiso_constants import REAL_TIME_DISPATCH_MARKET_RUN_ID
 from gridstatus.tests.base_test_iso import BaseTestISO
 from gridstatus.tests.decorators import with_markets
@@ -18,6 +31,60 @@ caiso_vcr = setup_vcr(
 )
 
 
+class FakeResponse:
+    """Stands in for the requests.Response of a patched requests.get"""
+
+    def __init__(
+        self,
+        content: bytes | str = b"",
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.content = content.encode() if isinstance(content, str) else content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+def patch_requests_get(
+    monkeypatch: pytest.MonkeyPatch,
+    module: ModuleType,
+    respond: Callable[..., FakeResponse],
+) -> list[str]:
+    """Patches module.requests.get to answer with respond, which is called with the
+    URL and keyword arguments of each request. Returns the list of requested URLs,
+    which is filled in as requests are made."""
+    requested_urls: list[str] = []
+    lock = threading.Lock()
+
+    def fake_get(url: str, **kwargs) -> FakeResponse:
+        with lock:
+            requested_urls.append(url)
+        return respond(url, **kwargs)
+
+    monkeypatch.setattr(module.requests, "get", fake_get)
+    return requested_urls
+
+
+def oasis_zip_response(members: dict[str, str]) -> FakeResponse:
+    """An OASIS response holding a zip of the given CSV members"""
+    content = io.BytesIO()
+    with zipfile.ZipFile(content, "w") as z:
+        for name, csv in members.items():
+            z.writestr(name, csv)
+    return FakeResponse(
+        content.getvalue(),
+        headers={"Content-Disposition": "attachment; filename=oasis.csv.zip;"},
+    )
+
+
 class TestCAISO(BaseTestISO):
     iso = CAISO()
 
@@ -952,6 +1019,191 @@ class TestCAISO(BaseTestISO):
             df = self.iso.get_curtailment_legacy(date)
             self._check_curtailment_legacy(df)
 
+    def test_get_curtailment_legacy_caches_tables_by_pdf_content(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path,
+    ) -> None:
+        from gridstatus.caiso import caiso
+
+        extracted: list[bytes] = []
+        request_headers: list[dict[str, str]] = []
+        pdf = {"content": b"same pdf", "etag": '"v1"'}
+
+        def respond(url: str, headers: dict[str, str]) -> FakeResponse:
+            request_headers.append(headers)
+            if headers.get("If-None-Match") == pdf["etag"]:
+                return FakeResponse(status_code=304)
+            return FakeResponse(pdf["content"], headers={"ETag": pdf["etag"]})
+
+        def fake_extract_pdf_tables(pdf_bytes: bytes) -> list:
+            extracted.append(pdf_bytes)
+            return [
+                [
+                    ["DATE", "HOUR", "CURT TYPE", "REASON", "FUEL TYPE"]
+                    + ["CURTAILED MWH", "CURTAILED MW"],
+                    ["", "1", "Economic", "Local", "SOLR", str(len(extracted)), "12"],
+                ],
+            ]
+
+        requested_urls = patch_requests_get(monkeypatch, caiso, respond)
+        monkeypatch.setattr(caiso, "_extract_pdf_tables", fake_extract_pdf_tables)
+
+        df = CAISO(curtailment_cache_dir=str(tmp_path)).get_curtailment_legacy(
+            "2022-03-15",
+        )
+        assert df["Curtailment (MWh)"].tolist() == ["1"]
+        assert len(requested_urls) == 1 and len(extracted) == 1
+        (tables_path,) = tmp_path.glob("tables_v*/*.json.gz")
+        with gzip.open(tables_path, "rt") as f:
+            assert json.load(f)["tables"][0][1][5] == "1"
+
+        # a fresh instance only checks whether the PDF changed
+        iso = CAISO(curtailment_cache_dir=str(tmp_path))
+        pd.testing.assert_frame_equal(iso.get_curtailment_legacy("2022-03-15"), df)
+        assert request_headers[-1] == {"If-None-Match": '"v1"'}
+        assert len(requested_urls) == 2 and len(extracted) == 1
+
+        # a new URL is downloaded, but identical content is not extracted again
+        iso.get_curtailment_legacy("2022-03-16")
+        assert len(requested_urls) == 3 and len(extracted) == 1
+
+        # a PDF republished at the same URL is extracted again
+        pdf.update(content=b"corrected pdf", etag='"v2"')
+        assert iso.get_curtailment_legacy("2022-03-15")[
+            "Curtailment (MWh)"
+        ].tolist() == ["2"]
+        assert len(extracted) == 2
+        pd.testing.assert_frame_equal(
+            iso.get_curtailment_legacy("2022-03-15"),
+            iso.get_curtailment_legacy("2022-03-15"),
+        )
+        assert len(extracted) == 2
+
+    def test_curtailment_pdf_pages_extracted_in_worker_processes(self) -> None:
+        pdf_bytes = self._pdf_with_one_table_per_page([f"p{i}" for i in range(5)])
+
+        iso = CAISO(curtailment_pdf_workers=2)
+        with iso._curtailment_pdf_pool() as pdf_pool:
+            tables = iso._extract_curtailment_pdf_tables(pdf_bytes, pdf_pool)
+
+        assert tables == [[[f"p{i}", "x"]] for i in range(5)]
+        assert CAISO()._extract_curtailment_pdf_tables(pdf_bytes) == tables
+
+        # more workers than pages leaves some chunks empty
+        with CAISO(curtailment_pdf_workers=8)._curtailment_pdf_pool() as pdf_pool:
+            assert (
+                CAISO(curtailment_pdf_workers=8)._extract_curtailment_pdf_tables(
+                    pdf_bytes,
+                    pdf_pool,
+                )
+                == tables
+            )
+
+    def test_get_curtailment_legacy_shares_one_pdf_pool_across_dates(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from gridstatus.caiso import caiso
+
+        pools: list = []
+        extracted_chunks: list[tuple[bytes, int, int]] = []
+
+        class FakePool:
+            """Runs the tasks of a ProcessPoolExecutor in this process"""
+
+            def __init__(self, max_workers: int, mp_context) -> None:
+                self.max_workers = max_workers
+                self.shut_down = False
+                pools.append(self)
+
+            def map(self, fn, *iterables):
+                assert not self.shut_down
+                return map(fn, *iterables)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info) -> None:
+                self.shut_down = True
+
+        def fake_extract_pdf_tables(
+            pdf_bytes: bytes,
+            chunk: int = 0,
+            n_chunks: int = 1,
+        ) -> list:
+            extracted_chunks.append((pdf_bytes, chunk, n_chunks))
+            if chunk > 0:
+                return []
+            return [
+                [
+                    ["DATE", "HOUR", "CURT TYPE", "REASON", "FUEL TYPE"]
+                    + ["CURTAILED MWH", "CURTAILED MW"],
+                    ["", "1", "Economic", "Local", "SOLR", "5", "12"],
+                ],
+            ]
+
+        patch_requests_get(
+            monkeypatch,
+            caiso,
+            lambda url, headers: FakeResponse(url.encode()),
+        )
+        monkeypatch.setattr(caiso, "ProcessPoolExecutor", FakePool)
+        monkeypatch.setattr(caiso, "_extract_pdf_tables", fake_extract_pdf_tables)
+
+        df = CAISO(curtailment_pdf_workers=3).get_curtailment_legacy(
+            "2022-03-15",
+            end="2022-03-18",
+        )
+
+        assert len(df) == 3
+        assert len(pools) == 1 and pools[0].max_workers == 3
+        assert pools[0].shut_down
+        # every PDF is handed to the workers whole, and they split it into pages
+        assert [chunk for _, chunk, _ in extracted_chunks] == [0, 1, 2] * 3
+        assert {n_chunks for _, _, n_chunks in extracted_chunks} == {3}
+        assert len({pdf_bytes for pdf_bytes, _, _ in extracted_chunks}) == 3
+
+    @staticmethod
+    def _pdf_with_one_table_per_page(texts: list[str]) -> bytes:
+        # A minimal PDF whose pages each hold a two cell table: (text, "x")
+        objects = [
+            "<< /Type /Catalog /Pages 2 0 R >>",
+            "<< /Type /Pages /Kids [{}] /Count {} >>".format(
+                " ".join(f"{4 + 2 * i} 0 R" for i in range(len(texts))),
+                len(texts),
+            ),
+            "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        ]
+        for i, text in enumerate(texts):
+            stream = (
+                "20 100 80 30 re 100 100 80 30 re S "
+                f"BT /F1 12 Tf 30 110 Td ({text}) Tj ET "
+                "BT /F1 12 Tf 110 110 Td (x) Tj ET"
+            )
+            objects.append(
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 200] "
+                "/Resources << /Font << /F1 3 0 R >> >> "
+                f"/Contents {5 + 2 * i} 0 R >>",
+            )
+            objects.append(
+                f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+            )
+
+        pdf = b"%PDF-1.4\n"
+        offsets = []
+        for i, obj in enumerate(objects):
+            offsets.append(len(pdf))
+            pdf += f"{i + 1} 0 obj\n{obj}\nendobj\n".encode()
+        xref_offset = len(pdf)
+        pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+        pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+        pdf += (
+            f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+            f"startxref\n{xref_offset}\n%%EOF\n"
+        ).encode()
+        return pdf
+
     """get_curtailment"""
 
     def _check_curtailment(self, df: pd.DataFrame):
@@ -1242,6 +1494,235 @@ class TestCAISO(BaseTestISO):
             assert df["Location"].nunique() > 2300
             assert df["Interval Start"].dt.hour.nunique() == 2
 
+    @pytest.mark.parametrize("day", ["2024-03-10", "2024-06-01", "2024-11-03"])
+    def test_make_timestamps_matches_make_timestamp(self, day: str) -> None:
+        today = pd.Timestamp(day, tz="US/Pacific")
+        times = [
+            f"{hour:02d}:{minute:02d}"
+            for hour in range(24)
+            for minute in range(0, 60, 5)
+            # the skipped hour when DST starts isn't in the reports
+            if not (day == "2024-03-10" and hour == 2)
+        ]
+        times = pd.Series(times * 2, name="Time")
+
+        expected = times.apply(caiso_utils.make_timestamp, today=today)
+
+        pd.testing.assert_series_equal(
+            caiso_utils.make_timestamps(times, today=today),
+            expected,
+        )
+
+    def test_track_today_parses_only_new_rows_and_rolls_over(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from gridstatus.caiso import caiso
+
+        header = "Time,Day ahead forecast,Hour ahead forecast,Current demand"
+        files = iter(
+            [
+                # the last row is a forecast, not published yet
+                [header, "00:00,10,11,100", "00:05,10,11,101", "00:10,10,11,"],
+                [header, "00:00,10,11,100", "00:05,10,11,101", "00:10,10,11,102"]
+                + ["00:15,10,11,"],
+                # an earlier row is revised, the last parsed row is the same
+                [header, "00:00,10,11,90", "00:05,10,11,101", "00:10,10,11,102"]
+                + ["00:15,10,11,103"],
+                # the next day's file
+                [header, "00:00,20,21,200", "00:05,20,21,"],
+            ],
+        )
+        etags = iter(["v1", "v2", "v3", "v4"])
+        request_headers: list[dict[str, str]] = []
+
+        def respond(url: str, headers: dict[str, str]) -> FakeResponse:
+            request_headers.append(headers)
+            # nothing new
+            if len(request_headers) == 3:
+                return FakeResponse(status_code=304)
+            return FakeResponse(
+                "\n".join(next(files)) + "\n",
+                headers={"ETag": next(etags), "Last-Modified": "Sat, 01 Jun 2024"},
+            )
+
+        patch_requests_get(monkeypatch, caiso, respond)
+        days = iter(
+            [
+                # the first file still holds yesterday's data
+                pd.Timestamp("2024-05-31", tz=self.iso.default_timezone),
+                pd.Timestamp("2024-05-31", tz=self.iso.default_timezone),
+                pd.Timestamp("2024-06-01", tz=self.iso.default_timezone),
+            ],
+        )
+        monkeypatch.setattr(caiso, "_current_file_date", lambda *args: next(days))
+        parsed_rows: list[int] = []
+        make_timestamps = caiso_utils.make_timestamps
+
+        def counting_make_timestamps(time_strs: pd.Series, **kwargs) -> pd.Series:
+            parsed_rows.append(len(time_strs))
+            return make_timestamps(time_strs, **kwargs)
+
+        monkeypatch.setattr(
+            caiso.caiso_utils,
+            "make_timestamps",
+            counting_make_timestamps,
+        )
+
+        tracker = self.iso.track_today("load")
+
+        assert tracker.refresh()["Load"].tolist() == [100, 101]
+        assert tracker.refresh()["Load"].tolist() == [102]
+        assert tracker.refresh().empty
+        assert parsed_rows == [2, 1]
+        assert request_headers[:3] == [
+            {},
+            {"If-None-Match": "v1", "If-Modified-Since": "Sat, 01 Jun 2024"},
+            {"If-None-Match": "v2", "If-Modified-Since": "Sat, 01 Jun 2024"},
+        ]
+
+        df = tracker.data
+        assert df.columns.tolist() == ["Time", "Interval Start", "Interval End", "Load"]
+        assert df["Interval Start"].tolist() == list(
+            pd.date_range(
+                "2024-05-31",
+                periods=3,
+                freq="5min",
+                tz=self.iso.default_timezone,
+            ),
+        )
+
+        # the rewrite is parsed again from the start
+        rewritten = tracker.refresh()
+        assert rewritten["Load"].tolist() == [90, 101, 102, 103]
+        assert parsed_rows == [2, 1, 4]
+        pd.testing.assert_frame_equal(tracker.data, rewritten)
+
+        new_day = tracker.refresh()
+        assert tracker.day == pd.Timestamp("2024-06-01", tz=self.iso.default_timezone)
+        assert new_day["Load"].tolist() == [200]
+        pd.testing.assert_frame_equal(tracker.data, new_day)
+
+    def test_pivot_lmp_types_matches_pivot_table(self) -> None:
+        rng = np.random.default_rng(0)
+        starts = pd.date_range("2024-03-10", periods=6, freq="h", tz="US/Pacific")
+        nodes = ["TH_NP15_GEN-APND", "DLAP_PGAE-APND", "A-APND", "B_NODE"]
+        df = pd.DataFrame(
+            [
+                (start, start + pd.Timedelta(hours=1), node, lmp_type)
+                for start in starts
+                for node in nodes
+                for lmp_type in ["MGHG", "LMP", "MCL", "MCC", "MCE"]
+            ],
+            columns=["Interval Start", "Interval End", "NODE", "LMP_TYPE"],
+        ).sample(frac=1, random_state=0)
+        df["MW"] = rng.normal(size=len(df))
+        df.loc[df.index[:5], "MW"] = np.nan
+        # duplicated rows keep the first value, like aggfunc="first"
+        df = pd.concat([df, df.iloc[:10].assign(MW=99.0)])
+        df.insert(0, "Time", df["Interval Start"])
+
+        expected = (
+            df.pivot_table(
+                index=["Time", "Interval Start", "Interval End", "NODE"],
+                columns="LMP_TYPE",
+                values="MW",
+                aggfunc="first",
+            )
+            .reset_index()
+            .rename(
+                columns={
+                    "NODE": "Location",
+                    "MCE": "Energy",
+                    "MCC": "Congestion",
+                    "MCL": "Loss",
+                    "MGHG": "GHG",
+                },
+            )
+        )
+        expected.columns.name = None
+
+        result = _pivot_lmp_types(df, "MW")
+
+        pd.testing.assert_frame_equal(result, expected[result.columns.tolist()])
+
+        location_types = _lmp_location_types(
+            result["Location"],
+            CAISO.trading_hub_locations,
+        )
+        assert dict(zip(result["Location"], location_types)) == {
+            "TH_NP15_GEN-APND": "Trading Hub",
+            "DLAP_PGAE-APND": "DLAP",
+            "A-APND": "AP Node",
+            "B_NODE": "Node",
+        }
+
+        # Location Type stays plain strings, also when chunks with different sets
+        # of location types are concatenated
+        chunks = [
+            pd.DataFrame(
+                {
+                    "Location Type": _lmp_location_types(
+                        pd.Series(locations),
+                        CAISO.trading_hub_locations,
+                    ),
+                },
+            )
+            for locations in [["A-APND", "B_NODE"], ["DLAP_PGAE-APND"]]
+        ]
+        assert all(chunk["Location Type"].dtype == object for chunk in chunks)
+        combined = pd.concat(chunks, ignore_index=True)
+        assert combined["Location Type"].dtype == object
+        assert combined["Location Type"].tolist() == ["AP Node", "Node", "DLAP"]
+
+    def test_get_lmp_all_locations_fetches_hours_concurrently(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from gridstatus.caiso import caiso
+
+        iso = CAISO(max_workers=4)
+        start = pd.Timestamp("2024-01-01", tz=iso.default_timezone)
+        end = start + pd.Timedelta(hours=4)
+        # every hour waits for the others, so this only passes if they overlap
+        barrier = threading.Barrier(4, timeout=5)
+
+        def respond(url: str, **kwargs) -> FakeResponse:
+            # a retry is made by the thread whose request was rate-limited
+            if requested_urls.count(url) > 1:
+                return self._lmp_zip_response(url)
+
+            barrier.wait()
+            # the first hour is rate-limited once and retried
+            if "T08:00" in url.split("startdatetime=")[1][:14]:
+                return FakeResponse(status_code=429)
+            return self._lmp_zip_response(url)
+
+        requested_urls = patch_requests_get(monkeypatch, caiso, respond)
+        df = iso.get_lmp_real_time_5_min(start, end=end)
+
+        assert len(requested_urls) == 5
+        assert df["Interval Start"].tolist() == list(
+            pd.date_range(start, end, freq="h", inclusive="left"),
+        )
+        assert df["LMP"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    @staticmethod
+    def _lmp_zip_response(url: str) -> FakeResponse:
+        start = pd.Timestamp(
+            url.split("startdatetime=")[1].split("&")[0],
+        ).tz_convert("UTC")
+        csv = (
+            "INTERVALSTARTTIME_GMT,INTERVALENDTIME_GMT,NODE,LMP_TYPE,VALUE\n"
+            + "".join(
+                f"{start.isoformat()},"
+                f"{(start + pd.Timedelta(minutes=5)).isoformat()},"
+                f"NODE_A,{lmp_type},{start.hour - 7.0 if lmp_type == 'LMP' else 0}\n"
+                for lmp_type in ["LMP", "MCE", "MCC", "MCL", "MGHG"]
+            )
+        )
+        return oasis_zip_response({"lmp.csv": csv})
+
     @pytest.mark.parametrize(
         "date",
         [pd.Timestamp.now().date() - pd.Timedelta(days=1201)],
@@ -1473,11 +1954,271 @@ class TestCAISO(BaseTestISO):
 
             assert df.empty
 
+    def test_get_oasis_datasets_plans_every_request_up_front(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from gridstatus.caiso import caiso
+
+        iso = CAISO(max_workers=3)
+        start = pd.Timestamp("2024-01-01", tz=iso.default_timezone)
+        end = start + pd.Timedelta(days=2)
+        # schedule_by_tie is queried a day at a time and as_requirements in one
+        # request, and all three requests only finish if they overlap
+        barrier = threading.Barrier(3, timeout=5)
+
+        def respond(url: str, **kwargs) -> FakeResponse:
+            barrier.wait()
+            query = "groupid" if "groupid=" in url else "queryname"
+            name = url.split(f"{query}=")[1].split("&")[0]
+            window_start = url.split("startdatetime=")[1].split("&")[0]
+            return oasis_zip_response(
+                {"oasis.csv": f"INTERVALSTARTTIME_GMT,NAME\n{window_start},{name}\n"},
+            )
+
+        requested_urls = patch_requests_get(monkeypatch, caiso, respond)
+        frames = iso.get_oasis_datasets(
+            [
+                ("schedule_by_tie", {"groupid": "DAM_ENE_SCH_BY_TIE_GRP"}),
+                ("as_requirements", None),
+            ],
+            start,
+            end=end,
+        )
+
+        assert len(requested_urls) == 3
+        assert list(frames) == ["schedule_by_tie", "as_requirements"]
+        assert (
+            frames["schedule_by_tie"]["NAME"].tolist()
+            == [
+                "DAM_ENE_SCH_BY_TIE_GRP",
+            ]
+            * 2
+        )
+        assert frames["schedule_by_tie"]["INTERVALSTARTTIME_GMT"].tolist() == [
+            pd.Timestamp("2024-01-01 08:00", tz="UTC"),
+            pd.Timestamp("2024-01-02 08:00", tz="UTC"),
+        ]
+        assert frames["as_requirements"]["NAME"].tolist() == ["AS_REQ"]
+
+    def test_get_oasis_datasets_rejects_duplicate_datasets(self) -> None:
+        with pytest.raises(ValueError, match="more than once"):
+            self.iso.get_oasis_datasets(
+                [("as_requirements", None), ("as_requirements", None)],
+                "2024-01-01",
+            )
+
+    def test_get_oasis_reads_only_requested_columns_of_every_file(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from gridstatus.caiso import caiso
+
+        def member(lmp_type: str, value: float) -> str:
+            return (
+                "INTERVALSTARTTIME_GMT,INTERVALENDTIME_GMT,OPR_DT,NODE,LMP_TYPE,MW\n"
+                + (
+                    "".join(
+                        f"2024-01-01T{hour:02d}:00:00-00:00,"
+                        f"2024-01-01T{hour + 1:02d}:00:00-00:00,"
+                        f"2023-12-31,A,{lmp_type},{value + hour}\n"
+                        for hour in [8, 9]
+                    )
+                )
+            )
+
+        response = oasis_zip_response(
+            {"lmp.csv": member("LMP", 10), "mce.csv": member("MCE", 20)},
+        )
+        patch_requests_get(monkeypatch, caiso, lambda url, **kwargs: response)
+
+        start = pd.Timestamp("2024-01-01", tz=self.iso.default_timezone)
+        df = self.iso._get_oasis(
+            config=caiso._oasis_query_config("lmp_day_ahead_hourly"),
+            start=start,
+            raw_data=False,
+            columns=["INTERVALSTARTTIME_GMT", "INTERVALENDTIME_GMT", "LMP_TYPE", "MW"]
+            + ["NOT_IN_FILE"],
+        )
+
+        assert df.columns.tolist() == [
+            "Time",
+            "Interval Start",
+            "Interval End",
+            "LMP_TYPE",
+            "MW",
+        ]
+        assert str(df["Interval Start"].dtype) == "datetime64[ns, US/Pacific]"
+        # the files are merged in time order, keeping file order within a time
+        assert (
+            df["Interval Start"].tolist()
+            == [start] * 2
+            + [
+                start + pd.Timedelta(hours=1),
+            ]
+            * 2
+        )
+        assert df["MW"].tolist() == [18.0, 28.0, 19.0, 29.0]
+
+    @pytest.mark.real_pnode_map
     def test_get_pnodes(self):
         with caiso_vcr.use_cassette("test_get_pnodes.yaml"):
-            df = self.iso.get_pnodes()
+            df = CAISO().get_pnodes()
             assert df.shape[0] > 0
 
+    def test_pnode_map_is_downloaded_once_a_day_and_validates_locations(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        iso = CAISO()
+        queried_datasets: list[str] = []
+
+        def fake_get_oasis_dataset(dataset: str, **kwargs) -> pd.DataFrame:
+            queried_datasets.append(dataset)
+            assert dataset == "pnode_map", "LMP queried before checking locations"
+            return pd.DataFrame(
+                {
+                    "APNODE_ID": ["TH_NP15_GEN-APND", "DLAP_PGAE-APND", "A-APND"],
+                    "PNODE_ID": ["NODE_1", "NODE_2", "NODE_1"],
+                },
+            )
+
+        monkeypatch.setattr(iso, "get_oasis_dataset", fake_get_oasis_dataset)
+
+        assert iso.get_pnodes().columns.tolist() == ["Aggregate PNode ID", "PNode ID"]
+        lookup = iso.get_pnode_lookup()
+        assert lookup["Location Type"].to_dict() == {
+            "NODE_1": "Node",
+            "NODE_2": "Node",
+            "TH_NP15_GEN-APND": "Trading Hub",
+            "DLAP_PGAE-APND": "DLAP",
+            "A-APND": "AP Node",
+        }
+
+        with pytest.raises(ValueError, match=r"Unknown CAISO locations: \['NOPE'\]"):
+            iso._get_lmp(
+                "2024-01-01",
+                market=Markets.DAY_AHEAD_HOURLY,
+                locations=["NODE_1", "NOPE"],
+            )
+        assert queried_datasets == ["pnode_map"]
+
+        # the map is downloaded again once the day changes
+        day, pnodes, lookup = iso._pnodes
+        iso._pnodes = (day - pd.Timedelta(days=1), pnodes, lookup)
+        iso.get_pnodes()
+        assert queried_datasets == ["pnode_map"] * 2
+
+    def test_pnode_lookup_location_types_match_get_lmp(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        iso = CAISO()
+        locations = [
+            "TH_NP15_GEN-APND",
+            "DLAP_PGAE-APND",
+            "A-APND",
+            "NODE_1",
+            "NODE_2",
+        ]
+        start = pd.Timestamp("2024-01-01", tz=iso.default_timezone)
+
+        def fake_get_oasis_dataset(dataset: str, **kwargs) -> pd.DataFrame:
+            if dataset == "pnode_map":
+                return pd.DataFrame(
+                    {
+                        "APNODE_ID": locations[:3],
+                        "PNODE_ID": ["NODE_1", "NODE_2", "NODE_1"],
+                    },
+                )
+
+            assert kwargs["params"] == {"node": ",".join(locations)}
+            return pd.DataFrame(
+                {
+                    "Time": start,
+                    "Interval Start": start,
+                    "Interval End": start + pd.Timedelta(hours=1),
+                    "NODE": locations,
+                    "LMP_TYPE": "LMP",
+                    "MW": 10.0,
+                },
+            )
+
+        monkeypatch.setattr(iso, "get_oasis_dataset", fake_get_oasis_dataset)
+
+        df = iso._get_lmp(start, market=Markets.DAY_AHEAD_HOURLY, locations=locations)
+        lookup = iso.get_pnode_lookup()
+
+        assert sorted(df["Location"]) == sorted(locations)
+        assert (
+            df.set_index("Location")["Location Type"].to_dict()
+            == lookup.loc[locations, "Location Type"].to_dict()
+        )
+
+    def test_get_lmp_location_types_come_from_pnode_lookup(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        iso = CAISO()
+        start = pd.Timestamp("2024-01-01", tz=iso.default_timezone)
+        locations = ["NODE_1", "DLAP_SCE-APND", "NEW_NODE"]
+
+        def fake_get_oasis_dataset(dataset: str, **kwargs) -> pd.DataFrame:
+            assert dataset == "lmp_day_ahead_hourly"
+            return pd.DataFrame(
+                {
+                    "Time": start,
+                    "Interval Start": start,
+                    "Interval End": start + pd.Timedelta(hours=1),
+                    "NODE": locations,
+                    "LMP_TYPE": "LMP",
+                    "MW": 10.0,
+                },
+            )
+
+        monkeypatch.setattr(iso, "get_oasis_dataset", fake_get_oasis_dataset)
+        # a lookup typing NODE_1 differently from its name shows which is used
+        lookup = pd.DataFrame(
+            {"Location Type": ["AP Node"]},
+            index=pd.Index(["NODE_1"], name="Location"),
+        )
+        monkeypatch.setattr(iso, "get_pnode_lookup", lambda verbose=False: lookup)
+
+        df = iso._get_lmp(start, market=Markets.DAY_AHEAD_HOURLY, locations="ALL")
+
+        assert df.set_index("Location")["Location Type"].to_dict() == {
+            "NODE_1": "AP Node",
+            "DLAP_SCE-APND": "DLAP",
+            "NEW_NODE": "Node",
+        }
+
+    def test_get_lmp_can_skip_location_validation(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        iso = CAISO(validate_locations=False)
+        start = pd.Timestamp("2024-01-01", tz=iso.default_timezone)
+
+        def fake_get_oasis_dataset(dataset: str, **kwargs) -> pd.DataFrame:
+            if dataset == "pnode_map":
+                return pd.DataFrame({"APNODE_ID": ["A-APND"], "PNODE_ID": ["NODE_1"]})
+            return pd.DataFrame(
+                {
+                    "Time": start,
+                    "Interval Start": start,
+                    "Interval End": start + pd.Timedelta(hours=1),
+                    "NODE": ["NOPE"],
+                    "LMP_TYPE": "LMP",
+                    "MW": 10.0,
+                },
+            )
+
+        monkeypatch.setattr(iso, "get_oasis_dataset", fake_get_oasis_dataset)
+
+        df = iso._get_lmp(start, market=Markets.DAY_AHEAD_HOURLY, locations=["NOPE"])
+
+        assert df["Location Type"].tolist() == ["Node"]
+
     """get_lmp_scheduling_point_tie_combination"""
 
     def _check_lmp_scheduling_point_tie(self, df: pd.DataFrame):
@@ -2536,6 +3277,42 @@ class TestCAISO(BaseTestISO):
             f"https://www.caiso.com/documents/{compact_document_name}" in requested_urls
         )
 
+    def test_storage_datasets_fetch_each_report_once_and_remember_slug(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from gridstatus.caiso import daily_energy_storage
+
+        def respond(url: str, **kwargs) -> FakeResponse:
+            # both days were published under the legacy slug
+            if url.endswith(("may-302024.html", "may-312024.html")):
+                return FakeResponse(
+                    "<html><script>var tot_charge_rtd = [1, 2, 3];</script></html>",
+                )
+            return FakeResponse(status_code=404)
+
+        requested_urls = patch_requests_get(
+            monkeypatch,
+            daily_energy_storage,
+            respond,
+        )
+        iso = CAISO()
+
+        datasets = iso.get_storage_datasets("2024-05-30", end="2024-06-01")
+
+        assert set(datasets) == set(daily_energy_storage.STORAGE_DATASET_BUILDERS)
+        assert datasets["soc_rtd"]["SOC"].tolist() == [1.0, 2.0, 3.0] * 2
+        # the first day probes the standard slugs (the no zero day ones are the
+        # same URLs for day 30), then the second day is fetched straight from
+        # the slug that found the first
+        assert len(requested_urls) == 3 + 1
+        assert requested_urls[-1].endswith("may-312024.html")
+
+        df = iso.get_storage_soc_rtd("2024-05-31")
+        df.loc[:, "SOC"] = 0.0
+        assert iso.get_storage_soc_rtd("2024-05-31")["SOC"].tolist() == [1.0, 2.0, 3.0]
+        assert len(requested_urls) == 4
+
     def test_daily_energy_storage_parse_and_downsample_coerce_na_strings(self) -> None:
         from gridstatus.caiso import daily_energy_storage
 
@@ -2553,6 +3330,31 @@ class TestCAISO(BaseTestISO):
         assert down[0] == (1.0 + 2.0) / 2.0
         assert down[1] == (4.0 + 5.0 + 6.0) / 3.0
 
+    def test_extract_js_arrays_parses_every_chart_variable_in_one_pass(self) -> None:
+        html = (
+            "<script>var tot_energy_rtd = [1334, 1098.5, 42];\n"
+            'tot_charge_rtd = [1, null, \'NA\', "N/A", Infinity, "7",];\n'
+            'solar_rtd = JSON.parse(["[10, \\"NA\\", 30]"]);\n'
+            "var empty = [];\n"
+            "var tot_energy_rtd = [0];\n"
+            "var options = {series: [{data: [5, 6]}]};</script>"
+        )
+        arrays = caiso_utils.extract_js_arrays(html)
+
+        assert set(arrays) == {"tot_energy_rtd", "tot_charge_rtd", "solar_rtd", "empty"}
+        np.testing.assert_array_equal(arrays["tot_energy_rtd"], [1334, 1098.5, 42])
+        np.testing.assert_array_equal(
+            arrays["tot_charge_rtd"],
+            [1, np.nan, np.nan, np.nan, np.nan, 7],
+        )
+        np.testing.assert_array_equal(arrays["solar_rtd"], [10, np.nan, 30])
+        assert arrays["empty"].dtype == float and len(arrays["empty"]) == 0
+        assert not arrays["tot_energy_rtd"].flags.writeable
+
+        from gridstatus.caiso import daily_energy_storage
+
+        assert len(daily_energy_storage._parse_js_array(html, "missing")) == 0
+
     def test_build_storage_soc_hourly_collapses_forward_filled_five_minute_arrays(
         self,
     ) -> None:
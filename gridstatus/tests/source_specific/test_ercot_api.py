@@ -1,10 +1,18 @@
 import datetime
+import gzip
+import io
+import json
+import os
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import pandas as pd
 import pytest
 
 from gridstatus.base import Markets, NoDataFoundException
-from gridstatus.ercot import ELECTRICAL_BUS_LOCATION_TYPE
+from gridstatus.ercot import ELECTRICAL_BUS_LOCATION_TYPE, Ercot
 from gridstatus.ercot_60d_utils import (
     DAM_AS_ONLY_AWARDS_KEY,
     DAM_AS_ONLY_OFFERS_KEY,
@@ -14,10 +22,16 @@ from gridstatus.ercot_60d_utils import (
     DAM_ESR_KEY,
     DAM_RESOURCE_AS_OFFERS_COLUMNS,
 )
+from gridstatus.ercot_api import api_parser, archive_mirror, ercot_api
 from gridstatus.ercot_api.api_parser import VALID_VALUE_TYPES
+from gridstatus.ercot_api.archive_mirror import ErcotArchiveMirror
 from gridstatus.ercot_api.ercot_api import (
     HISTORICAL_DAYS_THRESHOLD,
+    LMP_BY_BUS_ENDPOINT,
+    PUBLIC_ENDPOINTS_MAP_FILE,
+    APITypeEnum,
     ErcotAPI,
+    ErcotTokenManager,
 )
 from gridstatus.ercot_constants import (
     SOLAR_ACTUAL_AND_FORECAST_BY_GEOGRAPHICAL_REGION_COLUMNS,
@@ -94,6 +108,62 @@ class TestErcotAPI(TestHelperMixin):
             days_to_add_if_no_end=1,
         ) == self.local_start_of_day(datetime.date(2021, 11, 7))
 
+    """token manager"""
+
+    @staticmethod
+    def _mock_token_response(token: str) -> mock.Mock:
+        response = mock.Mock()
+        response.json.return_value = {"id_token": token, "expires_in": "3600"}
+        return response
+
+    def test_token_manager_refreshes_once_across_threads(self):
+        token_manager = ErcotTokenManager(username="user", password="password")
+
+        with mock.patch(
+            "gridstatus.ercot_api.ercot_api.requests.post",
+            return_value=self._mock_token_response("token-1"),
+        ) as mock_post:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                tokens = list(
+                    executor.map(lambda _: token_manager.get_token(), range(32)),
+                )
+
+            assert set(tokens) == {"token-1"}
+            assert mock_post.call_count == 1
+
+            # Shared instances reuse the same token
+            iso = ErcotAPI(token_manager=token_manager)
+            assert iso.headers()["Authorization"] == "Bearer token-1"
+            assert mock_post.call_count == 1
+
+            # Refreshed proactively before the token actually expires
+            token_manager.token_expiry = time.time() + 60
+            mock_post.return_value = self._mock_token_response("token-2")
+            assert token_manager.get_token() == "token-2"
+            assert mock_post.call_count == 2
+
+    def test_token_manager_reuses_cached_token_file(self, tmp_path):
+        cache_file = str(tmp_path / "ercot_token.json")
+
+        with mock.patch(
+            "gridstatus.ercot_api.ercot_api.requests.post",
+            return_value=self._mock_token_response("cached-token"),
+        ) as mock_post:
+            first = ErcotTokenManager("user", "password", cache_file=cache_file)
+            assert first.get_token() == "cached-token"
+
+            # Another worker process with the same cache file reuses the token
+            second = ErcotTokenManager("user", "password", cache_file=cache_file)
+            assert second.get_token() == "cached-token"
+            assert mock_post.call_count == 1
+
+            # Tokens cached for other users are ignored
+            other = ErcotTokenManager("other", "password", cache_file=cache_file)
+            other.get_token()
+            assert mock_post.call_count == 2
+
+        assert os.stat(cache_file).st_mode & 0o777 == 0o600
+
     """get_wind_actual_and_forecast_hourly"""
 
     def _check_wind_actual_and_forecast_hourly(self, df):
@@ -1088,6 +1158,64 @@ class TestErcotAPI(TestHelperMixin):
         # Not inclusive of end date
         assert df["Interval End"].max() == self.local_start_of_day(end_date)
 
+    def test_get_lmp_by_bus_splits_range_at_historical_boundary(self):
+        boundary = self.iso._historical_boundary()
+        start_date = boundary - pd.DateOffset(days=1)
+        end_date = boundary + pd.DateOffset(days=1)
+
+        def sced_data(sced_timestamps, repeated_hour_flag):
+            return pd.DataFrame(
+                {
+                    "SCEDTimestamp": sced_timestamps,
+                    "RepeatedHourFlag": repeated_hour_flag,
+                    "ElectricalBus": "BUS1",
+                    "LMP": 20.0,
+                },
+            )
+
+        before = boundary - pd.Timedelta(minutes=5)
+        # The archives and the live API format timestamps differently, and both
+        # include the run at the boundary
+        historical_data = sced_data(
+            [
+                before.strftime("%m/%d/%Y %H:%M:%S"),
+                boundary.strftime("%m/%d/%Y %H:%M:%S"),
+            ],
+            "N",
+        )
+        live_data = sced_data(
+            [
+                boundary.strftime("%Y-%m-%dT%H:%M:%S"),
+                (boundary + pd.Timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%S"),
+            ],
+            False,
+        )
+
+        with (
+            mock.patch.object(
+                self.iso,
+                "get_historical_data",
+                return_value=historical_data,
+            ) as mock_historical,
+            mock.patch.object(
+                self.iso,
+                "hit_ercot_api",
+                return_value=live_data,
+            ) as mock_live,
+        ):
+            df = self.iso.get_lmp_by_bus(start_date, end_date)
+
+        assert mock_historical.call_args.kwargs["start_date"] == start_date
+        assert mock_historical.call_args.kwargs["end_date"] == boundary
+        assert mock_live.call_args.kwargs["SCEDTimestampFrom"] == boundary
+        assert mock_live.call_args.kwargs["SCEDTimestampTo"] == end_date
+
+        assert df["SCED Timestamp"].tolist() == [
+            before,
+            boundary,
+            boundary + pd.Timedelta(minutes=5),
+        ]
+
     """lmp_by_bus_dam"""
 
     def _check_lmp_by_bus_dam(self, df):
@@ -1459,6 +1587,105 @@ class TestErcotAPI(TestHelperMixin):
 
         assert df["Market"].unique().tolist() == ["DAY_AHEAD_HOURLY"]
 
+    def test_get_spp_day_ahead_hourly_live_matches_archive_format(self):
+        boundary = self.iso._historical_boundary()
+        start_date = boundary - pd.DateOffset(days=1)
+        end_date = boundary + pd.DateOffset(days=1)
+
+        def day_rows(day, delivery_date, dst_flag):
+            return [
+                [
+                    delivery_date(day),
+                    f"{hour:02d}:00",
+                    location,
+                    float(hour),
+                    dst_flag,
+                ]
+                for hour in range(1, 25)
+                for location in ["HB_HOUSTON", "NODE_1"]
+            ]
+
+        archive_columns = [
+            "DeliveryDate",
+            "HourEnding",
+            "SettlementPoint",
+            "SettlementPointPrice",
+            "DSTFlag",
+        ]
+        historical_data = pd.DataFrame(
+            day_rows(start_date, lambda day: day.strftime("%m/%d/%Y"), "N"),
+            columns=archive_columns,
+        )
+        # The live API returns camelCase fields, ISO dates and a boolean DSTFlag
+        live_response = {
+            "_meta": {"totalPages": 1},
+            "fields": [
+                {"name": name}
+                for name in [
+                    "deliveryDate",
+                    "hourEnding",
+                    "settlementPoint",
+                    "settlementPointPrice",
+                    "DSTFlag",
+                ]
+            ],
+            "data": day_rows(boundary, lambda day: day.strftime("%Y-%m-%d"), False),
+        }
+
+        with (
+            mock.patch.object(
+                self.iso,
+                "get_historical_data",
+                return_value=historical_data,
+            ),
+            mock.patch.object(
+                self.iso,
+                "make_api_call",
+                return_value=live_response,
+            ) as mock_make_api_call,
+            mock.patch.object(
+                Ercot,
+                "_get_settlement_point_mapping",
+                return_value=pd.DataFrame({"RESOURCE_NODE": ["NODE_1"]}),
+            ),
+        ):
+            df = self.iso.get_spp_day_ahead_hourly(start_date, end_date)
+
+        api_params = mock_make_api_call.call_args.kwargs["api_params"]
+        assert api_params["deliveryDateFrom"] == boundary.strftime("%Y-%m-%d")
+
+        assert df.columns.tolist() == [
+            "Time",
+            "Interval Start",
+            "Interval End",
+            "Location",
+            "Location Type",
+            "Market",
+            "SPP",
+        ]
+        assert df["Interval Start"].tolist() == [
+            interval_start
+            for interval_start in pd.date_range(
+                start_date,
+                end_date,
+                freq="h",
+                inclusive="left",
+            )
+            for _ in range(2)
+        ]
+        assert df["Location Type"].tolist()[:2] == ["Trading Hub", "Resource Node"]
+        assert (df["Market"] == "DAY_AHEAD_HOURLY").all()
+        assert df["SPP"].tolist() == [
+            float(hour) for _ in range(2) for hour in range(1, 25) for _ in range(2)
+        ]
+
+    def test_get_spp_day_ahead_hourly_live_unexpected_columns(self):
+        live_data = pd.DataFrame(
+            {"DeliveryDate": ["2024-01-01"], "HourEnding": ["01:00"]},
+        )
+        with pytest.raises(ValueError, match="missing"):
+            self.iso._spp_day_ahead_hourly_live_to_archive_format(live_data)
+
     @pytest.mark.integration
     def test_get_spp_day_ahead_hourly_historical_date_range(self):
         start_date = self.local_today() - pd.DateOffset(days=100)
@@ -1693,6 +1920,286 @@ class TestErcotAPI(TestHelperMixin):
         # would be a regression.
         assert data.shape == (5184, 19)
 
+    @staticmethod
+    def _mock_bulk_download_response(documents: dict[str, pd.DataFrame]) -> bytes:
+        """Builds an archive download response: a zip of zipped csvs named by docId"""
+        outer = io.BytesIO()
+        with zipfile.ZipFile(outer, "w") as outer_zip:
+            for doc_id, df in documents.items():
+                inner = io.BytesIO()
+                with zipfile.ZipFile(inner, "w") as inner_zip:
+                    inner_zip.writestr(f"{doc_id}.csv", df.to_csv(index=False))
+                outer_zip.writestr(f"{doc_id}.zip", inner.getvalue())
+        return outer.getvalue()
+
+    def test_iter_historical_data_yields_per_batch(self):
+        documents = {
+            str(doc_id): pd.DataFrame(
+                {
+                    "SCEDTimestamp": [f"01/01/2020 00:0{doc_id}:00"] * 2,
+                    "ElectricalBus": ["BUS_A", "BUS_B"],
+                    "LMP": [doc_id, doc_id + 0.5],
+                },
+            )
+            for doc_id in range(1, 6)
+        }
+        links_and_post_datetimes = [
+            (f"{LMP_BY_BUS_ENDPOINT}?download={doc_id}", f"2020-01-01T00:0{doc_id}:00")
+            for doc_id in documents
+        ]
+
+        def fake_make_api_call(url, api_params=None, **kwargs):
+            return self._mock_bulk_download_response(
+                {doc_id: documents[doc_id] for doc_id in api_params["docIds"]},
+            )
+
+        iso = ErcotAPI(batch_size=2)
+        with (
+            mock.patch.object(
+                iso,
+                "_get_historical_data_links",
+                return_value=links_and_post_datetimes,
+            ),
+            mock.patch.object(
+                iso,
+                "make_api_call",
+                side_effect=fake_make_api_call,
+            ) as mock_make_api_call,
+        ):
+            batches = iso.iter_historical_data(
+                LMP_BY_BUS_ENDPOINT,
+                start_date="2020-01-01",
+                end_date="2020-01-02",
+                add_post_datetime=True,
+                usecols=["ElectricalBus", "LMP"],
+                row_filter=lambda df: df["ElectricalBus"] == "BUS_A",
+            )
+
+            first_batch = next(batches)
+            # Only the first batch has been downloaded so far
+            assert mock_make_api_call.call_count == 1
+            assert first_batch.columns.tolist() == [
+                "ElectricalBus",
+                "LMP",
+                "postDatetime",
+            ]
+            assert first_batch["LMP"].tolist() == [1, 2]
+
+            rest = list(batches)
+
+        assert mock_make_api_call.call_count == 3
+        assert [len(batch) for batch in rest] == [2, 1]
+        assert rest[-1]["postDatetime"].tolist() == ["2020-01-01T00:05:00"]
+
+    def test_get_historical_data_links_cached_listing(self, tmp_path):
+        # One archive posted every 6 hours
+        post_datetimes = pd.date_range("2020-01-01 03:00", "2020-01-10", freq="6h")
+        archives = [
+            {
+                "docId": doc_id,
+                "postDatetime": post_datetime.strftime("%Y-%m-%dT%H:%M:%S"),
+                "_links": {
+                    "endpoint": {
+                        "href": f"{LMP_BY_BUS_ENDPOINT}?download={doc_id}",
+                    },
+                },
+            }
+            for doc_id, post_datetime in enumerate(post_datetimes)
+        ]
+
+        def fake_make_api_call(url, api_params=None, **kwargs):
+            start = pd.Timestamp(api_params["postDatetimeFrom"])
+            end = pd.Timestamp(api_params["postDatetimeTo"])
+            matching = [
+                archive
+                for archive in archives
+                if start <= pd.Timestamp(archive["postDatetime"]) <= end
+            ]
+            size = api_params["size"]
+            page = api_params["page"]
+            return {
+                "_meta": {"totalPages": max(1, -(-len(matching) // size))},
+                "archives": matching[(page - 1) * size : page * size],
+            }
+
+        iso = ErcotAPI(archive_listing_cache_dir=str(tmp_path))
+        with mock.patch.object(
+            iso,
+            "make_api_call",
+            side_effect=fake_make_api_call,
+        ) as mock_make_api_call:
+            links = iso._get_historical_data_links(
+                "np6-787-cd",
+                start_date="2020-01-02T00:00:00",
+                end_date="2020-01-04T00:00:00",
+            )
+            assert len(links) == 8
+            assert mock_make_api_call.call_count == 1
+
+            # Fully covered by the cache
+            links = iso._get_historical_data_links(
+                "np6-787-cd",
+                start_date="2020-01-02T12:00:00",
+                end_date="2020-01-03T00:00:00",
+            )
+            assert [post_datetime for _, post_datetime in links] == [
+                "2020-01-02T15:00:00",
+                "2020-01-02T21:00:00",
+            ]
+            assert mock_make_api_call.call_count == 1
+
+            # Only the part after the cached window is listed
+            links = iso._get_historical_data_links(
+                "np6-787-cd",
+                start_date="2020-01-03T00:00:00",
+                end_date="2020-01-06T00:00:00",
+            )
+            assert len(links) == 12
+            assert mock_make_api_call.call_count == 2
+            api_params = mock_make_api_call.call_args.kwargs["api_params"]
+            assert api_params["postDatetimeFrom"] == "2020-01-04T00:00:00"
+
+            # A window separated from the cached one by a gap lists only itself
+            links = iso._get_historical_data_links(
+                "np6-787-cd",
+                start_date="2020-01-08T00:00:00",
+                end_date="2020-01-09T00:00:00",
+            )
+            assert len(links) == 4
+            assert mock_make_api_call.call_count == 3
+            api_params = mock_make_api_call.call_args.kwargs["api_params"]
+            assert api_params["postDatetimeFrom"] == "2020-01-08T00:00:00"
+            assert api_params["postDatetimeTo"] == "2020-01-09T00:00:00"
+
+            # Only the gap between the cached windows is listed
+            links = iso._get_historical_data_links(
+                "np6-787-cd",
+                start_date="2020-01-05T00:00:00",
+                end_date="2020-01-08T12:00:00",
+            )
+            assert len(links) == 14
+            assert mock_make_api_call.call_count == 4
+            api_params = mock_make_api_call.call_args.kwargs["api_params"]
+            assert api_params["postDatetimeFrom"] == "2020-01-06T00:00:00"
+            assert api_params["postDatetimeTo"] == "2020-01-08T00:00:00"
+
+            # The cache is versioned JSON, and a cache that doesn't validate is
+            # listed again rather than trusted
+            (cache_path,) = tmp_path.glob("*np6-787-cd.json.gz")
+            with gzip.open(cache_path, "rt", encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+            assert cache["version"] == ercot_api.ARCHIVE_LISTING_CACHE_VERSION
+            assert len(cache["archives"]["docId"]) == 28
+
+            cache["archives"]["docId"].pop()
+            with gzip.open(cache_path, "wt", encoding="utf-8") as cache_file:
+                json.dump(cache, cache_file)
+            links = iso._get_historical_data_links(
+                "np6-787-cd",
+                start_date="2020-01-02T12:00:00",
+                end_date="2020-01-03T00:00:00",
+            )
+            assert len(links) == 2
+            assert mock_make_api_call.call_count == 5
+
+    def test_archive_mirror_sync_serve_and_prune(self, tmp_path, monkeypatch):
+        now = pd.Timestamp.now(tz=ErcotAPI.default_timezone).tz_localize(None)
+        post_datetimes = pd.date_range(
+            (now - pd.Timedelta(days=4)).floor("D"),
+            periods=7,
+            freq="12h",
+        )
+        archives = pd.DataFrame(
+            {
+                "docId": [str(doc_id) for doc_id in range(len(post_datetimes))],
+                "postDatetime": post_datetimes.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+        )
+        archives["href"] = f"{LMP_BY_BUS_ENDPOINT}?download=" + archives["docId"]
+
+        def fake_list_archives(emil_id, start, end, verbose=False, api=None):
+            post = pd.to_datetime(archives["postDatetime"])
+            return archives[(post >= start) & (post <= end)]
+
+        def fake_make_api_call(url, api_params=None, **kwargs):
+            return self._mock_bulk_download_response(
+                {
+                    doc_id: pd.DataFrame({"docId": [doc_id]})
+                    for doc_id in api_params["docIds"]
+                },
+            )
+
+        mirror = ErcotArchiveMirror(str(tmp_path))
+        iso = ErcotAPI(archive_mirror=mirror)
+        start = post_datetimes[0]
+        with (
+            mock.patch.object(iso, "_list_archives", side_effect=fake_list_archives),
+            mock.patch.object(
+                iso,
+                "make_api_call",
+                side_effect=fake_make_api_call,
+            ) as mock_make_api_call,
+        ):
+            assert mirror.sync(iso, LMP_BY_BUS_ENDPOINT, start=start) == 7
+            # Nothing new to mirror
+            assert mirror.sync(iso, LMP_BY_BUS_ENDPOINT) == 0
+            assert mock_make_api_call.call_count == 1
+
+            data = iso.get_historical_data(
+                LMP_BY_BUS_ENDPOINT,
+                start_date=start + pd.Timedelta(hours=1),
+                end_date=start + pd.Timedelta(days=2),
+                add_post_datetime=True,
+            )
+            # Served from disk
+            assert mock_make_api_call.call_count == 1
+            assert data["docId"].tolist() == [1, 2, 3, 4]
+
+            # Only served to queries made to the API the product was mirrored from
+            assert not mirror.covers(
+                "np6-787-cd",
+                start,
+                start + pd.Timedelta(days=1),
+                api=APITypeEnum.ESR_API,
+            )
+            with pytest.raises(ValueError, match="mirrored from the public API"):
+                mirror.sync(iso, LMP_BY_BUS_ENDPOINT, api=APITypeEnum.ESR_API)
+
+        # A reader that loaded the manifest before the prune
+        reader = mirror.iter_documents("np6-787-cd", start, now, batch_size=1)
+        assert len(next(reader)) == 1
+
+        # Keep documents posted from post_datetimes[2] on
+        max_age = now - post_datetimes[2] + pd.Timedelta(hours=1)
+        assert mirror.prune(LMP_BY_BUS_ENDPOINT, max_age=max_age) == 2
+        assert not mirror.covers("np6-787-cd", start, now - pd.Timedelta(days=1))
+
+        # The pruned files stay on disk for the grace period
+        assert len(os.listdir(tmp_path / "np6-787-cd" / "docs")) == 7
+        assert len(list(reader)) == 6
+
+        monkeypatch.setattr(archive_mirror, "MIRROR_PRUNE_GRACE_SECONDS", 0)
+        assert mirror.prune(LMP_BY_BUS_ENDPOINT, max_age=max_age) == 0
+        assert sorted(os.listdir(tmp_path / "np6-787-cd" / "docs")) == [
+            f"{doc_id}.zip" for doc_id in range(2, 7)
+        ]
+
+        # The manifest is versioned JSON, and one of another version is not trusted
+        manifest_path = tmp_path / "np6-787-cd" / "manifest.json.gz"
+        with gzip.open(manifest_path, "rt", encoding="utf-8") as f:
+            manifest = json.load(f)
+        assert manifest["version"] == archive_mirror.MIRROR_MANIFEST_VERSION
+        assert manifest["archives"]["docId"] == [str(i) for i in range(2, 7)]
+
+        with gzip.open(manifest_path, "wt", encoding="utf-8") as f:
+            json.dump({**manifest, "version": -1}, f)
+        assert not mirror.covers("np6-787-cd", post_datetimes[3], post_datetimes[4])
+        with pytest.raises(
+            NoDataFoundException,
+            match=r"^No mirrored archives found for np6-787-cd with time range \S",
+        ):
+            next(mirror.iter_documents("np6-787-cd", start, now, batch_size=1))
+
     """hit_ercot_api"""
 
     @pytest.mark.integration
@@ -1755,6 +2262,57 @@ class TestErcotAPI(TestHelperMixin):
         )
         assert small_pages_result.shape == (20, 12)
 
+    def test_hit_ercot_api_fetches_pages_concurrently_in_order(self):
+        total_pages = 5
+
+        def fake_make_api_call(url, api_params=None, **kwargs):
+            page = api_params["page"]
+            return {
+                "_meta": {"totalPages": total_pages},
+                "fields": [{"name": "electricalBus"}, {"name": "LMP"}],
+                "data": [[f" BUS_{page} ", page]],
+            }
+
+        with mock.patch.object(
+            self.iso,
+            "make_api_call",
+            side_effect=fake_make_api_call,
+        ) as mock_make_api_call:
+            data = self.iso.hit_ercot_api(LMP_BY_BUS_ENDPOINT, max_pages=4)
+
+        assert mock_make_api_call.call_count == 4
+        assert data.columns.tolist() == ["ElectricalBus", "LMP"]
+        assert data["ElectricalBus"].tolist() == ["BUS_1", "BUS_2", "BUS_3", "BUS_4"]
+        assert data["LMP"].tolist() == [1, 2, 3, 4]
+
+    def test_individually_downloaded_documents_are_paced_by_make_api_call(self):
+        from gridstatus.ercot_api import ercot_api
+
+        links = ["https://example.com/1", "https://example.com/2"]
+        # the first link fails once and is retried
+        responses = iter([RuntimeError("Failed after retries"), b"1", b"2"])
+
+        def fake_make_api_call(url, **kwargs):
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        ercot_api.time.sleep.reset_mock()
+        with mock.patch.object(
+            self.iso,
+            "make_api_call",
+            side_effect=fake_make_api_call,
+        ) as mock_make_api_call:
+            documents = list(self.iso._iter_individually_downloaded_documents(links))
+
+        assert mock_make_api_call.call_count == 3
+        assert [(link, f.read()) for link, f in documents] == [
+            (links[0], b"1"),
+            (links[1], b"2"),
+        ]
+        ercot_api.time.sleep.assert_not_called()
+
     """endpoints_map"""
 
     @pytest.mark.integration
@@ -1785,6 +2343,50 @@ class TestErcotAPI(TestHelperMixin):
                 issues.append([f"{endpoint} - {issue}"])
         assert len(issues) == 0
 
+    def test_endpoints_index_cached_by_spec_hash(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(api_parser, "ENDPOINTS_INDEX_CACHE_DIR", str(tmp_path))
+        api_parser.get_endpoints_index.cache_clear()
+
+        try:
+            index = api_parser.get_endpoints_index(PUBLIC_ENDPOINTS_MAP_FILE)
+            cache_files = list(tmp_path.glob("pubapi-apim-api-*.json"))
+            assert len(cache_files) == 1
+
+            # The memoized index is shared, so callers cannot modify it
+            with pytest.raises(TypeError):
+                index[LMP_BY_BUS_ENDPOINT] = {}
+            with pytest.raises(TypeError):
+                index[LMP_BY_BUS_ENDPOINT]["parameters"]["SCEDTimestampFrom"] = "date"
+
+            # A fresh process loads the cached index instead of parsing the spec
+            api_parser.get_endpoints_index.cache_clear()
+            with mock.patch.object(api_parser, "parse_all_endpoints") as mock_parse:
+                assert (
+                    api_parser.get_endpoints_index(PUBLIC_ENDPOINTS_MAP_FILE) == index
+                )
+            mock_parse.assert_not_called()
+
+            # A cache file written for another spec is rebuilt from the spec
+            cache = json.loads(cache_files[0].read_text())
+            cache["spec_sha256"] = "0" * 64
+            cache["endpoints"][LMP_BY_BUS_ENDPOINT]["summary"] = "tampered"
+            cache_files[0].write_text(json.dumps(cache))
+            api_parser.get_endpoints_index.cache_clear()
+            rebuilt = api_parser.get_endpoints_index(PUBLIC_ENDPOINTS_MAP_FILE)
+            assert rebuilt == index
+            assert json.loads(cache_files[0].read_text())["spec_sha256"] != "0" * 64
+        finally:
+            api_parser.get_endpoints_index.cache_clear()
+
+        assert index[LMP_BY_BUS_ENDPOINT]["parameters"]["SCEDTimestampFrom"] == (
+            "timestamp"
+        )
+        assert self.iso._parse_api_params(
+            LMP_BY_BUS_ENDPOINT,
+            10,
+            {"SCEDTimestampFrom": pd.Timestamp("2024-01-01 05:00"), "fake": 1},
+        ) == {"size": 10, "SCEDTimestampFrom": "2024-01-01T05:00:00"}
+
     def _endpoints_map_check(self, endpoint_dict: dict) -> list[str]:
         """Applies unit test checks to a single endpoint in the endpoints map.
 
@@ -1,5 +1,7 @@
+import inspect
 import json
 import os
+import threading
 from pathlib import Path
 from unittest import mock
 
@@ -10,7 +12,7 @@ import pytest
 import gridstatus
 from gridstatus import PJM, NotSupported
 from gridstatus.base import Markets, NoDataFoundException
-from gridstatus.decorators import _get_pjm_archive_date
+from gridstatus.pjm import _get_pjm_archive_date
 from gridstatus.tests.base_test_iso import BaseTestISO
 from gridstatus.tests.vcr_utils import RECORD_MODE, setup_vcr
 
@@ -43,6 +45,39 @@ class TestPJM(BaseTestISO):
         with pytest.raises(ValueError):
             _ = PJM(api_key=None)
 
+    def test_api_keys_rotate_and_back_off_individually(self):
+        pjm = PJM(api_key="key_a, key_b")
+        assert pjm.api_keys == ["key_a", "key_b"]
+
+        def fake_get(url, timeout, headers, **kwargs):
+            response = mock.Mock()
+            # key_a is rate-limited
+            if headers["Ocp-Apim-Subscription-Key"] == "key_a":
+                response.status_code = 429
+            else:
+                response.status_code = 200
+                response.json.return_value = {"ok": True}
+            return response
+
+        with mock.patch.object(
+            pjm.session,
+            "get",
+            side_effect=fake_get,
+        ) as mock_get:
+            assert pjm._make_api_call("https://api.pjm.com/api/v1/test") == {
+                "ok": True,
+            }
+            assert pjm._make_api_call("https://api.pjm.com/api/v1/test") == {
+                "ok": True,
+            }
+
+        used_keys = [
+            call.kwargs["headers"]["Ocp-Apim-Subscription-Key"]
+            for call in mock_get.call_args_list
+        ]
+        # After the 429, requests move to key_b while key_a backs off
+        assert used_keys == ["key_a", "key_b", "key_b"]
+
     """get_fuel_mix"""
 
     def test_get_fuel_mix_latest(self):
@@ -223,6 +258,142 @@ class TestPJM(BaseTestISO):
 
             assert len(df) > 0
 
+    def test_iter_lmp_filters_pre_archive_pages_as_they_arrive(self):
+        iso = PJM(api_key="test")
+        date = pd.Timestamp("2020-01-01", tz=iso.default_timezone)
+        times = pd.date_range(date, periods=48, freq="h").tz_convert("UTC")
+        # Three nodes per hour, only one of which is requested
+        items = [
+            {
+                "datetime_beginning_utc": t.strftime("%Y-%m-%dT%H:%M:%S"),
+                "pnode_id": pnode_id,
+                "pnode_name": "",
+                "type": "HUB" if pnode_id == 1 else "GEN",
+                "total_lmp_rt": 30.0,
+                "system_energy_price_rt": 25.0,
+                "congestion_price_rt": 3.0,
+                "marginal_loss_price_rt": 2.0,
+            }
+            for t in times
+            for pnode_id in [1, 2, 3]
+        ]
+
+        def fake_make_api_call(url, params):
+            start, end = (
+                pd.Timestamp(value, tz=iso.default_timezone)
+                for value in params["datetime_beginning_ept"].split("to")
+            )
+            window = [
+                item
+                for item in items
+                if start
+                <= pd.Timestamp(item["datetime_beginning_utc"], tz="UTC")
+                <= end
+            ]
+            page = window[params["startRow"] - 1 :][: params["rowCount"]]
+            return {"totalRows": len(window), "items": page, "links": []}
+
+        page_sizes = []
+        filter_page = PJM._filter_page
+
+        def spy_filter_page(page, row_filter):
+            filtered = filter_page(page, row_filter)
+            page_sizes.append(len(filtered))
+            return filtered
+
+        pnodes = pd.DataFrame(
+            {
+                "pnode_id": [1, 2, 3],
+                "pnode_name": ["HUB 1", "GEN 2", "GEN 3"],
+                "voltage_level": None,
+                "pnode_short_name": ["HUB 1", "GEN 2", "GEN 3"],
+            },
+        )
+
+        with (
+            mock.patch.object(iso, "_make_api_call", side_effect=fake_make_api_call),
+            mock.patch.object(iso, "_get_cached_pnode_ids", return_value=pnodes),
+            mock.patch.object(PJM, "_filter_page", side_effect=spy_filter_page),
+            pytest.warns(UserWarning, match="filtered as they arrive"),
+        ):
+            frames = list(
+                iso.iter_lmp(
+                    date,
+                    date + pd.Timedelta(days=2),
+                    market=Markets.REAL_TIME_HOURLY,
+                    locations=["1"],
+                ),
+            )
+
+        assert len(frames) == 2
+        for frame in frames:
+            assert (frame["Location Id"] == 1).all()
+            assert len(frame) == 24
+
+        # Every node is downloaded before the archive date, so each day is
+        # planned as six 4 hour requests, and only the requested node's rows
+        # are kept from each page. Ends are inclusive and the data ends on day 2
+        assert sorted(page_sizes) == [4] + [5] * 11
+
+    def test_get_snapshot_fetches_datasets_concurrently(self):
+        iso = PJM(api_key="test")
+        datasets = ["load", "tie_flows_5_min", "area_control_error"]
+        # every fetch waits for the others, so this only passes if they overlap
+        barrier = threading.Barrier(len(datasets), timeout=5)
+        now = pd.Timestamp.now(tz=iso.default_timezone).floor("5min")
+
+        def fake_get_tie_flows(date, end, verbose):
+            barrier.wait()
+            return pd.DataFrame(
+                {
+                    "Interval Start": [now - pd.Timedelta(minutes=5), now, now],
+                    "Tie Flow Name": ["A", "A", "B"],
+                },
+            )
+
+        def fake_get_area_control_error(date, end, verbose):
+            barrier.wait()
+            return pd.DataFrame(
+                {
+                    "Time": [now - pd.Timedelta(seconds=15), now],
+                    "Area Control Error": [1, 2],
+                },
+            )
+
+        def fake_get_load(date, end, verbose):
+            barrier.wait()
+            raise NoDataFoundException("No data found for inst_load")
+
+        with (
+            mock.patch.object(iso, "get_load", side_effect=fake_get_load),
+            mock.patch.object(
+                iso,
+                "get_tie_flows_5_min",
+                side_effect=fake_get_tie_flows,
+            ),
+            mock.patch.object(
+                iso,
+                "get_area_control_error",
+                side_effect=fake_get_area_control_error,
+            ),
+        ):
+            snapshot = iso.get_snapshot(datasets=datasets)
+
+        assert list(snapshot.frames) == ["tie_flows_5_min", "area_control_error"]
+        assert snapshot.frames["tie_flows_5_min"]["Tie Flow Name"].tolist() == [
+            "A",
+            "B",
+        ]
+        assert snapshot.frames["area_control_error"]["Area Control Error"].tolist() == [
+            2,
+        ]
+        assert isinstance(snapshot.errors["load"], NoDataFoundException)
+        assert set(snapshot.latency_seconds) == set(datasets)
+
+    def test_get_snapshot_unknown_dataset_raises(self):
+        with pytest.raises(ValueError, match="Unknown datasets"):
+            PJM(api_key="test").get_snapshot(datasets=["load", "lmp"])
+
     """get_it_sced_lmp_5_min"""
 
     def _check_it_sced_lmp_5_min(self, df):
@@ -464,6 +635,48 @@ class TestPJM(BaseTestISO):
             df = self.iso.get_pnode_ids()
             assert len(df) > 0
 
+    def test_get_pnode_ids_cached_with_short_names(self):
+        iso = PJM(api_key="test")
+        nodes = pd.DataFrame(
+            {
+                "effective_date": [
+                    "2024-01-01",
+                    "2020-01-01",
+                    "2024-01-01",
+                    "2024-01-01",
+                ],
+                "pnode_id": [2, 2, 1, 3],
+                "pnode_name": ["BUS 138 KV T1", "OLD", "WEST HUB", "GEN 500 KV"],
+                "voltage_level": ["138 KV", "138 KV", None, "230 KV"],
+            },
+        )
+
+        with mock.patch.object(
+            iso,
+            "_get_pjm_json",
+            return_value=nodes,
+        ) as mock_get_pjm_json:
+            df = iso.get_pnode_ids()
+            iso.get_pnode_ids()["pnode_name"] = "changed"
+            lmps = iso._add_pnode_info_to_lmp_data(
+                pd.DataFrame(
+                    {"pnode_id": [3, 4, 2], "pnode_name": "", "lmp": [1.0, 2.0, 3.0]},
+                ),
+            )
+
+            assert mock_get_pjm_json.call_count == 1
+            iso.get_pnode_ids(refresh=True)
+            assert mock_get_pjm_json.call_count == 2
+
+        assert df["pnode_id"].tolist() == [1, 2, 3]
+        # The voltage level of pnode 3 is not in its name
+        assert df["pnode_short_name"].tolist() == ["WEST HUB", "BUS", "GEN 500 KV"]
+
+        # Inactive pnodes are dropped
+        assert lmps["pnode_id"].tolist() == [3, 2]
+        assert lmps["pnode_name"].tolist() == ["GEN 500 KV", "BUS 138 KV T1"]
+        assert lmps["lmp"].tolist() == [1.0, 3.0]
+
     """get_status"""
 
     def test_get_status_latest(self):
@@ -600,6 +813,62 @@ class TestPJM(BaseTestISO):
                 end,
             ]
 
+    def test_pjm_plan_dates_sizes_windows_to_one_page(self):
+        pjm = gridstatus.PJM()
+        start = pd.Timestamp("2026-10-01", tz=pjm.default_timezone)
+        end = pd.Timestamp("2026-10-02", tz=pjm.default_timezone)
+
+        # 30,000 locations of 5 minute prices: one interval per request
+        many = list(range(30000))
+        new_dates = gridstatus.pjm.pjm_plan_dates(
+            [start, end],
+            {"self": pjm, "market": Markets.REAL_TIME_5_MIN, "locations": many},
+        )
+        assert new_dates == list(
+            pd.date_range(start, end, freq="5min"),
+        )
+
+        # 100 locations of hourly prices: 500 hours per request
+        start = pd.Timestamp("2026-01-01", tz=pjm.default_timezone)
+        end = pd.Timestamp("2026-03-01", tz=pjm.default_timezone)
+        new_dates = gridstatus.pjm.pjm_plan_dates(
+            [start, end],
+            {
+                "self": pjm,
+                "market": Markets.DAY_AHEAD_HOURLY,
+                "locations": many[:100],
+            },
+        )
+        assert new_dates == [
+            start,
+            start + pd.Timedelta(hours=500),
+            start + pd.Timedelta(hours=1000),
+            end,
+        ]
+
+    def test_pjm_plan_dates_downloads_all_nodes_before_archive_date(self):
+        args_dict = {
+            "self": gridstatus.PJM(),
+            "market": Markets.REAL_TIME_5_MIN,
+            "locations": [1, 2],
+        }
+        archive_date = _get_pjm_archive_date(args_dict["market"])
+        start = archive_date - pd.DateOffset(days=1)
+        end = archive_date + pd.DateOffset(days=1)
+        new_dates = gridstatus.pjm.pjm_plan_dates([start, end], args_dict)
+
+        # the year and archive boundaries are kept
+        archive_index = new_dates.index(None)
+        assert new_dates[archive_index + 1] == archive_date
+        assert new_dates[-1] == end
+
+        # before the archive date every node is downloaded so windows are small
+        before = new_dates[:archive_index]
+        assert before[1] - before[0] == pd.Timedelta(minutes=20)
+
+        # after it only the two locations are, so one request covers the day
+        assert new_dates[archive_index + 1 :] == [archive_date, end]
+
     def sample_forecast_data(self, request):
         with pjm_vcr.use_cassette(f"test_sample_forecast_data_{request.param}.yaml"):
             filename = request.param
@@ -643,6 +912,108 @@ class TestPJM(BaseTestISO):
                     self.iso.default_timezone,
                 ), f"{col} timezone doesn't match the default timezone"
 
+    def test_get_pjm_json_fetches_pages_concurrently_by_start_row(self):
+        start = pd.Timestamp("2024-09-02")
+        total_rows = 25
+        times = pd.date_range(start, periods=total_rows, freq="5min", tz="UTC")
+        all_items = [
+            {"datetime_beginning_utc": t.strftime("%Y-%m-%dT%H:%M:%S"), "mw": float(i)}
+            for i, t in enumerate(times)
+        ]
+
+        def fake_make_api_call(url, params):
+            start_row = params["startRow"]
+            items = all_items[start_row - 1 : start_row - 1 + params["rowCount"]]
+            return {"totalRows": total_rows, "items": items, "links": []}
+
+        with mock.patch.object(
+            self.iso,
+            "_make_api_call",
+            side_effect=fake_make_api_call,
+        ) as mock_make_api_call:
+            df = self.iso._get_pjm_json(
+                "gen_by_fuel",
+                start=start,
+                end=start + pd.Timedelta(days=1),
+                params={},
+                row_count=10,
+                interval_duration_min=5,
+            )
+
+        assert sorted(
+            call.kwargs["params"]["startRow"]
+            for call in mock_make_api_call.call_args_list
+        ) == [1, 11, 21]
+        # Pages are assembled in order whatever order they arrive in
+        assert df["mw"].tolist() == [float(i) for i in range(total_rows)]
+        assert df["mw"].dtype == "float64"
+        assert df["Interval Start"].is_monotonic_increasing
+
+    def test_parse_utc_timestamps_matches_iso8601(self):
+        values = pd.Series(
+            [
+                "2024-11-03T05:00:00",
+                "2024-11-03T06:00:00",
+                None,
+                "2024-11-03T06:00:00.123",
+                "2024-11-03T05:00:00",
+            ],
+        )
+
+        expected = (
+            pd.to_datetime(values, format="ISO8601")
+            .dt.tz_localize("UTC")
+            .dt.tz_convert(self.iso.default_timezone)
+        )
+
+        pd.testing.assert_series_equal(
+            self.iso._parse_utc_timestamps(values),
+            expected,
+        )
+
+    def test_not_in_end_minute_matches_strftime_comparison(self):
+        interval_start = pd.Series(
+            pd.date_range(
+                "2024-11-03 04:00",
+                "2024-11-03 08:00",
+                freq="30s",
+                tz="UTC",
+            ).tz_convert(self.iso.default_timezone),
+        )
+
+        # Covers an end in the repeated hour of the DST change and a naive end
+        for end in [
+            pd.Timestamp("2024-11-03 05:30", tz="UTC").tz_convert(
+                self.iso.default_timezone,
+            ),
+            pd.Timestamp("2024-11-03 02:00"),
+        ]:
+            expected = interval_start.dt.strftime("%Y-%m-%d %H:%M") != end.strftime(
+                "%Y-%m-%d %H:%M",
+            )
+            assert (self.iso._not_in_end_minute(interval_start, end) == expected).all()
+
+    def test_parse_utc_timestamps_repeated_values_keep_index(self):
+        # A day of 5-minute LMPs for a few nodes, so each timestamp repeats, with
+        # some values that have milliseconds and a non-default index
+        times = pd.date_range("2024-11-03", periods=288, freq="5min")
+        values = pd.Series(
+            np.repeat(times.strftime("%Y-%m-%dT%H:%M:%S").to_numpy(), 3),
+            index=np.arange(288 * 3) * 2,
+        )
+        values.iloc[::100] += ".500"
+
+        expected = (
+            pd.to_datetime(values, format="ISO8601")
+            .dt.tz_localize("UTC")
+            .dt.tz_convert(self.iso.default_timezone)
+        )
+
+        pd.testing.assert_series_equal(
+            self.iso._parse_utc_timestamps(values),
+            expected,
+        )
+
     def _check_solar_forecast(self, df):
         assert df.columns.tolist() == [
             "Interval Start",
@@ -1658,6 +2029,198 @@ class TestPJM(BaseTestISO):
                 assert prefix in self.iso.locale_abbreviated_to_full
                 assert suffix in self.iso.service_type_abbreviated_to_full.values()
 
+    def test_get_dam_as_market_results_columns_projects_fields(self):
+        date = pd.Timestamp("2024-09-02", tz=self.iso.default_timezone)
+        items = [
+            {
+                "datetime_beginning_utc": "2024-09-02T04:00:00",
+                "locale": "PJM RTO Reserve Zone",
+                "service": "Primary Reserve",
+                "mcp": 1.5,
+            },
+        ]
+
+        with mock.patch.object(
+            self.iso,
+            "_make_api_call",
+            return_value={"totalRows": 1, "items": items, "links": []},
+        ) as mock_make_api_call:
+            df = self.iso.get_dam_as_market_results(
+                date,
+                columns=["Ancillary Service", "Market Clearing Price"],
+            )
+
+        # Only the timestamps and the fields needed for the columns are requested
+        assert mock_make_api_call.call_args.kwargs["params"]["fields"] == (
+            "datetime_beginning_ept,datetime_beginning_utc,locale,service,mcp"
+        )
+        assert df.columns.tolist() == [
+            "Interval Start",
+            "Interval End",
+            "Ancillary Service",
+            "Market Clearing Price",
+        ]
+        assert df["Ancillary Service"].tolist() == ["PJM_RTO-Primary Reserve"]
+
+    def test_get_dam_as_market_results_unknown_columns_raises(self):
+        with mock.patch.object(self.iso, "_make_api_call") as mock_make_api_call:
+            with pytest.raises(ValueError, match="Unknown columns"):
+                self.iso.get_dam_as_market_results(
+                    pd.Timestamp("2024-09-02", tz=self.iso.default_timezone),
+                    columns=["Not A Column"],
+                )
+
+        mock_make_api_call.assert_not_called()
+
+    # Methods whose output columns are pivoted from field values, so they don't
+    # accept columns=
+    pivoted_methods = [
+        "get_fuel_mix",
+        "get_load",
+        "get_load_forecast",
+        "get_load_forecast_5_min",
+        "get_load_forecast_historical",
+        "get_solar_generation_by_area",
+        "get_wind_generation_by_area",
+    ]
+
+    columns_methods = [
+        name
+        for name, method in inspect.getmembers(PJM, inspect.isfunction)
+        if not name.startswith("_")
+        and "columns" in inspect.signature(method).parameters
+        # iter_lmp and the deprecated get_lmp call the same _get_lmp as the
+        # per-market LMP methods
+        and name not in ("iter_lmp", "get_lmp")
+    ]
+
+    def test_data_miner_methods_accept_columns(self):
+        data_miner_methods = [
+            name
+            for name, method in inspect.getmembers(PJM, inspect.isfunction)
+            if not name.startswith("_")
+            and any(
+                call in inspect.getsource(method)
+                for call in ("self._get_pjm_json(", "self._get_lmp(", "day_inc_dec")
+            )
+        ]
+
+        assert data_miner_methods
+        for name in data_miner_methods:
+            parameters = inspect.signature(getattr(PJM, name)).parameters
+            assert ("columns" in parameters) != (name in self.pivoted_methods), name
+            if name in self.pivoted_methods:
+                assert f"- {name}\n" in PJM.__doc__
+
+    @staticmethod
+    def _fake_data_miner_items(params: dict) -> list[dict]:
+        """One row with a value of the right kind for each requested field"""
+        window = next(
+            (
+                value
+                for key, value in params.items()
+                if key.endswith("_ept") and "to" in str(value)
+            ),
+            "09/02/2024 00:00to09/02/2024 23:59",
+        )
+        start = pd.to_datetime(window.split("to")[0], format="%m/%d/%Y %H:%M")
+        start_utc = start.tz_localize(PJM.default_timezone).tz_convert("UTC")
+
+        def value(field: str):
+            if field == "pnode_id":
+                return 1
+            if field == "duration":
+                return "00:10:00"
+            if field == "type":
+                return "HUB"
+            if field in ("area", "locale", "service", "reserve_type"):
+                return "PJM RTO"
+            if "utc" in field.split("_"):
+                return start_utc.strftime("%Y-%m-%dT%H:%M:%S")
+            if "date" in field or field.endswith("_ept") or "_at" in field:
+                return start.strftime("%Y-%m-%dT%H:%M:%S")
+            return 1.0
+
+        return [
+            {
+                field.strip(): value(field.strip())
+                for field in params["fields"].split(",")
+            },
+        ]
+
+    def _call_with_fake_data_miner(self, name: str, **kwargs):
+        """Calls name against a fake Data Miner and returns its output and the
+        fields each request asked for"""
+        requested_fields = []
+
+        def fake_api_call(url, params, **_):
+            requested_fields.append(
+                {field.strip() for field in params["fields"].split(",")},
+            )
+            items = self._fake_data_miner_items(params)
+            return {"totalRows": len(items), "items": items, "links": []}
+
+        def fake_get_json(url, params, **_):
+            return fake_api_call(url, {**params, "fields": params["fields"]})
+
+        parameters = inspect.signature(getattr(PJM, name)).parameters
+        if name == "get_as_market_results_real_time_hourly":
+            # Only published before the switch to 5 minute results
+            date = pd.Timestamp("2022-08-01", tz=self.iso.default_timezone)
+        else:
+            date = self.local_today() - pd.Timedelta(days=3)
+        if "date" in parameters:
+            kwargs["date"] = date
+            kwargs["end"] = date + pd.Timedelta(days=1)
+        if "locations" in parameters:
+            kwargs["locations"] = "ALL"
+
+        pnode_ids = pd.DataFrame(
+            {
+                "pnode_id": [1],
+                "pnode_name": ["NODE"],
+                "voltage_level": ["500 KV"],
+                "pnode_short_name": ["NODE"],
+            },
+        )
+        with (
+            mock.patch.object(self.iso, "_make_api_call", side_effect=fake_api_call),
+            mock.patch.object(self.iso, "_get_json", side_effect=fake_get_json),
+            mock.patch.object(
+                self.iso,
+                "_get_cached_pnode_ids",
+                return_value=pnode_ids,
+            ),
+        ):
+            df = getattr(self.iso, name)(**kwargs)
+
+        return df, set().union(*requested_fields)
+
+    @pytest.mark.parametrize("name", columns_methods)
+    def test_columns_match_full_output(self, name):
+        df, all_fields = self._call_with_fake_data_miner(name)
+        assert not df.empty
+        time_columns = ["Time", "Interval Start", "Interval End"]
+        output_columns = [column for column in df.columns if column not in time_columns]
+
+        narrowed = False
+        for column in output_columns:
+            projected, fields = self._call_with_fake_data_miner(
+                name,
+                columns=[column],
+            )
+
+            expected = df[[c for c in df.columns if c in (*time_columns, column)]]
+            pd.testing.assert_frame_equal(
+                projected.reset_index(drop=True),
+                expected.reset_index(drop=True),
+            )
+            assert fields <= all_fields
+            narrowed |= fields < all_fields
+
+        # Asking for a single column requests fewer fields, for some column
+        assert narrowed or len(output_columns) == 1
+
     expected_real_time_as_market_results_cols = [
         "Interval Start",
         "Interval End",
@@ -1,6 +1,8 @@
+import threading
+
 import pandas as pd
 
-from gridstatus.decorators import FiveMinOffset
+from gridstatus.decorators import FiveMinOffset, support_date_range
 
 # todo test other offsets
 
@@ -20,3 +22,24 @@ def test_five_min_offset():
         hours=1,
         minutes=5,
     )
+
+
+def test_support_date_range_max_workers_keeps_date_order():
+    class FakeISO:
+        default_timezone = "US/Central"
+
+        @support_date_range(frequency="DAY_START", max_workers=4)
+        def get_data(self, date, end=None):
+            # the first day only finishes after the last one
+            if date.day == 1:
+                assert last_day_done.wait(timeout=10)
+            elif date.day == 3:
+                last_day_done.set()
+            return pd.DataFrame({"Time": [date]})
+
+    last_day_done = threading.Event()
+    df = FakeISO().get_data(start="2024-01-01", end="2024-01-04")
+
+    assert df["Time"].tolist() == list(
+        pd.date_range("2024-01-01", "2024-01-03", freq="D", tz="US/Central"),
+    )
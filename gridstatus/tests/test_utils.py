@@ -1,6 +1,7 @@
 import io
 import struct
 import zipfile
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -8,6 +9,7 @@ import time_machine
 
 import gridstatus
 from gridstatus.utils import (
+    RateLimiter,
     is_dst_end,
     is_today,
     is_yesterday,
@@ -231,3 +233,27 @@ def test_read_zip_member_with_local_header_fallback_corrupt_data_still_raises():
     zip_file = zipfile.ZipFile(io.BytesIO(bytes(zip_bytes)))
     with pytest.raises(zipfile.BadZipFile):
         read_zip_member_with_local_header_fallback(zip_file, ZIP_MEMBER_NAME)
+
+
+def test_rate_limiter_spaces_requests():
+    with (
+        mock.patch("gridstatus.utils.time.monotonic", return_value=100.0),
+        mock.patch("gridstatus.utils.time.sleep") as mock_sleep,
+    ):
+        limiter = RateLimiter(min_interval_seconds=0.5)
+
+        limiter.wait()
+        mock_sleep.assert_not_called()
+
+        limiter.wait()
+        limiter.wait()
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+        limiter.penalize(10)
+        limiter.wait()
+        assert mock_sleep.call_args.args[0] == 10
+
+        # reserve claims a slot without sleeping
+        assert limiter.next_slot() == 110.5
+        assert limiter.reserve() == 10.5
+        assert limiter.next_slot() == 111.0
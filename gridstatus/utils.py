@@ -2,6 +2,8 @@ import glob
 import io
 import os
 import struct
+import threading
+import time
 from collections.abc import Callable
 from zipfile import BadZipFile, ZipFile
 
@@ -421,3 +423,49 @@ def move_cols_to_front(df: pd.DataFrame, cols_to_move: list[str]) -> pd.DataFram
     for c in cols_to_move:
         cols.remove(c)
     return df[cols_to_move + cols]
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces request starts at least
+    min_interval_seconds apart.
+
+    One instance is shared by every thread of a client, so requests issued
+    concurrently stay within the same rate budget as sequential ones.
+    """
+
+    def __init__(self, min_interval_seconds: float) -> None:
+        self.min_interval_seconds = max(0.0, min_interval_seconds)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self, min_interval_seconds: float | None = None) -> None:
+        """Blocks until the caller is allowed to start a request"""
+        delay = self.reserve(min_interval_seconds)
+        if delay > 0:
+            time.sleep(delay)
+
+    def reserve(self, min_interval_seconds: float | None = None) -> float:
+        """Claims the next slot without blocking and returns how many seconds
+        the caller must wait before starting its request.
+
+        min_interval_seconds overrides how long the next request must wait
+        after this one, for clients whose callers choose their own spacing."""
+        if min_interval_seconds is None:
+            min_interval_seconds = self.min_interval_seconds
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + max(0.0, min_interval_seconds)
+
+        return slot - now
+
+    def next_slot(self) -> float:
+        """The time.monotonic() time at which the next request may start"""
+        with self._lock:
+            return self._next_slot
+
+    def penalize(self, seconds: float) -> None:
+        """Pushes back the next slot for every thread, e.g. after an HTTP 429"""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)